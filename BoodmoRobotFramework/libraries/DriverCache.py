@@ -0,0 +1,253 @@
+"""
+DriverCache.py — Offline WebDriver binary resolution cache
+===========================================================
+Resolves the locally installed browser version and maps it to a driver
+binary stored in a shared cache directory, so browser launch never touches
+the network after the first provisioning.
+
+Cache layout (one entry per browser + major version):
+    <cache_dir>/
+        chrome/126/chromedriver        <- driver binary
+        chrome/126/driver.json         <- metadata + sha256 checksum
+        firefox/128/geckodriver
+        firefox/128/driver.json
+
+Each entry is written atomically (temp file + os.replace), so parallel
+agents sharing the same cache directory never see a half-written driver.
+Every lookup verifies the sha256 checksum before the path is handed out;
+a corrupted entry is discarded and re-provisioned.
+
+Usage in Robot Framework:
+    Library    ${CURDIR}${/}..${/}libraries${/}DriverCache.py    ${DRIVER_CACHE_DIR}
+    ${driver}=    Get Cached Driver Path    ${BROWSER}
+
+Pre-provision from the command line (e.g. Jenkins "Setup Environment"):
+    python libraries/DriverCache.py chrome --cache-dir <dir>
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import stat
+import sys
+import tempfile
+from datetime import datetime
+
+from robot.api import logger
+from robot.api.deco import keyword, library
+
+
+DEFAULT_CACHE_DIR = os.environ.get(
+    "BOODMO_DRIVER_CACHE",
+    os.path.join(os.path.expanduser("~"), ".boodmo", "drivers"),
+)
+
+# SeleniumLibrary browser aliases -> driver kind
+BROWSER_ALIASES = {
+    "chrome": "chrome",
+    "googlechrome": "chrome",
+    "gc": "chrome",
+    "headlesschrome": "chrome",
+    "firefox": "firefox",
+    "ff": "firefox",
+    "headlessfirefox": "firefox",
+    "edge": "edge",
+}
+
+METADATA_FILE = "driver.json"
+
+
+class DriverCacheError(RuntimeError):
+    """Raised when a driver cannot be resolved from cache or provisioned."""
+
+
+def _sha256(path):
+    """Return the hex sha256 digest of a file, read in 1 MB chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _atomic_write_json(path, data):
+    """Write JSON next to the target and move it into place atomically."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as handle:
+        json.dump(data, handle, indent=2)
+    os.replace(tmp_path, path)
+
+
+@library(scope="GLOBAL", auto_keywords=False)
+class DriverCache:
+    """Keyword library that serves WebDriver binaries from a local cache."""
+
+    def __init__(self, cache_dir=None, offline=False):
+        """
+        Args:
+            cache_dir (str): Shared cache root (default: $BOODMO_DRIVER_CACHE
+                             or ~/.boodmo/drivers)
+            offline (bool): Never download; fail if the cache has no match
+        """
+        self.cache_dir = os.path.abspath(cache_dir or DEFAULT_CACHE_DIR)
+        self.offline = str(offline).lower() in ("true", "1", "yes")
+        # Paths already verified in this process: {(kind, major): path}
+        self._verified = {}
+
+    # ============================================================
+    # KEYWORDS
+    # ============================================================
+
+    @keyword("Get Cached Driver Path")
+    def get_cached_driver_path(self, browser="chrome"):
+        """Returns a verified local driver path for the installed ``browser``.
+
+        Resolves the browser version from the OS (no network), looks up
+        ``<cache_dir>/<browser>/<major>`` and verifies its checksum. Only on
+        a cache miss is the driver provisioned via webdriver-manager.
+        """
+        kind = self._driver_kind(browser)
+        version = self.get_installed_browser_version(kind)
+        major = version.split(".")[0]
+
+        cached = self._verified.get((kind, major))
+        if cached and os.path.isfile(cached):
+            return cached
+
+        path = self._lookup(kind, major)
+        if path:
+            logger.info(f"Driver cache hit: {kind} {major} -> {path}")
+        else:
+            if self.offline:
+                raise DriverCacheError(
+                    f"No cached {kind} driver for browser version {version} "
+                    f"in '{self.cache_dir}' and offline mode is enabled"
+                )
+            logger.console(f"Driver cache miss: provisioning {kind} driver for {version}")
+            path = self._provision(kind, major, version)
+
+        self._verified[(kind, major)] = path
+        return path
+
+    @keyword("Get Installed Browser Version")
+    def get_installed_browser_version(self, browser="chrome"):
+        """Returns the locally installed browser version (e.g. ``126.0.6478``)."""
+        from webdriver_manager.core.os_manager import ChromeType, OperationSystemManager
+
+        kind = self._driver_kind(browser)
+        browser_type = {
+            "chrome": ChromeType.GOOGLE,
+            "edge": ChromeType.MSEDGE,
+            "firefox": "firefox",
+        }[kind]
+        version = OperationSystemManager().get_browser_version_from_os(browser_type)
+        if not version:
+            raise DriverCacheError(f"Could not detect installed {kind} browser version")
+        return version
+
+    @keyword("Provision Driver")
+    def provision_driver(self, browser="chrome"):
+        """Downloads (if needed) and caches the driver for ``browser``.
+
+        Intended for a one-off setup step; afterwards ``Get Cached Driver
+        Path`` resolves entirely from local disk.
+        """
+        return self.get_cached_driver_path(browser)
+
+    # ============================================================
+    # CACHE INTERNALS
+    # ============================================================
+
+    @staticmethod
+    def _driver_kind(browser):
+        kind = BROWSER_ALIASES.get(str(browser).lower().replace(" ", ""))
+        if not kind:
+            raise DriverCacheError(f"Unsupported browser for driver cache: '{browser}'")
+        return kind
+
+    def _entry_dir(self, kind, major):
+        return os.path.join(self.cache_dir, kind, str(major))
+
+    def _lookup(self, kind, major):
+        """Return the cached driver path if its checksum matches, else None."""
+        meta_path = os.path.join(self._entry_dir(kind, major), METADATA_FILE)
+        try:
+            with open(meta_path, encoding="utf-8") as handle:
+                meta = json.load(handle)
+        except (OSError, ValueError):
+            return None
+
+        path = os.path.join(self._entry_dir(kind, major), meta.get("binary", ""))
+        if not os.path.isfile(path):
+            return None
+        if os.path.getsize(path) != meta.get("size") or _sha256(path) != meta.get("sha256"):
+            logger.warn(f"Driver cache entry failed integrity check, discarding: {path}")
+            shutil.rmtree(self._entry_dir(kind, major), ignore_errors=True)
+            return None
+        return path
+
+    def _provision(self, kind, major, browser_version):
+        """Download the driver with webdriver-manager and store it in the cache."""
+        source = self._download(kind)
+        entry_dir = self._entry_dir(kind, major)
+        os.makedirs(entry_dir, exist_ok=True)
+
+        binary = os.path.basename(source)
+        target = os.path.join(entry_dir, binary)
+        fd, tmp_path = tempfile.mkstemp(dir=entry_dir, suffix=".tmp")
+        os.close(fd)
+        shutil.copyfile(source, tmp_path)
+        os.chmod(tmp_path, os.stat(tmp_path).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+        os.replace(tmp_path, target)
+
+        _atomic_write_json(os.path.join(entry_dir, METADATA_FILE), {
+            "browser": kind,
+            "browser_version": browser_version,
+            "binary": binary,
+            "size": os.path.getsize(target),
+            "sha256": _sha256(target),
+            "provisioned_at": datetime.now().isoformat(timespec="seconds"),
+        })
+        logger.info(f"Driver cached: {kind} {major} -> {target}")
+        return target
+
+    @staticmethod
+    def _download(kind):
+        if kind == "chrome":
+            from webdriver_manager.chrome import ChromeDriverManager
+            return ChromeDriverManager().install()
+        if kind == "firefox":
+            from webdriver_manager.firefox import GeckoDriverManager
+            return GeckoDriverManager().install()
+        from webdriver_manager.microsoft import EdgeChromiumDriverManager
+        return EdgeChromiumDriverManager().install()
+
+
+# ============================================================
+# COMMAND LINE — pre-provision the shared cache
+# ============================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Provision the shared WebDriver cache.")
+    parser.add_argument("browsers", nargs="*", default=["chrome"],
+                        help="Browsers to provision (default: chrome)")
+    parser.add_argument("--cache-dir", default=None, help="Cache root directory")
+    parser.add_argument("--offline", action="store_true",
+                        help="Only verify existing cache entries, never download")
+    args = parser.parse_args(argv)
+
+    cache = DriverCache(args.cache_dir, offline=args.offline)
+    status = 0
+    for browser in args.browsers:
+        try:
+            print(f"{browser}: {cache.provision_driver(browser)}")
+        except DriverCacheError as error:
+            print(f"{browser}: ERROR {error}", file=sys.stderr)
+            status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
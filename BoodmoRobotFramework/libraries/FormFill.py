@@ -0,0 +1,137 @@
+"""
+FormFill.py — Fill several Angular form controls in one script call
+====================================================================
+Typing with ``Press Keys`` sends one WebDriver command per key, and
+``Wait And Input Text`` costs a wait, a click, a clear and a type per field.
+A five-field form adds up to dozens of round trips.
+
+``Fill Form Fields`` sets all given controls in a single injected script.
+For each control it does what ``JS Input Text`` does for one field: it
+calls the native value setter (so Angular's value accessor does not miss
+the change) and dispatches ``input``, ``change`` and ``blur``. In the same
+call, after Angular has run change detection, it reads every control back:
+
+    value      the element's value must equal the requested one
+    ng-dirty   an Angular-bound control (ng-* classes) must be dirty, i.e.
+               the reactive form model registered the input
+    model      development builds expose the FormControl (``ng`` debug API),
+               its value must equal the requested one too
+
+All problems are reported together. Locators are resolved in the browser
+with the same strategies as the locator pre-flight (LocatorHealth.py);
+WebElements are passed through as they are.
+
+Usage in Robot Framework:
+    Fill Form Fields    ${SIGNUP_NAME_INPUT}    ${name}    ${SIGNUP_EMAIL_INPUT}    ${email}
+"""
+
+from robot.api import logger
+from robot.api.deco import keyword, library
+from robot.libraries.BuiltIn import BuiltIn
+from selenium.webdriver.remote.webelement import WebElement
+
+from LocatorHealth import FIND_SCRIPT, parse_locator
+
+
+# arguments: [[strategy, selector or element, value], ...], callback
+FILL_SCRIPT = FIND_SCRIPT + """
+var fields = arguments[0], done = arguments[arguments.length - 1];
+function valueSetter(element) {
+    var proto = Object.getPrototypeOf(element);
+    while (proto && !Object.getOwnPropertyDescriptor(proto, 'value')) {
+        proto = Object.getPrototypeOf(proto);
+    }
+    return proto ? Object.getOwnPropertyDescriptor(proto, 'value').set : null;
+}
+function formModel(element) {
+    // Only development builds expose the global ng debug API
+    if (!window.ng || !window.ng.getDirectives) return undefined;
+    var control = window.ng.getDirectives(element).map(function (directive) {
+        return directive && directive.control;
+    }).filter(function (control) { return control && 'value' in control; })[0];
+    return control ? control.value : undefined;
+}
+var elements = fields.map(function (field) {
+    var element = field[0] === 'element' ? field[1] : (find(field[0], field[1]) || [])[0];
+    if (!element) return null;
+    var setter = valueSetter(element);
+    element.focus();
+    if (setter) { setter.call(element, field[2]); } else { element.value = field[2]; }
+    element.dispatchEvent(new Event('input', {bubbles: true}));
+    element.dispatchEvent(new Event('change', {bubbles: true}));
+    element.dispatchEvent(new Event('blur'));
+    return element;
+});
+// Read back after Angular's change detection has updated the ng-* classes
+setTimeout(function () {
+    done(elements.map(function (element) {
+        if (!element) return {found: false};
+        var model = formModel(element);
+        return {
+            found: true,
+            secret: element.type === 'password',
+            value: element.value,
+            bound: /(^|\\s)ng-/.test(element.className),
+            dirty: element.classList.contains('ng-dirty'),
+            model: model === undefined || model === null ? null : String(model),
+            hasModel: model !== undefined
+        };
+    }));
+}, 0);
+"""
+
+
+def check_field(locator, expected, state):
+    """Return a problem description for one filled control, or None."""
+    if not state["found"]:
+        return f"'{locator}': element not found"
+    # Password values are never written to the log
+    shown = (lambda value: "***") if state["secret"] else (lambda value: f"'{value}'")
+    if state["value"] != expected:
+        return f"'{locator}': value is {shown(state['value'])}, expected {shown(expected)}"
+    if state["bound"] and not state["dirty"]:
+        return f"'{locator}': Angular did not register the input (control is not ng-dirty)"
+    if state["hasModel"] and (state["model"] or "") != expected:
+        return f"'{locator}': form model value is {shown(state['model'])}, expected {shown(expected)}"
+    return None
+
+
+@library(scope="GLOBAL", auto_keywords=False)
+class FormFill:
+    """Keyword library for filling Angular reactive forms in one round trip."""
+
+    # ============================================================
+    # KEYWORDS
+    # ============================================================
+
+    @keyword("Fill Form Fields")
+    def fill_form_fields(self, *locators_and_values):
+        """Sets each ``locator`` to the ``value`` following it, all in one
+        script call, and verifies the element values and the Angular form
+        model. Fails with every control that did not take its value.
+
+        Text inputs, textareas and selects are supported; values are strings.
+        """
+        if not locators_and_values or len(locators_and_values) % 2:
+            raise ValueError("Fill Form Fields expects locator and value pairs, "
+                             f"got {len(locators_and_values)} argument(s).")
+        pairs = list(zip(locators_and_values[::2], locators_and_values[1::2]))
+        fields = []
+        for locator, value in pairs:
+            if isinstance(locator, WebElement):
+                fields.append(["element", locator, str(value)])
+            else:
+                strategy, selector = parse_locator(locator) or ("identifier", locator)
+                fields.append([strategy, selector, str(value)])
+
+        driver = BuiltIn().get_library_instance("SeleniumLibrary").driver
+        states = driver.execute_async_script(FILL_SCRIPT, fields)
+        problems = []
+        for (locator, value), state in zip(pairs, states):
+            problem = check_field(locator, str(value), state)
+            if problem:
+                problems.append(problem)
+        if problems:
+            raise AssertionError(f"{len(problems)} of {len(pairs)} form field(s) not filled:\n"
+                                 + "\n".join(f"- {problem}" for problem in problems))
+        logger.info(f"Filled {len(pairs)} form field(s) in one script call")
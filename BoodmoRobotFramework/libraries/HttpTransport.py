@@ -0,0 +1,244 @@
+"""
+HttpTransport.py — Process-wide pooled HTTP transport for API suites
+=====================================================================
+Every API suite creates its own RequestsLibrary session in Suite Setup and
+deletes it in Suite Teardown, which throws away the open connections and
+makes the next suite pay fresh TCP + TLS handshakes to API_BASE_URL.
+
+This library keeps ONE connection pool per process. Suite-level session
+aliases attach to it, and ``Delete All Sessions`` leaves it open, so
+keep-alive connections are reused across the suites of one robot process.
+tools/orchestrate.py runs every suite file in its own process, so there
+the pool lives as long as one suite.
+
+Tunables (Library arguments):
+    pool_connections  number of per-host pools kept
+    pool_maxsize      connections kept per host
+    keep_alive        enable TCP keep-alive probes on pooled sockets
+
+Reporting: every new connection's connect + TLS handshake time is measured.
+``Log Transport Statistics`` reports the connection reuse ratio and the
+estimated handshake time saved, and writes http_transport.json to the
+output directory. Request observers (``add_request_observer``) see every
+request with its timing, e.g. for the trace spans of listeners/Tracing.py.
+Response observers (``add_response_observer``) see every response of an
+attached session with ``response.elapsed`` set (listeners/Metrics.py).
+
+NOTE: requests/urllib3 speak HTTP/1.1 only and do not expose TLS session
+resumption, so neither is offered here. Reusing pooled connections avoids
+the handshake altogether, which is where the bulk of the saving is.
+
+Usage in Robot Framework:
+    Create Session    ${API_SESSION_ALIAS}    ${API_BASE_URL}    max_retries=0
+    Attach Shared Transport    ${API_SESSION_ALIAS}
+"""
+
+import atexit
+import json
+import os
+import socket
+import threading
+import time
+
+from requests.adapters import HTTPAdapter
+from robot.api import logger
+from robot.api.deco import keyword, library
+from robot.libraries.BuiltIn import BuiltIn
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+REPORT_FILE = "http_transport.json"
+
+
+class TransportStats:
+    """Process-wide request and connection counters."""
+
+    def __init__(self):
+        self.requests = 0
+        self.connections = 0
+        self.connect_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def record_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def record_connect(self, seconds):
+        with self._lock:
+            self.connections += 1
+            self.connect_seconds += seconds
+
+    def summary(self):
+        reused = max(self.requests - self.connections, 0)
+        avg_connect = self.connect_seconds / self.connections if self.connections else 0.0
+        return {
+            "requests": self.requests,
+            "connections_opened": self.connections,
+            "connections_reused": reused,
+            "reuse_ratio": round(reused / self.requests, 3) if self.requests else 0.0,
+            "avg_handshake_seconds": round(avg_connect, 4),
+            "handshake_seconds_spent": round(self.connect_seconds, 3),
+            "handshake_seconds_saved": round(avg_connect * reused, 3),
+        }
+
+
+_STATS = TransportStats()
+_OBSERVERS = []
+_RESPONSE_OBSERVERS = []
+
+
+def add_request_observer(callback):
+    """Call ``callback(request, response, error, started_ns, ended_ns)`` after
+    every request sent through the shared adapter, from the sending thread."""
+    _OBSERVERS.append(callback)
+
+
+def add_response_observer(callback):
+    """Call ``callback(response)`` for every response of an attached session,
+    once requests has set ``response.elapsed`` (retries included)."""
+    _RESPONSE_OBSERVERS.append(callback)
+
+
+def _notify_response(response, *args, **kwargs):
+    # requests response hook: returning None keeps the response as it is
+    for observer in _RESPONSE_OBSERVERS:
+        observer(response)
+
+
+# ============================================================
+# TIMED CONNECTIONS — measure TCP connect + TLS handshake
+# ============================================================
+
+class TimedHTTPConnection(HTTPConnection):
+    def connect(self):
+        start = time.perf_counter()
+        super().connect()
+        _STATS.record_connect(time.perf_counter() - start)
+
+
+class TimedHTTPSConnection(HTTPSConnection):
+    def connect(self):
+        start = time.perf_counter()
+        super().connect()
+        _STATS.record_connect(time.perf_counter() - start)
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class SharedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose pool outlives the sessions it is mounted on."""
+
+    def __init__(self, keep_alive=True, **kwargs):
+        self.keep_alive = keep_alive
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        if self.keep_alive:
+            pool_kwargs.setdefault("socket_options", HTTPConnection.default_socket_options + [
+                (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+            ])
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": TimedHTTPConnectionPool,
+            "https": TimedHTTPSConnectionPool,
+        }
+
+    def send(self, request, **kwargs):
+        _STATS.record_request()
+        if not _OBSERVERS:
+            return super().send(request, **kwargs)
+        started = time.time_ns()
+        response = error = None
+        try:
+            response = super().send(request, **kwargs)
+            return response
+        except Exception as exc:
+            error = exc
+            raise
+        finally:
+            ended = time.time_ns()
+            for observer in _OBSERVERS:
+                observer(request, response, error, started, ended)
+
+    def close(self):
+        # Called by Session.close() / Delete All Sessions: keep the pool alive
+        pass
+
+    def shutdown(self):
+        super().close()
+
+
+_ADAPTER = None
+_ADAPTER_LOCK = threading.Lock()
+
+
+def shared_adapter(pool_connections, pool_maxsize, keep_alive):
+    """Return the process-wide adapter, creating it on first use."""
+    global _ADAPTER
+    with _ADAPTER_LOCK:
+        if _ADAPTER is None:
+            _ADAPTER = SharedHTTPAdapter(keep_alive=keep_alive,
+                                         pool_connections=pool_connections,
+                                         pool_maxsize=pool_maxsize)
+            atexit.register(_ADAPTER.shutdown)
+        return _ADAPTER
+
+
+@library(scope="GLOBAL", auto_keywords=False)
+class HttpTransport:
+    """Keyword library that attaches sessions to the shared connection pool."""
+
+    def __init__(self, pool_connections=4, pool_maxsize=10, keep_alive=True):
+        """
+        Args:
+            pool_connections (int): Number of per-host pools to keep
+            pool_maxsize (int): Connections kept per host
+            keep_alive (bool): Enable TCP keep-alive on pooled sockets
+        """
+        self.pool_connections = int(pool_connections)
+        self.pool_maxsize = int(pool_maxsize)
+        self.keep_alive = str(keep_alive).lower() in ("true", "1", "yes")
+
+    # ============================================================
+    # KEYWORDS
+    # ============================================================
+
+    @keyword("Attach Shared Transport")
+    def attach_shared_transport(self, alias):
+        """Mounts the process-wide pooled adapter on RequestsLibrary session ``alias``."""
+        session = BuiltIn().get_library_instance("RequestsLibrary")._cache.switch(alias)
+        adapter = shared_adapter(self.pool_connections, self.pool_maxsize, self.keep_alive)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        if _notify_response not in session.hooks["response"]:
+            session.hooks["response"].append(_notify_response)
+        logger.info(f"Session '{alias}' attached to shared transport "
+                    f"(pools={self.pool_connections}, maxsize={self.pool_maxsize}, "
+                    f"keep_alive={self.keep_alive})")
+
+    @keyword("Get Transport Statistics")
+    def get_transport_statistics(self):
+        """Returns process-wide request/connection counters as a dictionary."""
+        return _STATS.summary()
+
+    @keyword("Log Transport Statistics")
+    def log_transport_statistics(self):
+        """Logs connection reuse and handshake time saved so far in this run,
+        and writes them to ``http_transport.json`` in the output directory."""
+        stats = _STATS.summary()
+        logger.info(f"HTTP transport: {stats['requests']} request(s) over "
+                    f"{stats['connections_opened']} connection(s), reuse ratio "
+                    f"{stats['reuse_ratio']:.0%}, handshake time saved ~"
+                    f"{stats['handshake_seconds_saved']}s", also_console=True)
+        output_dir = BuiltIn().get_variable_value("${OUTPUT DIR}")
+        if output_dir:
+            with open(os.path.join(output_dir, REPORT_FILE), "w", encoding="utf-8") as handle:
+                json.dump(stats, handle, indent=2)
+        return stats
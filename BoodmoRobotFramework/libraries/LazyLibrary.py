@@ -0,0 +1,209 @@
+"""
+LazyLibrary.py — Defer importing a keyword library until its first keyword call
+================================================================================
+Every suite imports its libraries at startup, also the ones it never or
+rarely calls. This proxy stands in for a (static, Python) library: it
+offers the same keywords from a cached manifest and imports the real
+library only when one of them is run for the first time. A suite that
+never calls it never pays its import and initialization.
+
+The manifest (keyword names, arguments, documentation and the measured
+import cost) is built once per library arguments, source file and Robot
+Framework version, and cached under
+``$BOODMO_LAZY_CACHE`` or ``~/.boodmo/lazy``.
+Arguments are converted with the real library's argument types on each
+call, so keywords behave exactly as without the proxy.
+
+Not for libraries with a listener (e.g. SeleniumLibrary) or the dynamic
+library API, and not for libraries whose instance other libraries look
+up with ``Get Library Instance``: the manifest build refuses the first
+two, and the lookup would return the proxy.
+
+Startup time saved: every proxy records the import cost it deferred and
+its own creation cost, and listeners/ImportProfile.py reports the
+difference per suite.
+
+Usage in Robot Framework (give the real name as alias, so qualified
+keyword names keep working):
+    Library    ${CURDIR}${/}..${/}libraries${/}LazyLibrary.py    JSONLibrary    AS    JSONLibrary
+"""
+
+import hashlib
+import importlib.util
+import json
+import os
+import tempfile
+import time
+
+import robot.version
+from robot.api import logger
+from robot.running.librarykeyword import StaticKeyword
+from robot.running.testlibraries import TestLibrary
+
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".boodmo", "lazy")
+MANIFEST_VERSION = 1
+
+# Every proxy of this process, for the startup report
+PROXIES = []
+
+
+def argument_spec(spec):
+    """Robot's dynamic API argument list for a real ArgumentSpec. Defaults
+    that JSON cannot hold are kept as their repr (only used for display,
+    the real default applies when an argument is not given)."""
+    def default(name):
+        value = spec.defaults[name]
+        return value if isinstance(value, (str, int, float, bool, type(None))) else repr(value)
+
+    def with_default(name):
+        return [name, default(name)] if name in spec.defaults else [name]
+
+    args = [with_default(name) for name in spec.positional_only]
+    if spec.positional_only:
+        args.append(["/"])
+    args += [with_default(name) for name in spec.positional_or_named]
+    if spec.var_positional:
+        args.append([f"*{spec.var_positional}"])
+    elif spec.named_only:
+        args.append(["*"])
+    args += [with_default(name) for name in spec.named_only]
+    if spec.var_named:
+        args.append([f"**{spec.var_named}"])
+    return args
+
+
+def build_manifest(name, args):
+    """Import the real library once and describe its keywords."""
+    started = time.perf_counter()
+    library = TestLibrary.from_name(name, args=args)
+    seconds = time.perf_counter() - started
+    if library.listeners:
+        raise RuntimeError(f"Library '{name}' has a listener and cannot be loaded lazily.")
+    if not all(isinstance(keyword, StaticKeyword) for keyword in library.keywords):
+        raise RuntimeError(f"Library '{name}' uses the dynamic API and cannot be loaded lazily.")
+    return {
+        "version": MANIFEST_VERSION,
+        "library": library.name,
+        "library_version": library.version,
+        "doc": library.doc,
+        "import_seconds": round(seconds, 4),
+        "keywords": {keyword.name: {"args": argument_spec(keyword.args), "doc": keyword.doc}
+                     for keyword in library.keywords},
+    }
+
+
+def library_source(name):
+    """The file a library name or path resolves to, without importing it."""
+    if os.path.isfile(name):
+        return os.path.abspath(name)
+    try:
+        spec = importlib.util.find_spec(name.split(".")[0])
+    except (ImportError, ValueError):
+        return None
+    return spec.origin if spec and spec.origin and os.path.isfile(spec.origin) else None
+
+
+def manifest_key(name, args):
+    """Cache key: library name and arguments, the library's source file
+    (path, mtime and size) and the Robot Framework version, so an upgrade of
+    either builds a new manifest. Not the distribution version: looking it
+    up scans every installed distribution, and reinstalling rewrites the
+    source file anyway."""
+    source = library_source(name)
+    stamp = ""
+    if source:
+        stat = os.stat(source)
+        stamp = f"{source}:{stat.st_mtime_ns}:{stat.st_size}"
+    raw = json.dumps([MANIFEST_VERSION, name, list(args), stamp, robot.version.get_version()])
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+class LazyLibrary:
+    """Proxy library that imports the real library on its first keyword call."""
+
+    ROBOT_LIBRARY_SCOPE = "GLOBAL"
+
+    def __init__(self, library, *args):
+        """
+        Args:
+            library (str): Real library name or path
+            *args: Arguments of the real library
+        """
+        started = time.perf_counter()
+        self.library = library
+        self.args = args
+        self.cache_dir = os.environ.get("BOODMO_LAZY_CACHE") or DEFAULT_CACHE_DIR
+        self.manifest = self._load_manifest()
+        self.loaded = False
+        self.load_seconds = None
+        self._real = None
+        self._keywords = None
+        self.init_seconds = time.perf_counter() - started
+        PROXIES.append(self)
+
+    # ============================================================
+    # DYNAMIC LIBRARY API
+    # ============================================================
+
+    def get_keyword_names(self):
+        return list(self.manifest["keywords"])
+
+    def get_keyword_arguments(self, name):
+        return [tuple(arg) if len(arg) == 2 else arg[0] for arg in self.manifest["keywords"][name]["args"]]
+
+    def get_keyword_documentation(self, name):
+        if name == "__intro__":
+            return self.manifest["doc"]
+        if name == "__init__":
+            return ""
+        return self.manifest["keywords"][name]["doc"]
+
+    def run_keyword(self, name, args, kwargs):
+        keywords = self._real_keywords()
+        if name not in keywords:
+            raise RuntimeError(f"Keyword '{name}' is in the cached manifest {self.manifest_path} "
+                               f"but not in library '{self.library}'. Delete the manifest to rebuild it.")
+        keyword = keywords[name]
+        positional, named = keyword.args.convert(list(args), list(kwargs.items()))
+        return keyword.method(*positional, **dict(named))
+
+    # ============================================================
+    # INTERNALS
+    # ============================================================
+
+    @property
+    def deferred_seconds(self):
+        """Import cost measured when the manifest was built."""
+        return self.manifest["import_seconds"]
+
+    @property
+    def saved_seconds(self):
+        """Deferred import cost minus what the proxy itself cost to create."""
+        return self.deferred_seconds - self.init_seconds
+
+    def _load_manifest(self):
+        path = self.manifest_path = os.path.join(self.cache_dir, f"{manifest_key(self.library, self.args)}.json")
+        if os.path.isfile(path):
+            with open(path, encoding="utf-8") as handle:
+                return json.load(handle)
+        manifest = build_manifest(self.library, self.args)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(manifest, handle, indent=2)
+        os.replace(tmp_path, path)
+        logger.info(f"Lazy library manifest for '{self.library}' built: "
+                    f"{len(manifest['keywords'])} keywords, import cost {manifest['import_seconds']}s")
+        return manifest
+
+    def _real_keywords(self):
+        if self._keywords is None:
+            started = time.perf_counter()
+            self._real = TestLibrary.from_name(self.library, args=self.args)
+            self._keywords = {keyword.name: keyword for keyword in self._real.keywords}
+            self.loaded = True
+            self.load_seconds = time.perf_counter() - started
+            logger.info(f"Lazy library '{self.library}' loaded on first use in "
+                        f"{self.load_seconds:.3f}s")
+        return self._keywords
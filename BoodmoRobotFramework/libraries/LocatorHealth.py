@@ -0,0 +1,514 @@
+"""
+LocatorHealth.py — Pre-flight check of all locators, one script per page
+=========================================================================
+A Boodmo frontend release often breaks many locators in locators.robot at
+once. Every test that uses a broken locator then waits the full
+``${TIMEOUT}`` (or implicit wait) before failing, and the run crawls.
+
+This library loads each key page once and evaluates every locator of that
+page in a single asynchronous script call. The script polls for up to
+``settle`` seconds until the page is complete and every required locator
+matches, so Angular components that render late are not reported missing.
+Each locator is reported as:
+
+    present      exactly one match (or any matches for a collection, e.g. *_LINKS)
+    missing      no match on its page
+    ambiguous    several matches for a single-element locator (first one is used)
+    invalid      the selector itself is broken
+    unchecked    no fixed page (e.g. PDP_*), the page redirected, or unsupported strategy
+
+Locators that only exist after an interaction or in a given state (error
+messages, login step 2, cart lines, ...) are marked ``conditional``: they are
+reported, but a missing conditional locator is not treated as broken.
+
+Skip mode: the library is also a listener. With ``mode=skip`` every test
+that uses a broken locator, directly or through any user keyword, is
+skipped at once with the broken locators in its message. Dependencies are
+found statically from the test body and the keywords in resources/.
+
+The report is written to JSON and can be shared: suites running in
+separate processes (tools/orchestrate.py) reuse a report younger than
+``max_age`` instead of scanning again. Skip mode ignores a report file
+older than ``max_age`` too, so a report of an earlier run never skips
+today's tests.
+
+Usage in Robot Framework:
+    Library    ${CURDIR}${/}..${/}libraries${/}LocatorHealth.py    ${LOCATOR_HEALTH_REPORT}    skip    10 minutes
+    ${broken}=    Check Locator Health    max_age=10 minutes
+
+Pre-flight from the command line (exits with 1 when a locator is broken):
+    python libraries/LocatorHealth.py --environment qa --report results/locator_health.json
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+from collections import OrderedDict
+from datetime import datetime
+from urllib.parse import urlparse
+
+from robot.api import logger
+from robot.api.deco import keyword, library
+from robot.libraries.BuiltIn import BuiltIn
+from robot.running import ResourceFileBuilder
+from robot.utils import normalize, timestr_to_secs
+
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LOCATORS_FILE = os.path.join(PROJECT_DIR, "resources", "locators", "locators.robot")
+RESOURCES_DIR = os.path.join(PROJECT_DIR, "resources")
+DEFAULT_REPORT = "locator_health.json"
+SKIP_TAG = "robot:skip"
+
+# Page -> (URL variable, path appended to it, locator name prefixes)
+PAGES = OrderedDict([
+    ("home", ("BASE_URL", "", ("HOME_",))),
+    ("login", ("LOGIN_URL", "", ("LOGIN_",))),
+    ("signup", ("SIGNUP_URL", "", ("SIGNUP_",))),
+    ("catalog", ("CATALOG_URL", "3403-maintenance_service_parts/", ("SEARCH_", "FILTER_", "SORT_"))),
+    ("cart", ("CART_URL", "", ("CART_",))),
+    ("checkout", ("CHECKOUT_URL", "", ("CHECKOUT_",))),
+])
+
+# Only rendered after an interaction or in a given state, or only
+# meaningful inside a row (search result and cart line fields)
+CONDITIONAL = re.compile(
+    r"_(ERROR|SUCCESS|EMPTY)_MSG$|NO_RESULTS|AUTOCOMPLETE|OUT_OF_STOCK|OVERLAY"
+    r"|^LOGIN_(PASSWORD_INPUT|SUBMIT_BTN|SHOW_PWD_TOGGLE|SUCCESS_INDICATOR)$"
+    r"|^CART_(ITEM|LINE|REMOVE|TOTAL|SHIPPING|PROCEED)"
+    r"|^SEARCH_RESULT_(NAME|PRICE|PART_NUMBER)$"
+)
+# Locators that are expected to match several elements
+COLLECTION = re.compile(r"_(LINKS|ITEMS|OPTIONS|LIST)$")
+
+STRATEGIES = ("css", "xpath", "id", "name", "identifier", "class", "tag", "link", "partial link")
+BROKEN = ("missing", "invalid")
+
+# find(strategy, value) -> matching elements, for the strategies of
+# parse_locator; shared with FormFill.py
+FIND_SCRIPT = """
+function byAttribute(name, value) {
+    return document.querySelectorAll('[' + name + '="' + CSS.escape(value) + '"]');
+}
+function byLinkText(value, partial) {
+    return Array.prototype.filter.call(document.links, function (link) {
+        var text = (link.innerText || '').trim();
+        return partial ? text.indexOf(value) !== -1 : text === value;
+    });
+}
+function byXPath(value) {
+    var snapshot = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    var elements = [];
+    for (var i = 0; i < snapshot.snapshotLength; i++) elements.push(snapshot.snapshotItem(i));
+    return elements;
+}
+function find(strategy, value) {
+    switch (strategy) {
+        case 'css': return document.querySelectorAll(value);
+        case 'xpath': return byXPath(value);
+        case 'id': return byAttribute('id', value);
+        case 'name': return byAttribute('name', value);
+        case 'identifier': return Array.from(byAttribute('id', value))
+            .concat(Array.from(byAttribute('name', value)));
+        case 'class': return document.getElementsByClassName(value);
+        case 'tag': return document.getElementsByTagName(value);
+        case 'link': return byLinkText(value, false);
+        case 'partial link': return byLinkText(value, true);
+    }
+    return null;
+}
+"""
+
+# arguments: [[name, strategy, value, required], ...], settle ms, callback
+SCAN_SCRIPT = FIND_SCRIPT + """
+var specs = arguments[0], deadline = Date.now() + arguments[1];
+var done = arguments[arguments.length - 1];
+function scan() {
+    return specs.map(function (spec) {
+        try {
+            var elements = find(spec[1], spec[2]);
+            return elements === null ? null : elements.length;
+        } catch (e) {
+            return -1;
+        }
+    });
+}
+(function poll() {
+    var counts = scan();
+    var waiting = document.readyState !== 'complete' || specs.some(function (spec, i) {
+        return spec[3] && counts[i] === 0;
+    });
+    if (waiting && Date.now() < deadline) {
+        setTimeout(poll, 100);
+    } else {
+        done({url: location.href, counts: counts});
+    }
+})();
+"""
+
+
+def parse_locator(value):
+    """(strategy, selector) the way SeleniumLibrary reads it, or None when
+    the value has no explicit strategy (e.g. ``HOME_PAGE_TITLE``)."""
+    if value.startswith(("//", "(//")):
+        return "xpath", value
+    match = re.match(r"^(\w+(?: \w+)?)\s*[:=]\s*(.+)$", value, re.DOTALL)
+    if match and match.group(1).lower() in STRATEGIES:
+        return match.group(1).lower(), match.group(2)
+    return None
+
+
+def load_locators(path=LOCATORS_FILE):
+    """{NAME: (locator, strategy, selector)} for every locator variable."""
+    locators = OrderedDict()
+    for variable in ResourceFileBuilder().build(path).variables:
+        value = " ".join(variable.value)
+        parsed = parse_locator(value)
+        if parsed:
+            locators[variable.name[2:-1]] = (value,) + parsed
+    return locators
+
+
+def page_of(name):
+    return next((page for page, (_, _, prefixes) in PAGES.items()
+                 if name.startswith(prefixes)), None)
+
+
+def classify(name, count):
+    if count is None:
+        return "unchecked"
+    if count < 0:
+        return "invalid"
+    if count == 0:
+        return "missing"
+    if count > 1 and not COLLECTION.search(name):
+        return "ambiguous"
+    return "present"
+
+
+def scan(driver, urls, locators, pages=None, settle=5.0):
+    """Load each page once and evaluate all of its locators in one script.
+
+    Args:
+        driver: Selenium WebDriver
+        urls (dict): URL variable name -> value (e.g. {"BASE_URL": ...})
+        locators (dict): Result of ``load_locators``
+        pages (list): Page names to scan (default: all of ``PAGES``)
+        settle (float): Seconds the script waits for required locators
+
+    Returns:
+        The report dictionary (pages, locators, broken).
+    """
+    entries = OrderedDict(
+        (name, {"page": page_of(name), "locator": value, "status": "unchecked", "count": None,
+                "conditional": bool(CONDITIONAL.search(name))})
+        for name, (value, _, _) in locators.items()
+    )
+    page_results = []
+    for page in pages or PAGES:
+        url_variable, path, _ = PAGES[page]
+        names = [name for name, entry in entries.items() if entry["page"] == page]
+        if not names or not urls.get(url_variable):
+            continue
+        url = urls[url_variable] + path
+        specs = [[name, locators[name][1], locators[name][2], not entries[name]["conditional"]]
+                 for name in names]
+        started = time.monotonic()
+        try:
+            driver.get(url)
+            result = driver.execute_async_script(SCAN_SCRIPT, specs, int(settle * 1000))
+        except Exception as error:
+            page_results.append({"page": page, "url": url, "status": "error",
+                                 "error": f"{type(error).__name__}: {error}"})
+            continue
+        seconds = round(time.monotonic() - started, 3)
+        # e.g. checkout without a session redirects to the login page
+        if not urlparse(result["url"]).path.startswith(urlparse(url).path):
+            page_results.append({"page": page, "url": url, "final_url": result["url"],
+                                 "status": "redirected", "seconds": seconds})
+            continue
+        for name, count in zip(names, result["counts"]):
+            entries[name].update(count=count, status=classify(name, count))
+        page_results.append({"page": page, "url": url, "status": "ok", "seconds": seconds})
+
+    return {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "pages": page_results,
+        "locators": entries,
+        "broken": [name for name, entry in entries.items()
+                   if entry["status"] in BROKEN and not entry["conditional"]],
+    }
+
+
+def _atomic_write_json(path, data):
+    """Write JSON next to the target and move it into place atomically."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as handle:
+        json.dump(data, handle, indent=2)
+    os.replace(tmp_path, path)
+
+
+def format_report(report):
+    lines = [f"{'Page':<10}{'Status':<12}{'Seconds':>8}  URL"]
+    for page in report["pages"]:
+        lines.append(f"{page['page']:<10}{page['status']:<12}{page.get('seconds', ''):>8}  "
+                     f"{page.get('final_url', page['url'])}")
+    counts = {}
+    for entry in report["locators"].values():
+        counts[entry["status"]] = counts.get(entry["status"], 0) + 1
+    lines.append("Locators: " + ", ".join(f"{count} {status}" for status, count in sorted(counts.items())))
+    for name, entry in report["locators"].items():
+        if entry["status"] in BROKEN + ("ambiguous",):
+            note = f" ({entry['count']} matches)" if entry["status"] == "ambiguous" else ""
+            note += " (conditional)" if entry["conditional"] else ""
+            lines.append(f"  {entry['status']:<10}{name} = {entry['locator']}{note}")
+    return "\n".join(lines)
+
+
+# ============================================================
+# TEST DEPENDENCIES
+# ============================================================
+
+class LocatorUsage:
+    """Which locator variables a test uses, through all user keywords it calls."""
+
+    VARIABLE = re.compile(r"\$\{([A-Za-z0-9_]+)\}")
+
+    def __init__(self, names, resources_dir=RESOURCES_DIR):
+        self.names = set(names)
+        self.keywords = {}
+        for folder, _, files in os.walk(resources_dir):
+            for file_name in files:
+                if file_name.endswith(".robot"):
+                    for kw in ResourceFileBuilder().build(os.path.join(folder, file_name)).keywords:
+                        self.keywords[normalize(kw.name, ignore="_")] = kw
+        self._memo = {}
+
+    def for_test(self, test):
+        """Locator names used by ``test`` (running model), its setup and teardown."""
+        local = {normalize(kw.name, ignore="_"): kw for kw in test.parent.resource.keywords}
+        items = [test.setup, *test.body, test.teardown]
+        return self._walk(items, local, set())
+
+    def _walk(self, items, local, active):
+        used = set()
+        for item in items:
+            if not item:
+                continue
+            for text in self._strings(item):
+                used.update(name for name in self.VARIABLE.findall(text) if name in self.names)
+                key = normalize(text, ignore="_")
+                if key in local or key in self.keywords:
+                    used |= self._keyword(key, local, active)
+            used |= self._walk(getattr(item, "body", ()), local, active)
+        return used
+
+    def _keyword(self, key, local, active):
+        if key in local:
+            return self._walk([local[key].setup, *local[key].body, local[key].teardown], local,
+                              active | {key})
+        if key not in self._memo:
+            if key in active:
+                return set()
+            kw = self.keywords[key]
+            self._memo[key] = self._walk([kw.setup, *kw.body, kw.teardown], {}, active | {key})
+        return self._memo[key]
+
+    @staticmethod
+    def _strings(item):
+        for attribute in ("name", "args", "values", "value", "condition"):
+            value = getattr(item, attribute, None)
+            if isinstance(value, str):
+                yield value
+            elif isinstance(value, (tuple, list)):
+                yield from (v for v in value if isinstance(v, str))
+
+
+@library(scope="GLOBAL", auto_keywords=False)
+class LocatorHealth:
+    """Keyword library and listener for the locator pre-flight check."""
+
+    ROBOT_LISTENER_API_VERSION = 3
+
+    def __init__(self, report=None, mode="report", max_age="10 minutes"):
+        """
+        Args:
+            report (str): Report JSON, shared between processes
+                          (default: locator_health.json in the output dir)
+            mode (str): ``report`` only reports, ``skip`` also skips tests
+                        that use a broken locator
+            max_age (str): Ignore report files older than this
+        """
+        self.report_path = report or None
+        self.skip = str(mode).lower() == "skip"
+        self.max_age = timestr_to_secs(max_age)
+        self.ROBOT_LIBRARY_LISTENER = self
+        self._report = None
+        self._report_mtime = None
+        self._usage = None
+        self._skipped = {}
+
+    # ============================================================
+    # KEYWORDS
+    # ============================================================
+
+    @keyword("Check Locator Health")
+    def check_locator_health(self, pages=None, settle="5s", max_age=None):
+        """Scans the locators of each page in the open browser and writes the report.
+
+        A report younger than ``max_age`` (e.g. written by another suite of
+        the same run) is reused without scanning. The browser is returned to
+        its current URL afterwards. Returns the list of broken locator names;
+        does not fail, use ``mode=skip`` to skip the tests that need them.
+
+        Args:
+            pages (str): Comma separated page names (default: all)
+            settle (str): How long each page may take to render its locators
+            max_age (str): Reuse a report younger than this, 0 to always scan
+                           (default: the library's ``max_age``)
+        """
+        path = self._path()
+        max_age = self.max_age if max_age is None else timestr_to_secs(max_age)
+        if os.path.isfile(path) and time.time() - os.path.getmtime(path) < max_age:
+            report = self._load(path)
+            logger.info(f"Reusing locator health report {path} from {report['created']}")
+        else:
+            builtin = BuiltIn()
+            urls = {variable: builtin.get_variable_value(f"${{{variable}}}")
+                    for variable, _, _ in PAGES.values()}
+            driver = builtin.get_library_instance("SeleniumLibrary").driver
+            current = driver.current_url
+            selected = [page.strip() for page in pages.split(",")] if pages else None
+            try:
+                report = scan(driver, urls, load_locators(), selected, timestr_to_secs(settle))
+            finally:
+                driver.get(current)
+            _atomic_write_json(path, report)
+            self._report, self._report_mtime = report, os.path.getmtime(path)
+        logger.info(format_report(report), also_console=False)
+        if report["broken"]:
+            logger.warn(f"Locator pre-flight: {len(report['broken'])} broken locator(s): "
+                        f"{', '.join(report['broken'])}")
+        return report["broken"]
+
+    # ============================================================
+    # LISTENER — skip mode
+    # ============================================================
+
+    def start_test(self, data, result):
+        if not self.skip:
+            return
+        report = self._current_report()
+        if not report or not report["broken"]:
+            return
+        if self._usage is None:
+            self._usage = LocatorUsage(report["locators"])
+        broken = sorted(self._usage.for_test(data) & set(report["broken"]))
+        if broken:
+            data.tags.add(SKIP_TAG)
+            self._skipped[data.id] = ", ".join(
+                f"${{{name}}} {report['locators'][name]['status']} on {report['locators'][name]['page']} page"
+                for name in broken)
+
+    def end_test(self, data, result):
+        reason = self._skipped.pop(data.id, None)
+        if reason and result.skipped:
+            result.message = f"Skipped by locator pre-flight: {reason}."
+
+    # ============================================================
+    # INTERNALS
+    # ============================================================
+
+    def _path(self):
+        if self.report_path:
+            return self.report_path
+        output_dir = BuiltIn().get_variable_value("${OUTPUT DIR}") or "."
+        return os.path.join(output_dir, DEFAULT_REPORT)
+
+    @staticmethod
+    def _load(path):
+        with open(path, encoding="utf-8") as handle:
+            return json.load(handle)
+
+    def _current_report(self):
+        """Latest report: this process's scan, or a file written by another
+        one within ``max_age`` (an older file is left from an earlier run)."""
+        path = self._path()
+        if not os.path.isfile(path):
+            return self._report
+        mtime = os.path.getmtime(path)
+        if mtime != self._report_mtime and time.time() - mtime < self.max_age:
+            try:
+                self._report, self._report_mtime = self._load(path), mtime
+            except ValueError:
+                pass
+        return self._report
+
+
+# ============================================================
+# COMMAND LINE — pre-flight before a run
+# ============================================================
+
+def _environment_urls(environment):
+    path = os.path.join(PROJECT_DIR, "variables", f"env_{environment}.py")
+    spec = importlib.util.spec_from_file_location(f"env_{environment}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return {variable: getattr(module, variable, None) for variable, _, _ in PAGES.values()}
+
+
+def _open_browser(browser):
+    from selenium import webdriver
+
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from DriverCache import DriverCache
+
+    driver_path = DriverCache().get_cached_driver_path(browser)
+    name = browser.lower().replace("headless", "")
+    if name in ("firefox", "ff"):
+        options, service = webdriver.FirefoxOptions(), webdriver.FirefoxService(driver_path)
+        factory = webdriver.Firefox
+    elif name == "edge":
+        options, service = webdriver.EdgeOptions(), webdriver.EdgeService(driver_path)
+        factory = webdriver.Edge
+    else:
+        options, service = webdriver.ChromeOptions(), webdriver.ChromeService(driver_path)
+        factory = webdriver.Chrome
+    options.add_argument("--headless")
+    options.add_argument("--window-size=1920,1080")
+    return factory(options=options, service=service)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check every locator against the live pages.")
+    parser.add_argument("--environment", default=os.environ.get("ENVIRONMENT", "qa"),
+                        help="Environment whose URLs are checked (variables/env_<name>.py)")
+    parser.add_argument("--browser", default="chrome", help="Browser, always run headless")
+    parser.add_argument("--pages", nargs="*", choices=list(PAGES), help="Pages to check (default: all)")
+    parser.add_argument("--settle", type=float, default=5.0,
+                        help="Seconds each page may take to render its locators")
+    parser.add_argument("--report", default=os.path.join("results", DEFAULT_REPORT),
+                        help="Report JSON, pass it to the library for skip mode")
+    args = parser.parse_args(argv)
+
+    driver = _open_browser(args.browser)
+    try:
+        driver.set_script_timeout(args.settle + 10)
+        report = scan(driver, _environment_urls(args.environment), load_locators(),
+                      args.pages, args.settle)
+    finally:
+        driver.quit()
+    _atomic_write_json(args.report, report)
+    print(format_report(report))
+    print(f"Report written to {args.report}")
+    return 1 if report["broken"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+"""
+PageExtract.py — Structured extraction of result and cart rows in one script call
+==================================================================================
+Reading a list through ``Get WebElements`` and one ``Get Text`` per cell
+costs a WebDriver round trip per element. This library extracts every row
+of a list (search results, cart lines) with all of its fields as JSON in a
+single script execution. Assertions are then computed in Python:
+
+    ${cart}=    Extract Cart Lines    ${CART_LINE}    ${CART_TOTAL_PRICE}
+    ...    name=${CART_LINE_NAME}    price=${CART_LINE_PRICE}    quantity=${CART_ITEM_QTY_INPUT}
+    Cart Lines Should Add Up To Total    ${cart}
+
+Locators without a strategy prefix are read as ``identifier`` (id or
+name), as in SeleniumLibrary. Field locators are relative to the row and
+must be css, xpath, id, name or identifier; a row-relative xpath must
+start with ``.//``, e.g. ``xpath=.//span`` (``//`` would search the
+whole document). Each row
+always has ``text`` (the row's visible text) and ``href`` (for links). Values are read
+from ``value`` for form controls and from the visible text otherwise.
+Fields named ``price``/``total`` are parsed to Decimal (``₹1,234.50`` ->
+1234.50), ``quantity`` to int; a missing field is None.
+"""
+
+import re
+from decimal import Decimal
+
+from robot.api import logger
+from robot.api.deco import keyword, library
+from robot.libraries.BuiltIn import BuiltIn
+
+from LocatorHealth import FIND_SCRIPT, parse_locator
+
+
+MONEY_FIELDS = ("price", "total")
+INTEGER_FIELDS = ("quantity",)
+NUMBER = re.compile(r"\d[\d,]*(?:\.\d+)?")
+
+# arguments: [strategy, selector] of the rows, [[field, strategy, selector], ...],
+#            {name: [strategy, selector]} of page-level values
+EXTRACT_SCRIPT = FIND_SCRIPT + """
+var rows = arguments[0], fields = arguments[1], single = arguments[2];
+function read(element) {
+    if (!element) return null;
+    if ('value' in element && /^(INPUT|SELECT|TEXTAREA)$/.test(element.tagName)) return element.value;
+    return (element.innerText || element.textContent || '').trim();
+}
+function within(row, strategy, selector) {
+    if (strategy === 'xpath') {
+        return document.evaluate(selector, row, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null)
+            .singleNodeValue;
+    }
+    return row.querySelector(selector);
+}
+var result = {rows: Array.prototype.map.call(find(rows[0], rows[1]) || [], function (row) {
+    var data = {text: read(row), href: row.href || null};
+    fields.forEach(function (field) { data[field[0]] = read(within(row, field[1], field[2])); });
+    return data;
+})};
+Object.keys(single).forEach(function (name) {
+    result[name] = read((find(single[name][0], single[name][1]) || [])[0]);
+});
+return result;
+"""
+
+
+def parse_money(text):
+    """Decimal amount in ``text`` (first number, thousands separators removed), or None."""
+    match = NUMBER.search(text or "")
+    return Decimal(match.group().replace(",", "")) if match else None
+
+
+def parse_integer(text):
+    match = NUMBER.search(text or "")
+    return int(Decimal(match.group().replace(",", ""))) if match else None
+
+
+def convert(name, text):
+    if name in MONEY_FIELDS:
+        return parse_money(text)
+    if name in INTEGER_FIELDS:
+        return parse_integer(text)
+    return text
+
+
+def _css_string(value):
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def _locator(locator):
+    strategy, selector = parse_locator(locator) or ("identifier", locator)
+    return [strategy, selector]
+
+
+def _field_locator(name, locator):
+    """[strategy, selector] of a field inside a row: css or xpath, with
+    id/name/identifier mapped to attribute selectors."""
+    strategy, selector = _locator(locator)
+    if strategy == "xpath":
+        if selector.lstrip("(").startswith("/"):
+            raise ValueError(f"Field '{name}': a row-relative xpath must start with './/', "
+                             f"got '{selector}'.")
+        return [strategy, selector]
+    if strategy in ("id", "name"):
+        return ["css", f"[{strategy}={_css_string(selector)}]"]
+    if strategy == "identifier":
+        return ["css", f"[id={_css_string(selector)}], [name={_css_string(selector)}]"]
+    if strategy != "css":
+        raise ValueError(f"Field '{name}': strategy '{strategy}' is not supported inside a row, "
+                         f"use css, xpath, id, name or identifier.")
+    return [strategy, selector]
+
+
+@library(scope="GLOBAL", auto_keywords=False)
+class PageExtract:
+    """Keyword library that reads whole lists from the page in one round trip."""
+
+    # ============================================================
+    # KEYWORDS
+    # ============================================================
+
+    @keyword("Extract Rows")
+    def extract_rows(self, rows_locator, **fields):
+        """Returns every row matching ``rows_locator`` as a dictionary with
+        ``text``, ``href`` and one key per ``name=locator`` in ``fields``.
+
+        Example:
+        | ${results}= | Extract Rows | ${SEARCH_RESULT_ITEMS} | name=${SEARCH_RESULT_NAME} | price=${SEARCH_RESULT_PRICE} |
+        """
+        return self._extract(rows_locator, fields)["rows"]
+
+    @keyword("Extract Cart Lines")
+    def extract_cart_lines(self, rows_locator, total_locator, **fields):
+        """Returns ``{"lines": [...], "total": Decimal}``: all cart lines and
+        the cart total, read in the same script call."""
+        data = self._extract(rows_locator, fields, {"total": total_locator})
+        return {"lines": data["rows"], "total": convert("total", data["total"])}
+
+    @keyword("Cart Lines Should Add Up To Total")
+    def cart_lines_should_add_up_to_total(self, cart, tolerance="0.01"):
+        """Fails unless the sum of price × quantity over ``cart["lines"]``
+        equals ``cart["total"]`` within ``tolerance``. No browser calls.
+
+        Lines without a quantity count once.
+        """
+        lines = cart["lines"]
+        if not lines:
+            raise AssertionError("Cart has no lines.")
+        unpriced = [line.get("name") or line["text"] for line in lines if line.get("price") is None]
+        if unpriced:
+            raise AssertionError(f"No price found for cart line(s): {', '.join(unpriced)}")
+        if cart["total"] is None:
+            raise AssertionError("No cart total found.")
+        expected = sum(line["price"] * (line.get("quantity") or 1) for line in lines)
+        logger.info("\n".join(f"{line.get('quantity') or 1} × {line['price']}  {line.get('name') or ''}"
+                              for line in lines) + f"\n= {expected} (page total {cart['total']})")
+        if abs(expected - cart["total"]) > Decimal(tolerance):
+            raise AssertionError(f"Cart total {cart['total']} does not match the sum of "
+                                 f"price × quantity over {len(lines)} line(s): {expected}")
+
+    # ============================================================
+    # INTERNALS
+    # ============================================================
+
+    def _extract(self, rows_locator, fields, single=None):
+        driver = BuiltIn().get_library_instance("SeleniumLibrary").driver
+        data = driver.execute_script(
+            EXTRACT_SCRIPT, _locator(rows_locator),
+            [[name] + _field_locator(name, locator) for name, locator in fields.items()],
+            {name: _locator(locator) for name, locator in (single or {}).items()},
+        )
+        data["rows"] = [{name: convert(name, value) for name, value in row.items()}
+                        for row in data["rows"]]
+        logger.info(f"Extracted {len(data['rows'])} row(s) of '{rows_locator}' in one script call")
+        return data
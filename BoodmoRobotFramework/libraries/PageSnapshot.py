@@ -0,0 +1,219 @@
+"""
+PageSnapshot.py — Compressed, content-addressed DOM snapshots instead of PNGs
+==============================================================================
+A PNG screenshot is large, slow to encode in the browser, and says nothing
+about why a locator did not match. This library captures the page as a
+DOM snapshot instead: MHTML through the Chrome DevTools Protocol
+(``Page.captureSnapshot``), or the serialized HTML on browsers without
+CDP. Together with the snapshot it records the locator under test and
+how many elements it matches on the captured page.
+
+Artifact modes (``${ARTIFACT_MODE}``):
+    png     PNG screenshot only (previous behaviour)
+    dom     DOM snapshot only
+    both    DOM snapshot and PNG
+    none    nothing
+
+Storage is content addressed: ``<snapshot_dir>/objects/ab/abcdef....mhtml.gz``
+(gzip). The volatile parts of MHTML (the Date header and the random MIME
+boundary) are normalized before hashing, so the same page captured again
+costs no extra disk. Only the snapshot itself is read from the browser in
+the test's thread. Hashing happens there too, so the log can link the
+file. Compression and writing run in a background thread. Every capture
+is appended to ``<snapshot_dir>/index.jsonl`` (test, name, url, locator,
+matches, sha256, sizes).
+
+The locator under test is the argument of the last keyword that used a
+locator, tracked by the library's listener, unless one is given.
+
+Search all snapshots of a run for a selector:
+    zgrep -l "header-logo" results/snapshots/objects/*/*.gz
+
+Usage in Robot Framework:
+    Library    ${CURDIR}${/}..${/}libraries${/}PageSnapshot.py    ${ARTIFACT_MODE}    ${SNAPSHOT_DIR}    ${SCREENSHOT_DIR}
+    Capture Page Artifact    FAIL_${TEST_NAME}
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from robot.api import logger
+from robot.api.deco import keyword, library
+from robot.libraries.BuiltIn import BuiltIn
+from robot.utils import get_link_path
+
+from LocatorHealth import FIND_SCRIPT, parse_locator
+
+
+MODES = ("png", "dom", "both", "none")
+INDEX_FILE = "index.jsonl"
+
+_MHTML_DATE = re.compile(rb"^Date: .*$", re.MULTILINE)
+_MHTML_BOUNDARY = re.compile(rb'boundary="([^"]+)"')
+
+# arguments: strategy, selector (or null) -> {html, url, matches}
+HTML_SCRIPT = FIND_SCRIPT + """
+var matches = null;
+if (arguments[0]) {
+    try { var found = find(arguments[0], arguments[1]); matches = found ? found.length : null; }
+    catch (e) { matches = -1; }
+}
+return {html: arguments[2] ? '<!DOCTYPE html>\\n' + document.documentElement.outerHTML : null,
+        url: location.href, matches: matches};
+"""
+
+
+def normalize_mhtml(data):
+    """MHTML with the Date header and the random MIME boundary made constant."""
+    data = _MHTML_DATE.sub(b"Date: -", data, count=1)
+    match = _MHTML_BOUNDARY.search(data)
+    if match:
+        data = data.replace(match.group(1), b"----BoodmoSnapshotBoundary----")
+    return data
+
+
+def store_object(snapshot_dir, digest, extension, data):
+    """Write gzip(data) under its digest unless it is already stored.
+    Returns the stored size in bytes (0 when it was a duplicate)."""
+    folder = os.path.join(snapshot_dir, "objects", digest[:2])
+    path = os.path.join(folder, f"{digest}{extension}.gz")
+    if os.path.isfile(path):
+        return 0
+    os.makedirs(folder, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=folder, suffix=".tmp")
+    with os.fdopen(fd, "wb") as handle:
+        handle.write(gzip.compress(data, compresslevel=6))
+    os.replace(tmp_path, path)
+    return os.path.getsize(path)
+
+
+@library(scope="GLOBAL", auto_keywords=False)
+class PageSnapshot:
+    """Keyword library for DOM snapshot / screenshot artifacts."""
+
+    ROBOT_LISTENER_API_VERSION = 3
+
+    def __init__(self, mode="png", snapshot_dir=None, screenshot_dir=None):
+        """
+        Args:
+            mode (str): png, dom, both or none
+            snapshot_dir (str): Snapshot store (default: snapshots in the output dir)
+            screenshot_dir (str): Directory of PNG screenshots (default: output dir)
+        """
+        self.mode = mode.lower()
+        if self.mode not in MODES:
+            raise ValueError(f"Artifact mode must be one of {', '.join(MODES)}, got '{mode}'")
+        self.snapshot_dir = snapshot_dir or None
+        self.screenshot_dir = screenshot_dir or None
+        self.ROBOT_LIBRARY_LISTENER = self
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="snapshot")
+        self._pending = []
+        self._lock = threading.Lock()
+        self._last_locator = None
+
+    # ============================================================
+    # KEYWORDS
+    # ============================================================
+
+    @keyword("Capture Page Artifact")
+    def capture_page_artifact(self, name, locator=None):
+        """Captures the current page as configured by the artifact mode.
+
+        Args:
+            name (str): Artifact name, e.g. ``FAIL_${TEST_NAME}``
+            locator (str): Locator under test (default: the last locator used)
+        """
+        name = re.sub(r"[^\w.-]+", "_", name)
+        if self.mode in ("png", "both"):
+            directory = self.screenshot_dir or BuiltIn().get_variable_value("${OUTPUT DIR}")
+            BuiltIn().get_library_instance("SeleniumLibrary").capture_page_screenshot(
+                os.path.join(directory, f"{name}_{{index}}.png"))
+        if self.mode in ("dom", "both"):
+            self._capture_dom(name, locator or self._last_locator)
+
+    @keyword("Wait For Page Artifacts")
+    def wait_for_page_artifacts(self):
+        """Waits until all snapshots captured so far are written to disk.
+        A snapshot that could not be written is logged as a warning, so a
+        full or read-only disk does not fail the (suite) teardown."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for future in pending:
+            try:
+                future.result()
+            except OSError as error:
+                logger.warn(f"DOM snapshot could not be written: {error}")
+
+    # ============================================================
+    # LISTENER — locator under test
+    # ============================================================
+
+    def start_test(self, data, result):
+        self._last_locator = None
+
+    def start_keyword(self, data, result):
+        # Only DOM snapshots report the locator; don't resolve every keyword's args otherwise
+        if self.mode not in ("dom", "both"):
+            return
+        if not data.args or not isinstance(data.args[0], str):
+            return
+        try:
+            value = BuiltIn().replace_variables(data.args[0])
+        except Exception:
+            return
+        if isinstance(value, str) and parse_locator(value):
+            self._last_locator = value
+
+    def close(self):
+        self._writer.shutdown(wait=True)
+
+    # ============================================================
+    # INTERNALS
+    # ============================================================
+
+    def _capture_dom(self, name, locator):
+        driver = BuiltIn().get_library_instance("SeleniumLibrary").driver
+        strategy, selector = (parse_locator(locator) if locator else None) or (None, None)
+        mhtml = None
+        if hasattr(driver, "execute_cdp_cmd"):
+            try:
+                mhtml = driver.execute_cdp_cmd("Page.captureSnapshot", {"format": "mhtml"})["data"]
+            except Exception as error:
+                logger.debug(f"CDP snapshot not available, using the HTML: {error}")
+        page = driver.execute_script(HTML_SCRIPT, strategy, selector, mhtml is None)
+        if mhtml is not None:
+            content, extension = normalize_mhtml(mhtml.encode("utf-8")), ".mhtml"
+        else:
+            content, extension = page["html"].encode("utf-8"), ".html"
+
+        digest = hashlib.sha256(content).hexdigest()
+        snapshot_dir = self.snapshot_dir or os.path.join(
+            BuiltIn().get_variable_value("${OUTPUT DIR}"), "snapshots")
+        record = {
+            "time": datetime.now().isoformat(timespec="seconds"),
+            "test": BuiltIn().get_variable_value("${TEST NAME}"),
+            "name": name, "url": page["url"], "locator": locator, "matches": page["matches"],
+            "sha256": digest, "bytes": len(content),
+        }
+        path = os.path.join(snapshot_dir, "objects", digest[:2], f"{digest}{extension}.gz")
+        link = get_link_path(path, BuiltIn().get_variable_value("${OUTPUT DIR}"))
+        found = "" if locator is None else f", locator '{locator}' matches {page['matches']}"
+        logger.info(f'DOM snapshot {name}: <a href="{link}">{os.path.basename(path)}</a>{found}',
+                    html=True)
+        with self._lock:
+            self._pending.append(self._writer.submit(self._write, snapshot_dir, extension,
+                                                     content, record))
+
+    @staticmethod
+    def _write(snapshot_dir, extension, content, record):
+        # Background thread: no Robot logging here
+        record["stored_bytes"] = store_object(snapshot_dir, record["sha256"], extension, content)
+        with open(os.path.join(snapshot_dir, INDEX_FILE), "a", encoding="utf-8") as handle:
+            handle.write(json.dumps(record) + "\n")
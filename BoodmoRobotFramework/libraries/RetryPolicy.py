@@ -0,0 +1,338 @@
+"""
+RetryPolicy.py — Transport-level retries and circuit breaking for API keywords
+===============================================================================
+Wraps the HTTP adapters of a RequestsLibrary session in a retrying
+adapter, so every ``GET On Session`` / ``POST On Session`` gets the same
+policy without changes to the keywords themselves. The wrapped adapter
+(e.g. the shared pool from HttpTransport.py) still does the actual I/O.
+
+Policy:
+    - Retries on connection errors, timeouts and 500/502/503/504
+    - Exponential backoff with full jitter (honours ``Retry-After``)
+    - Idempotency aware: GET/HEAD/OPTIONS are retried freely; POST only
+      for allow-listed paths (e.g. /cart/add) AND only when the request
+      carries an ``Idempotency-Key`` header
+    - Retry budget per robot process: once spent, failures are returned
+      as-is (under tools/orchestrate.py, one process runs one suite file)
+    - Circuit breaker per endpoint (method + path with ids collapsed):
+      after N consecutive failures the endpoint fails fast for a cooldown,
+      then one trial request decides whether it closes again
+
+Every retry and the latency it added is written to the Robot log, and
+passed to retry observers (``add_retry_observer``, e.g. listeners/Metrics.py).
+Robot only logs from the main thread: callers that send requests from
+worker threads (e.g. SearchMatrix.py) collect the messages with
+``held_log_messages`` and log them after joining.
+
+Usage in Robot Framework:
+    Create Session    ${API_SESSION_ALIAS}    ${API_BASE_URL}
+    Enable Retry Policy On Session    ${API_SESSION_ALIAS}
+    ...
+    Log Retry Statistics
+"""
+
+import random
+import re
+import threading
+import time
+from contextlib import contextmanager
+
+import requests
+from requests.adapters import BaseAdapter
+from robot.api import logger
+from robot.api.deco import keyword, library
+from robot.libraries.BuiltIn import BuiltIn
+from robot.utils import timestr_to_secs
+
+
+RETRY_STATUSES = frozenset({500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+MAX_BACKOFF_SECONDS = 30.0
+
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+_OBSERVERS = []
+_HELD = threading.local()
+
+
+def add_retry_observer(callback):
+    """Call ``callback(endpoint, reason)`` for every retry and every request
+    failed fast by an open circuit (reason ``circuit_open``)."""
+    _OBSERVERS.append(callback)
+
+
+def _notify(endpoint, reason):
+    for observer in _OBSERVERS:
+        observer(endpoint, reason)
+
+
+@contextmanager
+def held_log_messages():
+    """Collect the policy's log messages of the current thread in the
+    yielded list instead of logging them."""
+    _HELD.messages = messages = []
+    try:
+        yield messages
+    finally:
+        _HELD.messages = None
+
+
+def _log(message):
+    messages = getattr(_HELD, "messages", None)
+    if messages is None:
+        logger.info(message)
+    else:
+        messages.append(message)
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised instead of sending a request while an endpoint's circuit is open."""
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one endpoint (thread-safe).
+
+    While half-open, only one trial request is let through; the thread that
+    sends it owns the trial until it records the outcome.
+    """
+
+    def __init__(self, threshold, cooldown):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at = None
+        self._trial = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        with self._lock:
+            return self._state()
+
+    def allow(self):
+        with self._lock:
+            state = self._state()
+            if state == "half-open" and self._trial is None:
+                self._trial = threading.get_ident()
+                return True
+            return state == "closed"
+
+    def record(self, success):
+        with self._lock:
+            if self._trial == threading.get_ident():
+                self._trial = None
+            if success:
+                self.failures = 0
+                self.opened_at = None
+                return
+            self.failures += 1
+            if self._state() == "half-open" or self.failures >= self.threshold:
+                self.opened_at = time.monotonic()
+
+    def release(self):
+        """Give up this thread's trial without an outcome (unexpected error)."""
+        with self._lock:
+            if self._trial == threading.get_ident():
+                self._trial = None
+
+    def _state(self):
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.cooldown:
+            return "half-open"
+        return "open"
+
+
+class RetryStats:
+    """Retry counters of the process, shared by every adapter of one policy."""
+
+    def __init__(self, budget):
+        self.budget = budget
+        self.requests = 0
+        self.retries = 0
+        self.added_latency = 0.0
+        self.short_circuited = 0
+        self._lock = threading.Lock()
+
+    def count_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def count_short_circuit(self):
+        with self._lock:
+            self.short_circuited += 1
+
+    def add_latency(self, seconds):
+        with self._lock:
+            self.added_latency += seconds
+
+    def take_retry(self):
+        """Consume one retry from the run budget; False when exhausted."""
+        with self._lock:
+            if self.retries >= self.budget:
+                return False
+            self.retries += 1
+            return True
+
+
+class RetryingAdapter(BaseAdapter):
+    """Adapter that applies backoff, idempotency and circuit breaker rules
+    around the ``inner`` adapter that sends the requests."""
+
+    def __init__(self, policy, inner):
+        super().__init__()
+        self.policy = policy
+        self.inner = inner
+
+    def close(self):
+        self.inner.close()
+
+    def send(self, request, **kwargs):
+        policy = self.policy
+        endpoint = policy.endpoint_key(request)
+        breaker = policy.breaker(endpoint)
+        retryable = policy.is_retryable(request)
+        policy.stats.count_request()
+
+        attempt = 0
+        started = time.monotonic()
+        while True:
+            if not breaker.allow():
+                policy.stats.count_short_circuit()
+                _notify(endpoint, "circuit_open")
+                raise CircuitOpenError(f"Circuit open for {endpoint}: failing fast", request=request)
+
+            error = response = None
+            try:
+                response = self.inner.send(request, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as exc:
+                error = exc
+            except Exception:
+                breaker.release()
+                raise
+            failed = error is not None or response.status_code in RETRY_STATUSES
+            breaker.record(not failed)
+
+            # Stop on success, non-retryable request, exhausted attempts/budget,
+            # or when this failure just opened the circuit (return the real error)
+            if not failed or not retryable or attempt >= policy.max_retries \
+                    or breaker.state == "open" or not policy.stats.take_retry():
+                break
+
+            attempt += 1
+            delay = policy.backoff(attempt, response)
+            reason = type(error).__name__ if error is not None else response.status_code
+            _notify(endpoint, str(reason))
+            _log(f"Retry {attempt}/{policy.max_retries} for {endpoint} after {reason}, "
+                 f"sleeping {delay:.2f}s")
+            if response is not None:
+                # Drain the error body so the connection returns to the pool
+                response.content
+                response.close()
+            time.sleep(delay)
+
+        if attempt:
+            added = time.monotonic() - started
+            policy.stats.add_latency(added)
+            _log(f"{endpoint}: {attempt} retr{'y' if attempt == 1 else 'ies'}, "
+                 f"added latency {added:.2f}s")
+        if error is not None:
+            raise error
+        return response
+
+
+@library(scope="GLOBAL", auto_keywords=False)
+class RetryPolicy:
+    """Keyword library that installs the retry policy on RequestsLibrary sessions."""
+
+    def __init__(self, max_retries=3, backoff="2s", budget=20,
+                 breaker_threshold=5, breaker_cooldown="30s", retry_post_paths="/cart/add"):
+        """
+        Args:
+            max_retries (int): Retries per request (``${API_RETRY}``)
+            backoff (str): Base backoff interval (``${RETRY_INTERVAL}``)
+            budget (int): Total retries allowed in this robot process
+            breaker_threshold (int): Consecutive failures that open a circuit
+            breaker_cooldown (str): How long an open circuit fails fast
+            retry_post_paths (str): Comma separated POST paths that may be
+                                    retried when sent with an Idempotency-Key
+        """
+        self.max_retries = int(max_retries)
+        self.base_backoff = timestr_to_secs(backoff)
+        self.breaker_threshold = int(breaker_threshold)
+        self.breaker_cooldown = timestr_to_secs(breaker_cooldown)
+        self.retry_post_paths = tuple(p.strip() for p in retry_post_paths.split(",") if p.strip())
+        self.stats = RetryStats(int(budget))
+        self._breakers = {}
+
+    # ============================================================
+    # KEYWORDS
+    # ============================================================
+
+    @keyword("Enable Retry Policy On Session")
+    def enable_retry_policy_on_session(self, alias):
+        """Wraps the http/https adapters of RequestsLibrary session ``alias``
+        in the retrying adapter."""
+        session = BuiltIn().get_library_instance("RequestsLibrary")._cache.switch(alias)
+        for prefix in ("http://", "https://"):
+            inner = session.adapters[prefix]
+            if not isinstance(inner, RetryingAdapter):
+                session.mount(prefix, RetryingAdapter(self, inner))
+        logger.info(f"Retry policy enabled on '{alias}': {self.max_retries} retries, "
+                    f"base backoff {self.base_backoff}s, run budget {self.stats.budget}")
+
+    @keyword("Get Retry Statistics")
+    def get_retry_statistics(self):
+        """Returns the process's retry counters and circuit breaker states as a dictionary."""
+        return {
+            "requests": self.stats.requests,
+            "retries": self.stats.retries,
+            "budget_left": self.stats.budget - self.stats.retries,
+            "added_latency": round(self.stats.added_latency, 3),
+            "short_circuited": self.stats.short_circuited,
+            "open_circuits": [key for key, b in self._breakers.items() if b.state != "closed"],
+        }
+
+    @keyword("Log Retry Statistics")
+    def log_retry_statistics(self):
+        """Logs the retry counters, e.g. in a suite teardown."""
+        stats = self.get_retry_statistics()
+        logger.info(f"API retries: {stats['retries']} over {stats['requests']} request(s), "
+                    f"added latency {stats['added_latency']}s, budget left {stats['budget_left']}, "
+                    f"short-circuited {stats['short_circuited']}, "
+                    f"open circuits {stats['open_circuits'] or 'none'}", also_console=True)
+
+    # ============================================================
+    # POLICY
+    # ============================================================
+
+    @staticmethod
+    def endpoint_key(request):
+        """Circuit breaker key: method + path with numeric ids collapsed."""
+        path = requests.utils.urlparse(request.url).path
+        return f"{request.method} {_ID_SEGMENT.sub('/{id}', path)}"
+
+    def breaker(self, endpoint):
+        breaker = self._breakers.get(endpoint)
+        if breaker is None:
+            # setdefault: concurrent callers (e.g. SearchMatrix) share one breaker
+            breaker = self._breakers.setdefault(
+                endpoint, CircuitBreaker(self.breaker_threshold, self.breaker_cooldown))
+        return breaker
+
+    def is_retryable(self, request):
+        if request.method in IDEMPOTENT_METHODS:
+            return True
+        if request.method == "POST" and IDEMPOTENCY_HEADER in request.headers:
+            path = requests.utils.urlparse(request.url).path
+            return path.endswith(self.retry_post_paths)
+        return False
+
+    def backoff(self, attempt, response=None):
+        """Full-jitter exponential backoff, at least ``Retry-After`` when given."""
+        ceiling = min(MAX_BACKOFF_SECONDS, self.base_backoff * 2 ** (attempt - 1))
+        delay = random.uniform(0, ceiling)
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after and retry_after.isdigit():
+            delay = max(delay, min(float(retry_after), MAX_BACKOFF_SECONDS))
+        return delay
@@ -0,0 +1,108 @@
+"""
+SchemaValidator.py — Cached JSON Schema validation for API responses
+=====================================================================
+Loads the JSON Schemas in resources/schemas/ once, builds a validator per
+schema once, and validates a whole response in a single keyword call.
+All violations are reported together instead of failing on the first one.
+
+Schemas (resources/schemas/<name>_response.json):
+    search   -> GET /search
+    product  -> GET /product/{id}
+    cart     -> GET /cart, POST /cart/add, POST /cart/remove
+
+Usage in Robot Framework:
+    ${json}=    Validate Response Against Schema    ${response}    search
+
+Uses ``jsonschema`` (installed with robotframework-jsonlibrary).
+"""
+
+import json
+import os
+
+from jsonschema.validators import validator_for
+from robot.api import logger
+from robot.api.deco import keyword, library
+
+
+DEFAULT_SCHEMA_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "resources", "schemas"
+)
+
+# Validators shared by every library instance: {schema file path: validator}
+_VALIDATORS = {}
+
+
+def _error_path(error):
+    """Render an error location as a JSONPath-like string, e.g. $.items[0].quantity."""
+    path = "$"
+    for part in error.absolute_path:
+        path += f"[{part}]" if isinstance(part, int) else f".{part}"
+    return path
+
+
+@library(scope="GLOBAL", auto_keywords=False)
+class SchemaValidator:
+    """Keyword library for single-call JSON Schema validation."""
+
+    def __init__(self, schema_dir=None):
+        """
+        Args:
+            schema_dir (str): Directory with <name>_response.json schemas
+                              (default: resources/schemas)
+        """
+        self.schema_dir = os.path.abspath(schema_dir or DEFAULT_SCHEMA_DIR)
+
+    # ============================================================
+    # KEYWORDS
+    # ============================================================
+
+    @keyword("Validate Response Against Schema")
+    def validate_response_against_schema(self, response, schema_name):
+        """Validates a response (or parsed JSON) against schema ``schema_name``.
+
+        Fails with the full list of schema violations. Returns the parsed JSON
+        body so callers do not need a separate ``Validate Response Is JSON``.
+        """
+        body = self._parse(response)
+        errors = self.get_schema_errors(body, schema_name)
+        if errors:
+            details = "\n".join(f"- {error}" for error in errors)
+            raise AssertionError(
+                f"Response violates '{schema_name}' schema ({len(errors)} error(s)):\n{details}"
+            )
+        logger.info(f"Response matches '{schema_name}' schema")
+        return body
+
+    @keyword("Get Schema Errors")
+    def get_schema_errors(self, json_body, schema_name):
+        """Returns all schema violations of ``json_body`` as a list of strings."""
+        validator = self._validator(schema_name)
+        errors = sorted(validator.iter_errors(json_body), key=lambda e: list(e.absolute_path))
+        return [f"{_error_path(error)}: {error.message}" for error in errors]
+
+    # ============================================================
+    # INTERNALS
+    # ============================================================
+
+    def _validator(self, schema_name):
+        path = os.path.join(self.schema_dir, f"{schema_name}_response.json")
+        validator = _VALIDATORS.get(path)
+        if validator is None:
+            try:
+                with open(path, encoding="utf-8") as handle:
+                    schema = json.load(handle)
+            except FileNotFoundError:
+                raise ValueError(f"Unknown response schema '{schema_name}': {path} not found")
+            cls = validator_for(schema)
+            cls.check_schema(schema)
+            validator = _VALIDATORS[path] = cls(schema)
+        return validator
+
+    @staticmethod
+    def _parse(response):
+        if hasattr(response, "json"):
+            try:
+                return response.json()
+            except ValueError:
+                raise AssertionError("Response body is empty or not valid JSON")
+        return response
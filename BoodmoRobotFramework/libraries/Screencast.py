@@ -0,0 +1,287 @@
+"""
+Screencast.py — Failure-only CDP screencast in an in-memory ring buffer
+========================================================================
+A screenshot taken after the failure shows where a flow ended, not how it
+got there (e.g. ``Click Login Continue Button`` and a password step that
+never rendered). This library records the browser tab with the Chrome
+DevTools Protocol screencast (``Page.startScreencast``) and keeps only the
+last ``seconds`` of JPEG frames in a fixed-size ring buffer in memory.
+
+    Start Screencast      opens a CDP websocket to the current tab and
+                          starts the screencast (Chromium browsers only)
+    Save Screencast       encodes the buffered frames to an MP4 (ffmpeg),
+                          called by ``End Test`` for failed tests only
+    Stop Screencast       stops recording before the browser is closed
+
+Passing tests pay almost nothing: frames arrive only when the page
+repaints, are received by a background thread, stored undecoded (base64)
+and at most ``fps`` frames per second are kept. The buffer is cleared
+when a test starts, so a video holds the failed test only. Without ffmpeg
+on the PATH the frames are written as numbered JPEGs instead.
+
+The screencast follows the tab that was current when it started; windows
+opened later are not recorded.
+
+Usage in Robot Framework:
+    Library    ${CURDIR}${/}..${/}libraries${/}Screencast.py    ${SCREENCAST}    ${SCREENCAST_SECONDS}    ${SCREENCAST_DIR}
+    Start Screencast
+    Run Keyword If Test Failed    Save Screencast    FAIL_${TEST_NAME}
+"""
+
+import base64
+import json
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+from collections import deque
+
+import websocket
+from robot.api import logger
+from robot.api.deco import keyword, library
+from robot.libraries.BuiltIn import BuiltIn
+from robot.utils import get_link_path, is_truthy, timestr_to_secs
+
+
+# Capability entries that carry the browser's DevTools address
+DEBUGGER_CAPABILITIES = ("goog:chromeOptions", "ms:edgeOptions")
+# Duration of the last frame in the video
+LAST_FRAME_SECONDS = 1.0
+
+
+class FrameBuffer:
+    """Ring buffer of (timestamp, base64 JPEG) frames covering the last
+    ``seconds``, at most ``fps`` frames per second."""
+
+    def __init__(self, seconds, fps):
+        self.seconds = seconds
+        self.interval = 1.0 / fps
+        self._frames = deque(maxlen=max(int(seconds * fps), 1) + 1)
+        self._lock = threading.Lock()
+
+    def add(self, timestamp, data):
+        with self._lock:
+            if self._frames and timestamp - self._frames[-1][0] < self.interval:
+                return
+            self._frames.append((timestamp, data))
+            while timestamp - self._frames[0][0] > self.seconds:
+                self._frames.popleft()
+
+    def clear(self, keep_last=False):
+        """Drops all frames; ``keep_last`` keeps the newest one, which is
+        what the screen shows until the page repaints."""
+        with self._lock:
+            last = self._frames[-1] if keep_last and self._frames else None
+            self._frames.clear()
+            if last:
+                self._frames.append(last)
+
+    def frames(self):
+        with self._lock:
+            return list(self._frames)
+
+
+class ScreencastSession(threading.Thread):
+    """Background CDP client: starts the screencast on one page target and
+    acknowledges every frame (Chrome stops sending unacknowledged frames).
+
+    Raises ``websocket.WebSocketException`` or ``OSError`` when the DevTools
+    endpoint cannot be reached.
+    """
+
+    def __init__(self, url, buffer, params):
+        super().__init__(name="screencast", daemon=True)
+        self.buffer = buffer
+        self.error = None
+        self._ids = iter(range(1, 1 << 31))
+        # Frame acks come from this thread, stop from the keyword's thread
+        self._send_lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._socket = websocket.create_connection(url, timeout=1, suppress_origin=True)
+        try:
+            self._send("Page.startScreencast", params)
+        except (websocket.WebSocketException, OSError):
+            self._socket.close()
+            raise
+
+    def _send(self, method, params=None):
+        with self._send_lock:
+            self._socket.send(json.dumps({"id": next(self._ids), "method": method, "params": params or {}}))
+
+    def run(self):
+        try:
+            while not self._stopping.is_set():
+                try:
+                    message = json.loads(self._socket.recv())
+                except websocket.WebSocketTimeoutException:
+                    continue
+                if message.get("method") == "Page.screencastFrame":
+                    params = message["params"]
+                    self._send("Page.screencastFrameAck", {"sessionId": params["sessionId"]})
+                    self.buffer.add(params["metadata"]["timestamp"], params["data"])
+        except (websocket.WebSocketException, OSError) as error:
+            # Browser closed or tab gone
+            if not self._stopping.is_set():
+                self.error = error
+        finally:
+            self._socket.close()
+
+    def stop(self):
+        self._stopping.set()
+        try:
+            self._send("Page.stopScreencast")
+        except (websocket.WebSocketException, OSError):
+            pass
+        self.join(timeout=5)
+
+
+def debugger_url(driver):
+    """DevTools websocket URL of the driver's current tab, or None."""
+    address = next((driver.capabilities[name]["debuggerAddress"] for name in DEBUGGER_CAPABILITIES
+                    if "debuggerAddress" in driver.capabilities.get(name, {})), None)
+    if not address or not hasattr(driver, "execute_cdp_cmd"):
+        return None
+    target = driver.execute_cdp_cmd("Target.getTargetInfo", {})["targetInfo"]["targetId"]
+    return f"ws://{address}/devtools/page/{target}"
+
+
+def encode_video(frames, path, ffmpeg):
+    """Encode [(timestamp, base64 JPEG), ...] to an H.264 MP4 with the
+    original frame timing, using the ffmpeg concat demuxer."""
+    with tempfile.TemporaryDirectory(prefix="screencast-") as work:
+        playlist = []
+        for index, (timestamp, data) in enumerate(frames):
+            frame = os.path.join(work, f"{index:05d}.jpg")
+            with open(frame, "wb") as handle:
+                handle.write(base64.b64decode(data))
+            following = frames[index + 1][0] if index + 1 < len(frames) else timestamp + LAST_FRAME_SECONDS
+            playlist.append(f"file '{frame}'\nduration {following - timestamp:.3f}")
+        # The concat demuxer ignores the duration of the last entry unless it is repeated
+        playlist.append(f"file '{frame}'")
+        concat = os.path.join(work, "frames.txt")
+        with open(concat, "w", encoding="utf-8") as handle:
+            handle.write("\n".join(playlist) + "\n")
+        subprocess.run(
+            [ffmpeg, "-y", "-loglevel", "error", "-f", "concat", "-safe", "0", "-i", concat,
+             "-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2", "-vsync", "vfr",
+             "-c:v", "libx264", "-pix_fmt", "yuv420p", "-movflags", "+faststart", path],
+            check=True, capture_output=True, timeout=120,
+        )
+
+
+def write_frames(frames, folder):
+    os.makedirs(folder, exist_ok=True)
+    for index, (_, data) in enumerate(frames):
+        with open(os.path.join(folder, f"{index:05d}.jpg"), "wb") as handle:
+            handle.write(base64.b64decode(data))
+
+
+@library(scope="GLOBAL", auto_keywords=False)
+class Screencast:
+    """Keyword library that keeps a short screencast of each test for failures."""
+
+    ROBOT_LISTENER_API_VERSION = 3
+
+    def __init__(self, enabled=False, seconds="10s", directory=None, fps=10, quality=60,
+                 max_width=1280):
+        """
+        Args:
+            enabled (bool): Record at all (``${SCREENCAST}``)
+            seconds (str): Length of the ring buffer, e.g. 10s
+            directory (str): Where videos are saved (default: screencasts in the output dir)
+            fps (int): Frames kept per second (more frames are acknowledged and dropped)
+            quality (int): JPEG quality of the frames, 0-100
+            max_width (int): Frames are scaled down to this width by the browser
+        """
+        self.enabled = is_truthy(enabled)
+        self.directory = directory or None
+        self.params = {"format": "jpeg", "quality": int(quality), "maxWidth": int(max_width),
+                       "everyNthFrame": 1}
+        self.buffer = FrameBuffer(timestr_to_secs(seconds), int(fps))
+        self.ROBOT_LIBRARY_LISTENER = self
+        self._session = None
+
+    # ============================================================
+    # KEYWORDS
+    # ============================================================
+
+    @keyword("Start Screencast")
+    def start_screencast(self):
+        """Starts recording the current tab into the ring buffer. Does
+        nothing when disabled, already recording, or not a Chromium browser."""
+        if not self.enabled or (self._session and self._session.is_alive()):
+            return
+        driver = BuiltIn().get_library_instance("SeleniumLibrary").driver
+        try:
+            url = debugger_url(driver)
+        except Exception as error:
+            logger.info(f"Screencast not available: {error}")
+            return
+        if not url:
+            logger.info("Screencast not available: browser exposes no DevTools endpoint")
+            return
+        self.buffer.clear()
+        try:
+            self._session = ScreencastSession(url, self.buffer, self.params)
+        except (websocket.WebSocketException, OSError) as error:
+            logger.info(f"Screencast not available: DevTools connection failed: {error}")
+            return
+        self._session.start()
+        logger.info(f"Screencast recording, keeping the last {self.buffer.seconds:g}s")
+
+    @keyword("Save Screencast")
+    def save_screencast(self, name):
+        """Saves the buffered frames as ``<directory>/<name>.mp4`` and embeds
+        the video in the log. Returns the path, or None when nothing was recorded."""
+        frames = self.buffer.frames()
+        if self._session and self._session.error:
+            logger.warn(f"Screencast stopped early: {self._session.error}")
+        if not frames:
+            if self._session:
+                logger.info("Screencast has no frames for this test")
+            return None
+        name = re.sub(r"[^\w.-]+", "_", name)
+        output_dir = BuiltIn().get_variable_value("${OUTPUT DIR}")
+        directory = self.directory or os.path.join(output_dir, "screencasts")
+        os.makedirs(directory, exist_ok=True)
+        seconds = frames[-1][0] - frames[0][0]
+        ffmpeg = shutil.which("ffmpeg")
+        if ffmpeg:
+            path = os.path.join(directory, f"{name}.mp4")
+            try:
+                encode_video(frames, path, ffmpeg)
+            except (subprocess.SubprocessError, OSError) as error:
+                stderr = getattr(error, "stderr", b"") or b""
+                logger.warn(f"Encoding the screencast failed, saving frames: {error} "
+                            f"{stderr.decode(errors='replace').strip()}")
+            else:
+                link = get_link_path(path, output_dir)
+                logger.info(f'Screencast, last {seconds:.1f}s ({len(frames)} frames):<br>'
+                            f'<video src="{link}" controls width="800"></video>', html=True)
+                return path
+        path = os.path.join(directory, f"{name}_frames")
+        write_frames(frames, path)
+        logger.info(f'Screencast, last {seconds:.1f}s: {len(frames)} JPEG frames in '
+                    f'<a href="{get_link_path(path, output_dir)}">{os.path.basename(path)}</a>'
+                    f'{"" if ffmpeg else " (ffmpeg not found)"}', html=True)
+        return path
+
+    @keyword("Stop Screencast")
+    def stop_screencast(self):
+        """Stops recording and drops the buffer. Call before closing the browser."""
+        if self._session:
+            self._session.stop()
+            self._session = None
+        self.buffer.clear()
+
+    # ============================================================
+    # LISTENER — one buffer per test
+    # ============================================================
+
+    def start_test(self, data, result):
+        self.buffer.clear(keep_last=True)
+
+    def close(self):
+        self.stop_screencast()
@@ -0,0 +1,143 @@
+"""
+SearchMatrix.py — Data-driven search term matrix through the API tier
+=====================================================================
+Checking a search term through the UI (``Search For Product``) takes
+seconds per term. This library validates a whole CSV of search terms
+through the search API instead, with a bounded number of requests in
+flight. Thousands of terms take about as long as a few UI tests. A small
+sample of the CSV is cross-checked through the UI by the UI suite.
+
+CSV columns (resources/data/search_terms.csv):
+    term         search text, sent as ``q``
+    expected     results  -> 200 and at least one item
+                 empty    -> 200 and no items
+                 handled  -> anything but a 5xx (e.g. 200 or 400)
+    ui_sample    yes = also checked through the UI sample
+
+Requests go through the RequestsLibrary session, so they share its
+headers, the pooled transport and the retry policy. All failing terms are
+reported together at the end, after the retry messages of each term.
+
+Usage in Robot Framework:
+    ${summary}=    Run Search Matrix On Session    ${API_SESSION_ALIAS}
+    ...    ${API_SEARCH_ENDPOINT}    ${SEARCH_MATRIX_FILE}    concurrency=8
+    @{sample}=    Get Search Matrix UI Sample    ${SEARCH_MATRIX_FILE}    3
+"""
+
+import csv
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from robot.api import logger
+from robot.api.deco import keyword, library
+from robot.libraries.BuiltIn import BuiltIn
+
+from RetryPolicy import held_log_messages
+
+
+EXPECTATIONS = ("results", "empty", "handled")
+ITEM_KEYS = ("products", "data", "items")
+
+
+def load_matrix(path):
+    """Rows of the search term CSV, with ``expected`` validated."""
+    with open(path, newline="", encoding="utf-8") as handle:
+        rows = list(csv.DictReader(handle))
+    for line, row in enumerate(rows, start=2):
+        row["expected"] = row.get("expected", "").strip().lower()
+        if row["expected"] not in EXPECTATIONS:
+            raise ValueError(f"{path}:{line}: expected must be one of {', '.join(EXPECTATIONS)}, "
+                             f"got '{row['expected']}'")
+    return rows
+
+
+def count_items(body):
+    """Number of result items in a search response body, None if there is no item array."""
+    if isinstance(body, list):
+        return len(body)
+    if isinstance(body, dict):
+        for key in ITEM_KEYS:
+            if isinstance(body.get(key), list):
+                return len(body[key])
+    return None
+
+
+def check_outcome(expected, status, body):
+    """Return a violation message for one term, or None when it matches ``expected``."""
+    if status >= 500:
+        return f"server error {status}"
+    if expected == "handled":
+        return None
+    if status != 200:
+        return f"expected 200 but got {status}"
+    items = count_items(body)
+    if items is None:
+        return "response has no products/data/items array"
+    if expected == "results" and items == 0:
+        return "expected results but got none"
+    if expected == "empty" and items > 0:
+        return f"expected no results but got {items}"
+    return None
+
+
+@library(scope="GLOBAL", auto_keywords=False)
+class SearchMatrix:
+    """Keyword library for validating many search terms with bounded concurrency."""
+
+    # ============================================================
+    # KEYWORDS
+    # ============================================================
+
+    @keyword("Run Search Matrix On Session")
+    def run_search_matrix_on_session(self, alias, uri, csv_path, concurrency=8):
+        """Sends GET ``uri``?q=<term> for every CSV row on session ``alias``,
+        at most ``concurrency`` at a time, and checks the expected outcome.
+
+        Fails with the list of all failing terms. Returns a summary
+        dictionary (terms, failed, seconds, by_expectation).
+        """
+        rows = load_matrix(csv_path)
+        requests_lib = BuiltIn().get_library_instance("RequestsLibrary")
+        session = requests_lib._cache.switch(alias)
+        url = f"{session.url.rstrip('/')}/{uri.lstrip('/')}"
+        timeout = requests_lib._get_timeout(None)
+
+        def check(row):
+            with held_log_messages() as messages:
+                try:
+                    response = session.get(url, params={"q": row["term"]}, timeout=timeout)
+                except Exception as error:
+                    return row, f"request failed: {type(error).__name__}: {error}", messages
+            try:
+                body = response.json()
+            except ValueError:
+                body = None
+            return row, check_outcome(row["expected"], response.status_code, body), messages
+
+        started = time.monotonic()
+        # Logging from worker threads is not supported: collect, then log here
+        with ThreadPoolExecutor(max_workers=max(int(concurrency), 1)) as pool:
+            results = list(pool.map(check, rows))
+        seconds = time.monotonic() - started
+
+        for row, _, messages in results:
+            if messages:
+                logger.info(f"'{row['term']}': " + "\n".join(messages))
+        failures = [(row, problem) for row, problem, _ in results if problem]
+        by_expectation = {name: sum(row["expected"] == name for row in rows) for name in EXPECTATIONS}
+        logger.info(f"Search matrix: {len(rows)} term(s) in {seconds:.1f}s "
+                    f"(concurrency {concurrency}), {len(failures)} failed", also_console=True)
+        if failures:
+            details = "\n".join(f"- '{row['term']}' ({row['expected']}): {problem}"
+                                for row, problem in failures)
+            raise AssertionError(f"{len(failures)} of {len(rows)} search term(s) failed:\n{details}")
+        return {"terms": len(rows), "failed": 0, "seconds": round(seconds, 2),
+                "by_expectation": by_expectation}
+
+    @keyword("Get Search Matrix UI Sample")
+    def get_search_matrix_ui_sample(self, csv_path, size=3):
+        """Returns up to ``size`` rows marked ``ui_sample=yes`` as dictionaries
+        with ``term`` and ``expected``, for cross-checking through the UI."""
+        sample = [row for row in load_matrix(csv_path)
+                  if row.get("ui_sample", "").strip().lower() in ("yes", "true", "1")]
+        return [{"term": row["term"], "expected": row["expected"]} for row in sample[:int(size)]]
@@ -0,0 +1,189 @@
+"""
+StreamingJSON.py — Streaming validation of large JSON API payloads
+==================================================================
+Parses a JSON response incrementally and validates the elements of its
+result array (``products`` / ``data`` / ``items``) one at a time, as they
+arrive from the socket. Validation stops at the first bad item, and memory
+stays bounded by chunk size + largest single item, whatever the number of
+results.
+
+Why not ``GET On Session``?
+    RequestsLibrary logs ``response.text`` for every request, which reads
+    the whole body into memory. This library sends the request itself,
+    through the same session (headers, auth, verify), with ``stream=True``.
+
+Usage in Robot Framework:
+    ${count}=    Stream Validate Items On Session    ${API_SESSION_ALIAS}
+    ...    ${API_SEARCH_ENDPOINT}    params=${params}    required_fields=name,price
+"""
+
+import codecs
+import json
+import re
+
+from robot.api import logger
+from robot.api.deco import keyword, library
+from robot.libraries.BuiltIn import BuiltIn
+
+
+DEFAULT_ITEM_KEYS = "products,data,items"
+DEFAULT_REQUIRED_FIELDS = "name,price"
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_SEPARATORS = re.compile(r"[\s,]*")
+
+
+class JSONItemStream:
+    """Yields the elements of the first item array found in a JSON text stream.
+
+    Args:
+        chunks (iterable): Byte (or str) chunks of the JSON document
+        item_keys (iterable): Keys whose array value holds the items
+    """
+
+    def __init__(self, chunks, item_keys):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        keys = "|".join(re.escape(key) for key in item_keys)
+        self._array_start = re.compile(r'(?<!\\)"(?:%s)"\s*:\s*\[' % keys)
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self.found = False
+        self.bytes_read = 0
+        self.peak_buffer = 0
+
+    def _read(self):
+        """Append the next chunk to the unconsumed buffer; return False at end of stream."""
+        if self._eof:
+            return False
+        try:
+            chunk = next(self._chunks)
+        except StopIteration:
+            self._eof = True
+            self._buffer = self._buffer[self._pos:] + self._decoder.decode(b"", final=True)
+            self._pos = 0
+            return False
+        self.bytes_read += len(chunk)
+        if isinstance(chunk, bytes):
+            chunk = self._decoder.decode(chunk)
+        # Drop consumed input only when new data arrives, not after every item
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        self.peak_buffer = max(self.peak_buffer, len(self._buffer))
+        return True
+
+    def _seek_array(self):
+        """Discard input up to and including the opening '[' of the item array."""
+        while True:
+            match = self._array_start.search(self._buffer)
+            if match:
+                self._pos = match.end()
+                return True
+            # Keep a short tail in case the key is split across two chunks
+            self._pos = max(len(self._buffer) - 64, 0)
+            if not self._read():
+                return False
+
+    def __iter__(self):
+        if not self._seek_array():
+            return
+        self.found = True
+        while True:
+            self._pos = _SEPARATORS.match(self._buffer, self._pos).end()
+            if self._pos == len(self._buffer):
+                if not self._read():
+                    raise ValueError("Unexpected end of JSON inside item array")
+                continue
+            if self._buffer[self._pos] == "]":
+                return
+            try:
+                item, end = self._json.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._read():
+                    raise ValueError("Malformed JSON item in response array")
+                continue
+            if end == len(self._buffer) and not self._eof:
+                # A scalar may be cut at the chunk edge (e.g. 12|3); read more first
+                if self._read():
+                    continue
+            self._pos = end
+            yield item
+
+
+def check_item(item, required_fields):
+    """Return a violation message for one result item, or None if it is valid."""
+    if not isinstance(item, dict):
+        return f"expected an object but got {type(item).__name__}"
+    missing = [field for field in required_fields if field not in item]
+    if missing:
+        return f"missing required field(s): {', '.join(missing)}"
+    if "price" in item:
+        try:
+            price = float(str(item["price"]).replace(",", ""))
+        except ValueError:
+            return f"price is not numeric: {item['price']!r}"
+        if price <= 0:
+            return f"price must be > 0 but was {item['price']!r}"
+    return None
+
+
+@library(scope="GLOBAL", auto_keywords=False)
+class StreamingJSON:
+    """Keyword library for constant-memory validation of large item arrays."""
+
+    # ============================================================
+    # KEYWORDS
+    # ============================================================
+
+    @keyword("Stream Validate Items On Session")
+    def stream_validate_items_on_session(self, alias, uri, params=None,
+                                         required_fields=DEFAULT_REQUIRED_FIELDS,
+                                         item_keys=DEFAULT_ITEM_KEYS,
+                                         chunk_size=DEFAULT_CHUNK_SIZE):
+        """Streams GET ``uri`` on RequestsLibrary session ``alias`` and validates each item.
+
+        Every item must contain ``required_fields`` (comma separated) and,
+        if it has a ``price``, the price must be > 0. Fails on the first
+        violating item without reading the rest of the body. Returns the
+        number of validated items.
+        """
+        requests_lib = BuiltIn().get_library_instance("RequestsLibrary")
+        session = requests_lib._cache.switch(alias)
+        url = f"{session.url.rstrip('/')}/{uri.lstrip('/')}"
+
+        response = session.get(url, params=params, stream=True,
+                               timeout=requests_lib._get_timeout(None))
+        try:
+            if not 200 <= response.status_code < 300:
+                raise AssertionError(f"Expected 2xx for streamed GET {uri} but got {response.status_code}")
+            stream = JSONItemStream(
+                response.iter_content(chunk_size=int(chunk_size)),
+                [key.strip() for key in item_keys.split(",")],
+            )
+            count = self._validate(stream, [f.strip() for f in required_fields.split(",") if f.strip()])
+        finally:
+            response.close()
+
+        logger.info(f"Streamed {count} item(s) from {uri}: {stream.bytes_read} bytes read, "
+                    f"peak buffer {stream.peak_buffer} chars")
+        return count
+
+    # ============================================================
+    # INTERNALS
+    # ============================================================
+
+    @staticmethod
+    def _validate(stream, required_fields):
+        count = 0
+        try:
+            for count, item in enumerate(stream, start=1):
+                problem = check_item(item, required_fields)
+                if problem:
+                    raise AssertionError(f"Item #{count - 1} is invalid: {problem}")
+        except ValueError as error:
+            raise AssertionError(f"Response is not valid JSON: {error}")
+        if not stream.found:
+            raise AssertionError("Response has no 'products'/'data'/'items' array to validate")
+        return count
@@ -0,0 +1,353 @@
+"""
+TestDataFactory.py — Unique signup identities, leased accounts and bulk cart cleanup
+====================================================================================
+Parallel suites must not share mutable test data: two workers logging in
+with ``${VALID_USERNAME}`` or filling the cart of the same product step on
+each other, and signup needs an email and phone number nobody used before.
+
+Unique identities: every robot process pre-generates a pool of signup
+identities (name, email, phone, password) when the library is imported
+and refills it in batches. Uniqueness comes from the run id, the process
+number and a counter, never from a shared registry:
+
+    email   <local>+<run>.p<process>.<n>@<domain>
+    phone   9 + 5 digits of the run + 4 digit sequence
+
+The run digits are the run's start minute (a clock run id), so phone
+numbers only repeat after about 69 days, or for two runs started in the
+same minute; other run ids are hashed. The 10000 sequences of a run are
+split between its processes like the leases below, and running out of
+them fails instead of reusing a number.
+
+Leases: the shared accounts (``TEST_ACCOUNTS``, ``email:password``) and
+cart products (``CART_TEST_PRODUCT_IDS``) are split between the workers up
+front (worker ``i`` of ``n`` owns items ``i, i+n, i+2n, ...``), so workers
+never wait for each other. A worker is one of the robot processes running
+at the same time; processes that run one after another reuse its number.
+Within a worker, a lease is a ``deque`` pop and a release an append —
+atomic in CPython, so keywords called from threads need no lock either. A
+lease taken in a test ends with the test, one taken in a suite setup ends
+with the suite. With fewer items than workers, every worker gets one
+shared item (tools/orchestrate.py reports the shortage once per run).
+
+Cart cleanup: ``Track Cart Item`` records every product added through the
+API and ``Untrack Cart Item`` forgets one a test removed itself. ``Clean Up
+Carts On Session`` removes the rest in one concurrent batch at suite
+teardown, instead of one blocking request per test.
+
+The run id comes from ``$BOODMO_RUN_ID`` (tools/orchestrate.py sets one for
+all its suites, together with the worker and process numbers), else from
+the clock.
+
+Usage in Robot Framework:
+    Library    ${CURDIR}${/}..${/}libraries${/}TestDataFactory.py
+    ...    worker=${TEST_DATA_WORKER}    workers=${TEST_DATA_WORKERS}
+    ...    process=${TEST_DATA_PROCESS}    processes=${TEST_DATA_PROCESSES}
+    ...    accounts=${TEST_ACCOUNTS}    products=${CART_TEST_PRODUCT_IDS}
+    &{user}=    Get Unique Identity
+    &{account}=    Lease Account
+    ${product_id}=    Lease Cart Product
+"""
+
+import hashlib
+import itertools
+import os
+import secrets
+import string
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from robot.api import logger
+from robot.api.deco import keyword, library
+from robot.libraries.BuiltIn import BuiltIn
+
+
+DEFAULT_POOL_SIZE = 100
+RUN_DIGITS = 100000
+PHONE_SEQUENCES = 10000
+BASE36 = string.digits + string.ascii_lowercase
+
+
+def new_run_id():
+    """Six base-36 characters of the current time in seconds."""
+    value, digits = int(time.time()), []
+    while value:
+        value, digit = divmod(value, 36)
+        digits.append(BASE36[digit])
+    return "".join(reversed(digits))[-6:]
+
+
+def letters(number):
+    """0 -> a, 25 -> z, 26 -> ba: names that only accept letters."""
+    text = ""
+    while True:
+        number, digit = divmod(number, 26)
+        text = string.ascii_lowercase[digit] + text
+        if not number:
+            return text
+
+
+def run_digits(run_id):
+    """Five phone digits for a run: the start minute of a clock run id
+    (see ``new_run_id``), else a hash of the run id."""
+    if run_id and all(char in BASE36 for char in run_id.lower()):
+        return int(run_id.lower(), 36) // 60 % RUN_DIGITS
+    return int(hashlib.sha1(run_id.encode("utf-8")).hexdigest(), 16) % RUN_DIGITS
+
+
+def make_identity(run_id, process, processes, number, domain, local_part="qa"):
+    """Signup identity ``number`` of robot process ``process`` (of
+    ``processes``) in run ``run_id``. Fails when the run has no phone
+    sequence left for it."""
+    sequence = process + number * processes
+    if sequence >= PHONE_SEQUENCES:
+        raise AssertionError(f"All {PHONE_SEQUENCES} unique phone numbers of run {run_id} are used "
+                             f"by its {processes} process(es).")
+    tag = f"{run_id}.p{process}.{number}"
+    return {
+        "name": f"Test {letters(process).capitalize()} {letters(number).capitalize()}",
+        "email": f"{local_part}+{tag}@{domain}",
+        "phone": f"9{run_digits(run_id):05d}{sequence:04d}",
+        "password": f"Qa@{secrets.token_hex(4)}9",
+        "tag": tag,
+    }
+
+
+def parse_account(value):
+    """``email:password`` (or a dict with username/password) as a dict."""
+    if isinstance(value, dict):
+        return {"username": value["username"], "password": value["password"]}
+    username, separator, password = str(value).partition(":")
+    if not separator:
+        raise ValueError(f"Test account '{value}' must be 'email:password'")
+    return {"username": username, "password": password}
+
+
+def partition(items, worker, workers):
+    """This worker's share of ``items``: every ``workers``-th item from ``worker``.
+    Returns (items, shared)."""
+    if not items:
+        return [], False
+    if len(items) < workers:
+        return [items[worker % len(items)]], True
+    return items[worker::workers], False
+
+
+class LeasePool:
+    """Items owned by this worker, leased and released without a lock."""
+
+    def __init__(self, kind, items):
+        self.kind = kind
+        self.size = len(items)
+        self._free = deque(items)
+
+    def lease(self):
+        try:
+            return self._free.popleft()
+        except IndexError:
+            if not self.size:
+                raise AssertionError(
+                    f"No {self.kind} configured for this worker. Add some to the environment's "
+                    f"variable file."
+                ) from None
+            raise AssertionError(
+                f"No free {self.kind} left for this worker: all {self.size} are leased. "
+                f"Add more to the environment's variable file or release unused leases."
+            ) from None
+
+    def release(self, item):
+        self._free.append(item)
+
+    @property
+    def free(self):
+        return len(self._free)
+
+
+@library(scope="GLOBAL", auto_keywords=False)
+class TestDataFactory:
+    """Keyword library for unique test data and per-worker leases."""
+
+    ROBOT_LISTENER_API_VERSION = 3
+
+    def __init__(self, worker=0, workers=1, process=0, processes=1, accounts=None, products=None,
+                 pool_size=DEFAULT_POOL_SIZE, email_domain="example.com"):
+        """
+        Args:
+            worker (int): This worker's number, 0 to workers - 1
+            workers (int): Number of robot processes running at the same time
+            process (int): Number of this robot process, unique in the run
+            processes (int): Number of robot processes in the run
+            accounts (list): Shared accounts as ``email:password``
+            products (list): Product IDs safe for cart tests
+            pool_size (int): Identities generated per batch
+            email_domain (str): Domain of generated emails
+        """
+        self.worker = int(worker)
+        self.workers = max(int(workers), 1)
+        self.process = int(process)
+        self.processes = max(int(processes), self.process + 1)
+        self.pool_size = int(pool_size)
+        self.email_domain = email_domain
+        self.run_id = os.environ.get("BOODMO_RUN_ID") or new_run_id()
+        self.accounts = self._lease_pool("test account", [parse_account(item) for item in accounts or []])
+        self.products = self._lease_pool("cart product", [str(item) for item in products or []])
+        self._counter = itertools.count()
+        self._identities = deque()
+        self._refill()
+        # Leases per scope, innermost last: [[(pool, item), ...], ...]
+        self._scopes = [[]]
+        self._cart_items = set()
+        self.ROBOT_LIBRARY_LISTENER = self
+
+    # ============================================================
+    # KEYWORDS
+    # ============================================================
+
+    @keyword("Get Unique Identity")
+    def get_unique_identity(self):
+        """Returns a signup identity never handed out before in this run:
+        a dictionary with ``name``, ``email``, ``phone`` and ``password``.
+
+        Example:
+            &{user}=    Get Unique Identity
+            Enter Registration Details    ${user.name}    ${user.email}
+            ...    ${user.phone}    ${user.password}    ${user.password}
+        """
+        if not self._identities:
+            self._refill()
+        identity = self._identities.popleft()
+        logger.info(f"Unique identity {identity['tag']}: {identity['email']} / {identity['phone']}")
+        return dict(identity)
+
+    @keyword("Lease Account")
+    def lease_account(self):
+        """Returns one of this worker's test accounts (``username``,
+        ``password``) for the current test, or suite when called in a suite
+        setup. Fails when all of them are leased.
+        """
+        account = self._lease(self.accounts)
+        logger.info(f"Leased test account {account['username']}")
+        return dict(account)
+
+    @keyword("Release Account")
+    def release_account(self, account):
+        """Returns ``account`` to the pool before its test or suite ends."""
+        self._release(self.accounts, parse_account(account))
+
+    @keyword("Lease Cart Product")
+    def lease_cart_product(self):
+        """Returns one of this worker's cart product IDs for the current
+        test, or suite when called in a suite setup.
+        """
+        product_id = self._lease(self.products)
+        logger.info(f"Leased cart product {product_id}")
+        return product_id
+
+    @keyword("Release Cart Product")
+    def release_cart_product(self, product_id):
+        """Returns ``product_id`` to the pool before its test or suite ends."""
+        self._release(self.products, str(product_id))
+
+    @keyword("Track Cart Item")
+    def track_cart_item(self, product_id):
+        """Records a product added to the cart, for ``Clean Up Carts On Session``."""
+        self._cart_items.add(str(product_id))
+
+    @keyword("Untrack Cart Item")
+    def untrack_cart_item(self, product_id):
+        """Forgets a product that was removed from the cart already."""
+        self._cart_items.discard(str(product_id))
+
+    @keyword("Clean Up Carts On Session")
+    def clean_up_carts_on_session(self, alias, uri, concurrency=8):
+        """Sends POST ``uri`` with ``{"product_id": ...}`` on session ``alias``
+        for every tracked cart item, at most ``concurrency`` at a time.
+
+        Cleanup never fails the teardown: items that could not be removed
+        are reported as a warning. Returns the number of removed items.
+        """
+        items = sorted(self._cart_items)
+        self._cart_items.clear()
+        if not items:
+            return 0
+        requests_lib = BuiltIn().get_library_instance("RequestsLibrary")
+        session = requests_lib._cache.switch(alias)
+        url = f"{session.url.rstrip('/')}/{uri.lstrip('/')}"
+        timeout = requests_lib._get_timeout(None)
+
+        def remove(product_id):
+            try:
+                response = session.post(url, json={"product_id": product_id}, timeout=timeout)
+            except Exception as error:
+                return product_id, f"{type(error).__name__}: {error}"
+            return product_id, None if response.status_code < 400 else f"status {response.status_code}"
+
+        started = time.monotonic()
+        # Logging from worker threads is not supported: collect, then log here
+        with ThreadPoolExecutor(max_workers=max(min(int(concurrency), len(items)), 1)) as pool:
+            results = list(pool.map(remove, items))
+        failures = [(product_id, problem) for product_id, problem in results if problem]
+        logger.info(f"Cart cleanup: {len(items) - len(failures)} of {len(items)} item(s) removed "
+                    f"in {time.monotonic() - started:.2f}s")
+        if failures:
+            logger.warn("Cart cleanup could not remove: "
+                        + ", ".join(f"{product_id} ({problem})" for product_id, problem in failures))
+        return len(items) - len(failures)
+
+    # ============================================================
+    # LISTENER
+    # ============================================================
+
+    def start_suite(self, data, result):
+        self._scopes.append([])
+
+    def end_suite(self, data, result):
+        self._end_scope()
+
+    def start_test(self, data, result):
+        self._scopes.append([])
+
+    def end_test(self, data, result):
+        self._end_scope()
+
+    # ============================================================
+    # INTERNALS
+    # ============================================================
+
+    def _lease_pool(self, kind, items):
+        owned, shared = partition(items, self.worker, self.workers)
+        if shared:
+            logger.info(f"Only {len(items)} {kind}(s) for {self.workers} workers: "
+                        f"worker {self.worker} shares one with other workers.")
+        return LeasePool(kind, owned)
+
+    def _refill(self):
+        """Generates the next batch; fails when the first one is out of range."""
+        for index in range(self.pool_size):
+            number = next(self._counter)
+            try:
+                identity = make_identity(self.run_id, self.process, self.processes, number,
+                                         self.email_domain)
+            except AssertionError:
+                if index:
+                    return
+                raise
+            self._identities.append(identity)
+
+    def _lease(self, pool):
+        item = pool.lease()
+        self._scopes[-1].append((pool, item))
+        return item
+
+    def _release(self, pool, item):
+        for scope in reversed(self._scopes):
+            if (pool, item) in scope:
+                scope.remove((pool, item))
+                pool.release(item)
+                return
+        raise AssertionError(f"{item} is not leased.")
+
+    def _end_scope(self):
+        for pool, item in self._scopes.pop() if len(self._scopes) > 1 else []:
+            pool.release(item)
@@ -0,0 +1,179 @@
+"""
+WaitPolicy.py — Explicit polling without the implicit wait, and wait accounting
+================================================================================
+``Open Browser To Boodmo`` sets an implicit wait of ``${IMPLICIT_WAIT}``
+(10s). Every element lookup that finds nothing pays it in full. Absence
+checks and "is it there?" probes therefore take at least 10s when they
+succeed, and a ``timeout=5s`` wait for a missing element really takes 10s+.
+
+The keywords of this library switch the implicit wait to 0 while they run
+and poll explicitly every ``poll_interval`` instead:
+
+    Poll Until Element Visible    fails when not visible within ``timeout``
+    Poll Until Element Absent     passes once nothing matching is visible
+    Probe Element Visible         returns True/False, never fails
+
+Wait accounting: the library is also a listener. It times every wait
+keyword of a test (``Wait Until ...``/``Wait For ...`` keywords, ``Sleep``
+and the keywords above). A wait inside another wait counts once, under
+the outer name. ``Log Wait Time Breakdown`` (called by ``End Test``) logs
+where the test's wait budget went; ``Close Browser Session`` logs the
+suite total.
+
+Usage in Robot Framework:
+    Library    ${CURDIR}${/}..${/}libraries${/}WaitPolicy.py    ${WAIT_POLL_INTERVAL}
+    Poll Until Element Absent    ${LOGIN_ERROR_MSG}    timeout=2s
+    ${visible}=    Probe Element Visible    ${LOGIN_PASSWORD_INPUT}    timeout=5s
+"""
+
+import time
+from contextlib import contextmanager
+
+from robot.api import logger
+from robot.api.deco import keyword, library
+from robot.libraries.BuiltIn import BuiltIn
+from robot.utils import secs_to_timestr, timestr_to_secs
+from selenium.common.exceptions import StaleElementReferenceException, WebDriverException
+
+
+# Keywords whose time is counted as waiting (library and user keywords)
+WAIT_KEYWORDS = ("Sleep", "Wait For Condition")
+WAIT_PREFIXES = ("Wait Until ", "Wait For ", "Poll Until ", "Probe ")
+
+
+def is_wait_keyword(name):
+    return name.startswith(WAIT_PREFIXES) or name in WAIT_KEYWORDS
+
+
+def format_breakdown(breakdown, total=None):
+    """Text table of {keyword: [calls, seconds]}, longest first."""
+    waited = sum(seconds for _, seconds in breakdown.values())
+    share = f" of {total:.2f}s ({waited / total:.0%})" if total else ""
+    lines = [f"Time spent waiting: {waited:.2f}s{share}"]
+    for name, (calls, seconds) in sorted(breakdown.items(), key=lambda item: -item[1][1]):
+        lines.append(f"  {seconds:8.2f}s  {calls:4d}x  {name}")
+    return "\n".join(lines)
+
+
+@library(scope="GLOBAL", auto_keywords=False)
+class WaitPolicy:
+    """Keyword library for zero-implicit-wait polling and wait time accounting."""
+
+    ROBOT_LISTENER_API_VERSION = 3
+
+    def __init__(self, poll_interval="0.2s"):
+        """
+        Args:
+            poll_interval (str): Default delay between two checks
+        """
+        self.poll_interval = timestr_to_secs(poll_interval)
+        self.ROBOT_LIBRARY_LISTENER = self
+        # Per test and per suite: {keyword name: [calls, seconds]}
+        self._test = {}
+        self._suite = {}
+        self._test_started = self._suite_started = time.monotonic()
+        self._started = []
+
+    # ============================================================
+    # KEYWORDS
+    # ============================================================
+
+    @keyword("Poll Until Element Visible")
+    def poll_until_element_visible(self, locator, timeout="15s", poll_interval=None):
+        """Waits until ``locator`` is visible, checking every ``poll_interval``
+        with the implicit wait off. Fails after ``timeout``."""
+        if not self._poll(locator, True, timeout, poll_interval):
+            raise AssertionError(f"Element '{locator}' not visible after "
+                                 f"{secs_to_timestr(timestr_to_secs(timeout))}.")
+
+    @keyword("Poll Until Element Absent")
+    def poll_until_element_absent(self, locator, timeout="0s", poll_interval=None):
+        """Passes as soon as no element matching ``locator`` is visible (not in
+        the DOM or hidden). ``timeout=0s`` checks exactly once, without
+        paying the implicit wait for the missing element."""
+        if not self._poll(locator, False, timeout, poll_interval):
+            raise AssertionError(f"Element '{locator}' still visible after "
+                                 f"{secs_to_timestr(timestr_to_secs(timeout))}.")
+
+    @keyword("Probe Element Visible")
+    def probe_element_visible(self, locator, timeout="0s", poll_interval=None):
+        """Returns True when ``locator`` becomes visible within ``timeout``,
+        False otherwise. Replaces ``Run Keyword And Return Status`` around
+        ``Wait Until Element Is Visible``, which pays the implicit wait."""
+        return self._poll(locator, True, timeout, poll_interval)
+
+    @keyword("Log Wait Time Breakdown")
+    def log_wait_time_breakdown(self, scope="test"):
+        """Logs where the wait time of the current test (``scope=test``) or
+        of the suite so far (``scope=suite``) went, and returns it as
+        {keyword: [calls, seconds]}."""
+        suite = scope.lower() == "suite"
+        breakdown, started = (self._suite, self._suite_started) if suite else (self._test, self._test_started)
+        breakdown = {name: [calls, round(seconds, 3)] for name, (calls, seconds) in breakdown.items()}
+        logger.info(format_breakdown(breakdown, time.monotonic() - started))
+        return breakdown
+
+    # ============================================================
+    # LISTENER — wait accounting
+    # ============================================================
+
+    def start_suite(self, data, result):
+        self._suite = {}
+        self._suite_started = time.monotonic()
+
+    def start_test(self, data, result):
+        self._test = {}
+        self._test_started = time.monotonic()
+
+    def start_keyword(self, data, result):
+        self._started.append((time.monotonic(), is_wait_keyword(result.name)))
+
+    def end_keyword(self, data, result):
+        started, waiting = self._started.pop()
+        # Only the outermost wait is counted, e.g. "Wait Until Page Is Loaded"
+        # and not also the SeleniumLibrary wait inside it
+        if not waiting or any(outer for _, outer in self._started):
+            return
+        seconds = time.monotonic() - started
+        for breakdown in (self._test, self._suite):
+            entry = breakdown.setdefault(result.name, [0, 0.0])
+            entry[0] += 1
+            entry[1] += seconds
+
+    # ============================================================
+    # INTERNALS
+    # ============================================================
+
+    @contextmanager
+    def _no_implicit_wait(self):
+        selenium = BuiltIn().get_library_instance("SeleniumLibrary")
+        driver = selenium.driver
+        driver.implicitly_wait(0)
+        try:
+            yield selenium
+        finally:
+            driver.implicitly_wait(selenium.implicit_wait)
+
+    def _poll(self, locator, visible, timeout, poll_interval):
+        """True once any element matching ``locator`` is visible (``visible``)
+        or none is (not ``visible``), False after ``timeout``."""
+        interval = timestr_to_secs(poll_interval) if poll_interval else self.poll_interval
+        deadline = time.monotonic() + timestr_to_secs(timeout)
+        with self._no_implicit_wait() as selenium:
+            while True:
+                if self._is_visible(selenium, locator) == visible:
+                    return True
+                if time.monotonic() >= deadline:
+                    return False
+                time.sleep(min(interval, max(deadline - time.monotonic(), 0)))
+
+    @staticmethod
+    def _is_visible(selenium, locator):
+        try:
+            return any(element.is_displayed() for element in selenium.find_elements(locator))
+        except StaleElementReferenceException:
+            # Re-rendered by Angular between lookup and check: unknown, look again
+            return None
+        except WebDriverException as error:
+            logger.debug(f"Visibility check of '{locator}' failed: {error}")
+            return None
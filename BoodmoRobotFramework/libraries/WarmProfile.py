@@ -0,0 +1,227 @@
+"""
+WarmProfile.py — Pre-warmed browser cache profiles
+===================================================
+Launches browsers with a disk cache that already holds Boodmo's JS bundles
+and CSS, so static assets come from local disk instead of the network.
+
+How it works:
+    1. A template profile lives under <profile_root>/<browser>-template.
+       It is refreshed ONCE per run (keyed by run id): a headless browser
+       loads the warm-up URLs, then everything except the HTTP/code cache
+       is pruned (no cookies or storage leak into tests).
+    2. Every browser session gets its own clone of the template. The clone
+       is copy-on-write where the filesystem supports it (reflink on Linux,
+       clonefile on macOS) and a plain copy otherwise.
+    3. The template is read-mostly: only the refresh step writes to it,
+       under a lock file, so parallel workers can clone concurrently.
+
+Supported browsers: chrome, edge (Chromium profiles). Firefox copies its
+profile into a temp dir on every launch, so it is left on a cold cache.
+
+Usage in Robot Framework:
+    &{args}=    Get Warm Profile Arguments    ${BROWSER}    ${driver_path}    ${BASE_URL}
+    Open Browser    ${BASE_URL}    ${BROWSER}    &{args}
+    ...
+    Release Warm Profile
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import time
+from datetime import date
+
+from robot.api import logger
+from robot.api.deco import keyword, library
+
+
+DEFAULT_PROFILE_ROOT = os.path.join(os.path.expanduser("~"), ".boodmo", "profiles")
+
+CHROMIUM_BROWSERS = {
+    "chrome": "chrome",
+    "googlechrome": "chrome",
+    "gc": "chrome",
+    "headlesschrome": "chrome",
+    "edge": "edge",
+}
+
+# Only these template paths survive the post-warm-up prune
+CACHE_PATHS = (
+    os.path.join("Default", "Cache"),
+    os.path.join("Default", "Code Cache"),
+)
+
+RUN_MARKER = "warm_run_id.txt"
+LOCK_STALE_SECONDS = 600
+
+
+def _clone_tree(source, target):
+    """Copy a directory tree, using copy-on-write clones where available."""
+    if sys.platform.startswith("linux"):
+        cmd = ["cp", "-a", "--reflink=auto", source, target]
+    elif sys.platform == "darwin":
+        cmd = ["cp", "-c", "-R", source, target]
+    else:
+        cmd = None
+    if cmd and subprocess.run(cmd, stderr=subprocess.DEVNULL).returncode == 0:
+        return
+    shutil.rmtree(target, ignore_errors=True)
+    shutil.copytree(source, target)
+
+
+@library(scope="GLOBAL", auto_keywords=False)
+class WarmProfile:
+    """Keyword library that hands out per-session clones of a warm profile."""
+
+    def __init__(self, profile_root=None, run_id=None):
+        """
+        Args:
+            profile_root (str): Directory for templates and clones
+                                (default: ~/.boodmo/profiles)
+            run_id (str): Identifies the run; the template is refreshed once
+                          per run id (default: $BUILD_TAG, else today's date)
+        """
+        self.profile_root = os.path.abspath(profile_root or DEFAULT_PROFILE_ROOT)
+        self.run_id = run_id or os.environ.get("BUILD_TAG") or date.today().isoformat()
+        self._clones = []
+
+    # ============================================================
+    # KEYWORDS
+    # ============================================================
+
+    @keyword("Get Warm Profile Arguments")
+    def get_warm_profile_arguments(self, browser, driver_path, *warm_urls):
+        """Returns ``Open Browser`` arguments that start ``browser`` on a warm clone.
+
+        Refreshes the template first (using ``driver_path`` and ``warm_urls``)
+        if this run has not done so yet. Returns an empty dictionary for
+        browsers without warm profile support.
+        """
+        kind = CHROMIUM_BROWSERS.get(str(browser).lower().replace(" ", ""))
+        if not kind:
+            logger.info(f"Warm cache profile not supported for '{browser}', using a cold profile")
+            return {}
+
+        template = self.refresh_warm_profile_template(browser, driver_path, *warm_urls)
+        clone = os.path.join(self.profile_root, "clones", f"{kind}-{os.getpid()}-{len(self._clones)}")
+        shutil.rmtree(clone, ignore_errors=True)
+        os.makedirs(os.path.dirname(clone), exist_ok=True)
+
+        start = time.perf_counter()
+        _clone_tree(template, clone)
+        self._clones.append(clone)
+        logger.info(f"Warm profile cloned to {clone} in {time.perf_counter() - start:.3f}s")
+
+        user_data_dir = clone.replace("\\", "/")
+        return {"options": f'add_argument("--user-data-dir={user_data_dir}")'}
+
+    @keyword("Refresh Warm Profile Template")
+    def refresh_warm_profile_template(self, browser, driver_path, *warm_urls, force=False):
+        """Warms the template profile for ``browser`` once per run id.
+
+        Only one worker performs the refresh; others wait on the lock and
+        then reuse the freshly written template.
+        """
+        kind = CHROMIUM_BROWSERS[str(browser).lower().replace(" ", "")]
+        template = os.path.join(self.profile_root, f"{kind}-template")
+        if not force and self._template_run_id(template) == self.run_id:
+            return template
+
+        lock = f"{template}.lock"
+        self._acquire_lock(lock)
+        try:
+            # Another worker may have refreshed while we waited for the lock
+            if force or self._template_run_id(template) != self.run_id:
+                self._warm_template(kind, template, driver_path, warm_urls)
+        finally:
+            os.remove(lock)
+        return template
+
+    @keyword("Release Warm Profile")
+    def release_warm_profile(self):
+        """Deletes the profile clones handed out by this process."""
+        while self._clones:
+            shutil.rmtree(self._clones.pop(), ignore_errors=True)
+
+    # ============================================================
+    # TEMPLATE INTERNALS
+    # ============================================================
+
+    @staticmethod
+    def _template_run_id(template):
+        try:
+            with open(os.path.join(template, RUN_MARKER), encoding="utf-8") as handle:
+                return handle.read().strip()
+        except OSError:
+            return None
+
+    @staticmethod
+    def _acquire_lock(lock):
+        os.makedirs(os.path.dirname(lock), exist_ok=True)
+        while True:
+            try:
+                os.close(os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                return
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(lock) > LOCK_STALE_SECONDS:
+                        os.remove(lock)
+                        continue
+                except OSError:
+                    continue
+                time.sleep(0.5)
+
+    def _warm_template(self, kind, template, driver_path, warm_urls):
+        """Load the warm-up URLs in a headless browser, then prune to cache only."""
+        from selenium import webdriver
+
+        staging = f"{template}.staging"
+        shutil.rmtree(staging, ignore_errors=True)
+        os.makedirs(staging)
+
+        start = time.perf_counter()
+        if kind == "edge":
+            options = webdriver.EdgeOptions()
+            service = webdriver.EdgeService(executable_path=driver_path)
+            factory = webdriver.Edge
+        else:
+            options = webdriver.ChromeOptions()
+            service = webdriver.ChromeService(executable_path=driver_path)
+            factory = webdriver.Chrome
+        options.add_argument("--headless=new")
+        options.add_argument(f"--user-data-dir={staging}")
+
+        driver = factory(options=options, service=service)
+        try:
+            for url in warm_urls:
+                driver.get(url)
+        finally:
+            driver.quit()
+
+        self._prune_to_cache(staging)
+        with open(os.path.join(staging, RUN_MARKER), "w", encoding="utf-8") as handle:
+            handle.write(self.run_id)
+
+        shutil.rmtree(template, ignore_errors=True)
+        os.replace(staging, template)
+        logger.console(f"Warm profile template refreshed for run '{self.run_id}' "
+                       f"in {time.perf_counter() - start:.1f}s")
+
+    @staticmethod
+    def _prune_to_cache(profile_dir):
+        """Remove everything except the HTTP and code caches."""
+        keep = {os.path.normpath(os.path.join(profile_dir, path)) for path in CACHE_PATHS}
+        for root, dirs, files in os.walk(profile_dir, topdown=True):
+            root = os.path.normpath(root)
+            if root in keep:
+                dirs[:] = []
+                continue
+            for name in files:
+                os.remove(os.path.join(root, name))
+            # Only descend into directories that lead to a kept cache path
+            for name in list(dirs):
+                path = os.path.join(root, name)
+                if not any(k == path or k.startswith(path + os.sep) for k in keep):
+                    shutil.rmtree(path, ignore_errors=True)
+                    dirs.remove(name)
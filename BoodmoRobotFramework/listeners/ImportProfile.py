@@ -0,0 +1,188 @@
+"""
+ImportProfile.py — Per-library and per-resource startup cost of every suite
+===========================================================================
+Robot Framework listener (API v3) that times every library, resource and
+variable file import of every suite:
+
+    seconds     inclusive time, e.g. common.robot with all its imports
+    self        the import itself, without nested imports
+    load        for libraries: importing the module (the rest of
+                ``self`` is creating the instance and its keywords)
+
+Imports run before a suite's ``start_suite`` listener call, so the listener
+wraps Robot's import entry points (``Namespace._import_library``,
+``_import_resource``, ``_import_variables`` and ``TestLibrary.from_name``)
+for the run and attributes each import to the suite being started. A
+library or resource that another suite already imported shows up with the
+(small) cost of the cache lookup.
+
+Lazy libraries (libraries/LazyLibrary.py) are reported once, under the
+library import that created them, with the import cost they deferred and
+the cost of the proxy itself. A proxy whose real library was still not
+loaded when its suite ended counts the difference as startup time saved
+for that suite.
+
+The report is written to ``import_profile.json`` in the output directory
+and the most expensive imports are printed at the end of the run.
+
+Arguments:
+    top     Number of imports printed at the end (default: 10)
+
+Usage:
+    robot --listener listeners/ImportProfile.py --dryrun tests/
+"""
+
+import json
+import os
+import sys
+import time
+
+from robot.api import logger
+from robot.libraries.BuiltIn import BuiltIn
+from robot.running.context import EXECUTION_CONTEXTS
+from robot.running.namespace import Namespace
+from robot.running.testlibraries import TestLibrary
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "libraries"))
+import LazyLibrary  # noqa: E402
+
+
+REPORT_FILE = "import_profile.json"
+KINDS = {"_import_library": "library", "_import_resource": "resource", "_import_variables": "variables"}
+
+
+class ImportProfile:
+    ROBOT_LISTENER_API_VERSION = 3
+
+    def __init__(self, top=10):
+        self.top = int(top)
+        # {suite: {"imports": [...], "lazy": [...]}}
+        self.suites = {}
+        self._frames = []
+        # LazyLibrary.PROXIES up to this index are already credited to a suite
+        self._credited = 0
+        self._originals = {}
+        self._output_dir = None
+        self._patch()
+
+    # ============================================================
+    # LISTENER METHODS
+    # ============================================================
+
+    def start_suite(self, data, result):
+        if self._output_dir is None:
+            self._output_dir = BuiltIn().get_variable_value("${OUTPUT DIR}") or "."
+
+    def end_suite(self, data, result):
+        suite = self._suite(result.full_name)
+        top_level = [entry for entry in suite["imports"] if entry["depth"] == 0]
+        suite["import_seconds"] = round(sum(entry["seconds"] for entry in top_level), 4)
+        for entry in suite["lazy"]:
+            entry["loaded"] = entry["proxy"].loaded
+        suite["saved_seconds"] = round(sum(entry["proxy"].saved_seconds for entry in suite["lazy"]
+                                           if not entry["loaded"]), 4)
+
+    def close(self):
+        self._unpatch()
+        if not self.suites:
+            return
+        report = {name: {**suite, "lazy": [{key: value for key, value in entry.items() if key != "proxy"}
+                                            for entry in suite["lazy"]]}
+                  for name, suite in self.suites.items()}
+        with open(os.path.join(self._output_dir or ".", REPORT_FILE), "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+        logger.console(self._summary(report))
+
+    # ============================================================
+    # IMPORT TIMING
+    # ============================================================
+
+    def _patch(self):
+        for method in KINDS:
+            original = getattr(Namespace, method)
+            self._originals[(Namespace, method)] = original
+            setattr(Namespace, method, self._timed(KINDS[method], original))
+        from_name = TestLibrary.from_name
+        self._originals[(TestLibrary, "from_name")] = TestLibrary.__dict__["from_name"]
+
+        def timed_from_name(cls, *args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return from_name(*args, **kwargs)
+            finally:
+                if self._frames:
+                    self._frames[-1]["load"] += time.perf_counter() - started
+
+        TestLibrary.from_name = classmethod(timed_from_name)
+
+    def _unpatch(self):
+        for (owner, name), original in self._originals.items():
+            setattr(owner, name, original)
+        self._originals = {}
+
+    def _timed(self, kind, original):
+        profile = self
+
+        def timed(namespace, import_setting, *args, **kwargs):
+            frame = {"children": 0.0, "load": 0.0}
+            profile._frames.append(frame)
+            started = time.perf_counter()
+            try:
+                return original(namespace, import_setting, *args, **kwargs)
+            finally:
+                seconds = time.perf_counter() - started
+                profile._frames.pop()
+                if profile._frames:
+                    profile._frames[-1]["children"] += seconds
+                profile._record(kind, namespace, import_setting, seconds, frame)
+
+        return timed
+
+    def _record(self, kind, namespace, import_setting, seconds, frame):
+        context = EXECUTION_CONTEXTS.current
+        suite = self._suite(context.suite.full_name if context else "")
+        try:
+            name = namespace.variables.replace_string(import_setting.name)
+        except Exception:
+            name = import_setting.name
+        entry = {
+            "kind": kind, "name": os.path.basename(name),
+            "args": [str(arg) for arg in import_setting.args],
+            "importer": str(import_setting.source or ""),
+            "depth": len(self._frames),
+            "seconds": round(seconds, 4),
+            "self": round(seconds - frame["children"], 4),
+        }
+        if kind == "library":
+            entry["load"] = round(frame["load"], 4)
+        suite["imports"].append(entry)
+        if kind != "library":
+            return
+        # Proxies are created inside their own library import, which is
+        # recorded before the enclosing resource imports
+        for proxy in LazyLibrary.PROXIES[self._credited:]:
+            suite["lazy"].append({"library": proxy.library, "deferred_seconds": proxy.deferred_seconds,
+                                  "init_seconds": round(proxy.init_seconds, 4),
+                                  "loaded": False, "proxy": proxy})
+        self._credited = len(LazyLibrary.PROXIES)
+
+    def _suite(self, name):
+        return self.suites.setdefault(name, {"imports": [], "lazy": [], "import_seconds": 0.0,
+                                             "saved_seconds": 0.0})
+
+    # ============================================================
+    # REPORT
+    # ============================================================
+
+    def _summary(self, report):
+        entries = [(suite, entry) for suite, data in report.items() for entry in data["imports"]]
+        entries.sort(key=lambda item: -item[1]["self"])
+        lines = ["Import profile (self time, most expensive first):"]
+        for suite, entry in entries[:self.top]:
+            lines.append(f"  {entry['self']:7.3f}s  {entry['kind']:<9} {entry['name']}  ({suite})")
+        for suite, data in report.items():
+            if data["import_seconds"] or data["saved_seconds"]:
+                saved = f", lazy libraries saved {data['saved_seconds']:.3f}s" if data["saved_seconds"] else ""
+                lines.append(f"  {suite}: imports {data['import_seconds']:.3f}s{saved}")
+        return "\n".join(lines)
@@ -0,0 +1,155 @@
+"""
+LiveProgress.py — Live JSON-lines test results and early abort on smoke failure
+================================================================================
+Robot Framework listener (API v3) that writes one JSON line per suite/test
+start and end, the moment it happens, to a file or a local TCP socket.
+Dashboards, ``tail -f`` or the orchestrator can follow a run without
+waiting for output.xml.
+
+Early abort: when a test matching ``abort_on`` (default ``smokeANDP0``)
+fails, the deploy is considered broken. Every test that does not match
+``keep`` (default ``smoke``) and has not started yet is skipped. Suites
+left with nothing to run also skip their setup, which frees the browser
+or HTTP worker at once. With ``abort_file`` set, the abort is written to
+that file and every robot process that shares it stops too (see
+tools/orchestrate.py).
+
+Arguments (separate with ``;`` so Windows paths keep their ``:``):
+    target       JSON-lines file, or tcp://host:port (default: live.jsonl in the output dir)
+    abort_on     Tag pattern of tests whose failure aborts the run, NONE to disable
+    keep         Tag pattern of tests that still run after an abort
+    abort_file   Marker file shared between processes (default: $BOODMO_ABORT_FILE)
+
+Usage:
+    robot --listener listeners/LiveProgress.py tests/
+    robot --listener "listeners/LiveProgress.py;tcp://127.0.0.1:8899" tests/
+    robot --listener "listeners/LiveProgress.py;results/live.jsonl;smokeANDP0;smoke" tests/
+"""
+
+import json
+import os
+import socket
+import threading
+from datetime import datetime
+
+from robot.api import logger
+from robot.libraries.BuiltIn import BuiltIn
+
+
+DEFAULT_FILE = "live.jsonl"
+SKIP_TAG = "robot:skip"
+
+
+class LiveProgress:
+    ROBOT_LISTENER_API_VERSION = 3
+
+    def __init__(self, target=None, abort_on="smokeANDP0", keep="smoke", abort_file=None):
+        self.target = target
+        self.abort_on = None if abort_on.upper() == "NONE" else abort_on
+        self.keep = keep
+        self.abort_file = abort_file or os.environ.get("BOODMO_ABORT_FILE") or None
+        self.aborted_by = None
+        self._stream = None
+        self._lock = threading.Lock()
+
+    # ============================================================
+    # LISTENER METHODS
+    # ============================================================
+
+    def start_suite(self, data, result):
+        if self._stream is None:
+            self._open()
+        self._emit("suite_start", suite=result.full_name, source=str(data.source or ""),
+                   tests=data.test_count)
+        if self._is_aborted():
+            self._skip_remaining(data.tests)
+            if data.tests and not data.suites and all(SKIP_TAG in test.tags for test in data.tests):
+                data.setup = None
+                data.teardown = None
+
+    def start_test(self, data, result):
+        if self._is_aborted():
+            self._skip_remaining([data])
+        self._emit("test_start", suite=result.parent.full_name, test=result.name,
+                   id=result.id, tags=list(result.tags))
+
+    def end_test(self, data, result):
+        if SKIP_TAG in data.tags and self.aborted_by:
+            result.message = f"Skipped by early abort: '{self.aborted_by}' failed."
+        self._emit("test_end", suite=result.parent.full_name, test=result.name, id=result.id,
+                   status=result.status, elapsed=round(result.elapsed_time.total_seconds(), 3),
+                   tags=list(result.tags), message=result.message)
+        if result.failed and self.abort_on and result.tags.match(self.abort_on) \
+                and not self._is_aborted():
+            self._abort(result)
+
+    def end_suite(self, data, result):
+        self._emit("suite_end", suite=result.full_name, status=result.status,
+                   elapsed=round(result.elapsed_time.total_seconds(), 3),
+                   passed=result.statistics.passed, failed=result.statistics.failed,
+                   skipped=result.statistics.skipped)
+
+    def close(self):
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+    # ============================================================
+    # ABORT
+    # ============================================================
+
+    def _abort(self, result):
+        self.aborted_by = result.full_name
+        self._emit("abort", test=result.full_name, message=result.message)
+        # Shown on the console and in the log right after the FAIL status
+        result.message += (f"\n\nEARLY ABORT: remaining tests not tagged '{self.keep}' "
+                           f"will be skipped.")
+        if self.abort_file:
+            with open(self.abort_file, "w", encoding="utf-8") as handle:
+                handle.write(result.full_name)
+
+    def _is_aborted(self):
+        if self.aborted_by is None and self.abort_file and os.path.isfile(self.abort_file):
+            with open(self.abort_file, encoding="utf-8") as handle:
+                self.aborted_by = handle.read().strip() or "another process"
+        return self.aborted_by is not None
+
+    def _skip_remaining(self, tests):
+        for test in tests:
+            if not test.tags.match(self.keep):
+                test.tags.add(SKIP_TAG)
+
+    # ============================================================
+    # OUTPUT
+    # ============================================================
+
+    def _open(self):
+        target = self.target
+        if target and target.startswith("tcp://"):
+            host, port = target[len("tcp://"):].rsplit(":", 1)
+            try:
+                sock = socket.create_connection((host, int(port)), timeout=5)
+                self._stream = sock.makefile("w", encoding="utf-8")
+            except OSError as error:
+                logger.warn(f"LiveProgress: cannot connect to {target}: {error}; "
+                            f"falling back to {DEFAULT_FILE}")
+                target = None
+        if self._stream is None:
+            if not target:
+                output_dir = BuiltIn().get_variable_value("${OUTPUT DIR}") or "."
+                target = os.path.join(output_dir, DEFAULT_FILE)
+            self._stream = open(target, "a", encoding="utf-8")
+
+    def _emit(self, event, **fields):
+        if self._stream is None:
+            return
+        record = {"ts": datetime.now().isoformat(timespec="milliseconds"), "event": event,
+                  "pid": os.getpid(), **fields}
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            try:
+                self._stream.write(line)
+                self._stream.flush()
+            except OSError as error:
+                logger.warn(f"LiveProgress: stream closed ({error}), live output stopped")
+                self._stream = None
@@ -0,0 +1,171 @@
+"""
+LogPolicy.py — Tiered logging: large payloads go to side files, not log.html
+============================================================================
+Robot Framework listener (API v3). With ``--loglevel DEBUG`` every request
+and response body (RequestsLibrary, ``Search Product Via API``) ends up in
+output.xml and log.html, which become huge, slow to write and slow to open.
+
+Small messages stay inline. A message longer than ``threshold`` is written
+to a compressed, content-addressed side file (``<store>/ab/abcdef....txt.gz``,
+the same payload logged twice is stored once), and the log keeps a short
+preview with a link to it.
+
+Per-test accounting: the inline and offloaded bytes of every test (suite
+setup/teardown count for the suite) are written to ``log_sizes.json`` in
+the output directory. Once a test has logged ``cap`` bytes inline, every
+further message longer than the preview is offloaded too. WARN, ERROR and
+FAIL messages always stay inline.
+
+Arguments (separate with ``;`` so Windows paths keep their ``:``):
+    threshold    Offload messages longer than this (default: 4KB)
+    cap          Inline log budget per test (default: 256KB)
+    store        Side file directory (default: payloads in the output dir)
+    link_base    Directory log.html will be in, for the links (default: output dir)
+
+Usage:
+    robot --loglevel DEBUG --listener listeners/LogPolicy.py tests/api/
+    robot --listener "listeners/LogPolicy.py;16KB;1MB" tests/
+    zcat results/payloads/3f/3f2a....txt.gz | python -m json.tool
+"""
+
+import gzip
+import hashlib
+import html
+import json
+import os
+import re
+import tempfile
+
+from robot.api import logger
+from robot.libraries.BuiltIn import BuiltIn
+from robot.utils import get_link_path
+
+
+DEFAULT_STORE = "payloads"
+SIZES_FILE = "log_sizes.json"
+PREVIEW_CHARS = 200
+KEEP_LEVELS = ("WARN", "ERROR", "FAIL")
+_SIZE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([KM]?)B?\s*$", re.IGNORECASE)
+_TAGS = re.compile(r"<[^>]+>")
+
+
+def parse_size(value):
+    """Bytes in ``4KB``, ``1.5MB``, ``512`` (units of 1024)."""
+    match = _SIZE.match(str(value))
+    if not match:
+        raise ValueError(f"Invalid size '{value}', expected e.g. 4KB, 1MB or 512")
+    return int(float(match.group(1)) * {"": 1, "K": 1024, "M": 1024 ** 2}[match.group(2).upper()])
+
+
+def format_size(size):
+    for unit in ("B", "KB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} MB"
+
+
+def store_payload(store, text, extension):
+    """Write gzip(text) under its sha256 unless it is already stored.
+    Returns (path, digest)."""
+    data = text.encode("utf-8")
+    digest = hashlib.sha256(data).hexdigest()
+    folder = os.path.join(store, digest[:2])
+    path = os.path.join(folder, f"{digest}{extension}.gz")
+    if not os.path.isfile(path):
+        os.makedirs(folder, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=folder, suffix=".tmp")
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(gzip.compress(data, compresslevel=6))
+        # Atomic, so parallel robot processes can share one store
+        os.replace(tmp_path, path)
+    return path, digest
+
+
+class LogPolicy:
+    ROBOT_LISTENER_API_VERSION = 3
+
+    def __init__(self, threshold="4KB", cap="256KB", store=None, link_base=None):
+        self.threshold = parse_size(threshold)
+        self.cap = parse_size(cap)
+        self.store = store or None
+        self.link_base = link_base or None
+        # {test or suite name: {inline, offloaded, messages, offloaded_messages, capped}}
+        self.sizes = {}
+        self._scopes = []
+        self._output_dir = None
+
+    # ============================================================
+    # LISTENER METHODS
+    # ============================================================
+
+    def start_suite(self, data, result):
+        if self._output_dir is None:
+            self._output_dir = BuiltIn().get_variable_value("${OUTPUT DIR}") or "."
+            self.store = self.store or os.path.join(self._output_dir, DEFAULT_STORE)
+            self.link_base = self.link_base or self._output_dir
+        self._scopes.append(result.full_name)
+
+    def end_suite(self, data, result):
+        self._scopes.pop()
+
+    def start_test(self, data, result):
+        self._scopes.append(result.full_name)
+
+    def end_test(self, data, result):
+        self._scopes.pop()
+
+    def log_message(self, message):
+        text = message.message
+        entry = self._entry()
+        entry["messages"] += 1
+        if message.level in KEEP_LEVELS or len(text) <= PREVIEW_CHARS:
+            entry["inline"] += len(text)
+            return
+        capped = entry["inline"] >= self.cap
+        if len(text) <= self.threshold and not capped:
+            entry["inline"] += len(text)
+            return
+        try:
+            path, digest = store_payload(self.store, text, ".html" if message.html else ".txt")
+        except OSError as error:
+            logger.console(f"LogPolicy: cannot offload to {self.store}: {error}")
+            entry["inline"] += len(text)
+            return
+        preview = _TAGS.sub("", text) if message.html else text
+        notice = ""
+        if capped and not entry["capped"]:
+            entry["capped"] = True
+            notice = (f"<b>Log budget of {format_size(self.cap)} reached for this test, "
+                      f"messages over {PREVIEW_CHARS} characters are offloaded from here on.</b><br>")
+        link = get_link_path(path, self.link_base)
+        message.message = (
+            f'{notice}[{format_size(len(text))} offloaded to <a href="{link}">{digest[:12]}</a>]'
+            f"<pre>{html.escape(preview[:PREVIEW_CHARS])}...</pre>"
+        )
+        message.html = True
+        entry["inline"] += len(message.message)
+        entry["offloaded"] += len(text)
+        entry["offloaded_messages"] += 1
+
+    def close(self):
+        if not self.sizes or self._output_dir is None:
+            return
+        with open(os.path.join(self._output_dir, SIZES_FILE), "w", encoding="utf-8") as handle:
+            json.dump(self.sizes, handle, indent=2)
+        offloaded = sum(entry["offloaded"] for entry in self.sizes.values())
+        if offloaded:
+            capped = [name for name, entry in self.sizes.items() if entry["capped"]]
+            logger.console(f"LogPolicy: {format_size(offloaded)} offloaded to {self.store}"
+                           + (f"; log budget reached by: {', '.join(capped)}" if capped else ""))
+
+    # ============================================================
+    # ACCOUNTING
+    # ============================================================
+
+    def _entry(self):
+        scope = self._scopes[-1] if self._scopes else ""
+        if scope not in self.sizes:
+            self.sizes[scope] = {"inline": 0, "offloaded": 0, "messages": 0,
+                                 "offloaded_messages": 0, "capped": False}
+        return self.sizes[scope]
@@ -0,0 +1,234 @@
+"""
+Metrics.py — Run metrics in the Prometheus text format (node exporter textfile)
+===============================================================================
+Robot Framework listener (API v3) for runs used as a production health
+check. It keeps counters and histograms in memory and writes them to a
+``.prom`` file for the node exporter's textfile collector:
+
+    boodmo_tests_total                      {suite, status}
+    boodmo_tag_tests_total                  {tag, status}  (TC_/API_ ids excluded)
+    boodmo_test_duration_seconds            histogram {suite}
+    boodmo_keyword_duration_seconds         histogram {keyword}
+    boodmo_api_request_duration_seconds     histogram {method, endpoint, code},
+                                            from ``response.elapsed``
+    boodmo_api_retries_total                {endpoint, reason}
+    boodmo_run_in_progress                  1 while running, 0 at the end
+    boodmo_run_last_end_timestamp_seconds   when the last run finished
+
+Every series also has ``environment`` and ``worker`` (the top-level suite)
+labels, so the files of parallel robot processes never clash.
+
+Recording is a dictionary update under a lock. A background thread writes
+the file every ``interval`` seconds and once more when the run ends, always
+atomically (temp file + rename), so the node exporter never scrapes half a
+file and the run never waits for the disk.
+
+API latency and retries come from the shared API transport and retry
+policy (libraries/HttpTransport.py, libraries/RetryPolicy.py).
+
+Arguments (separate with ``;`` so Windows paths keep their ``:``):
+    target      .prom file, or a directory for boodmo_<worker>.prom
+                (default: boodmo_metrics.prom in the output dir)
+    interval    Seconds between writes (default: 15)
+
+Usage:
+    robot --listener "listeners/Metrics.py;/var/lib/node_exporter/textfile" tests/
+"""
+
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+
+from robot.api import logger
+from robot.libraries.BuiltIn import BuiltIn
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "libraries"))
+import HttpTransport  # noqa: E402
+import RetryPolicy  # noqa: E402
+
+
+DEFAULT_FILE = "boodmo_metrics.prom"
+ID_TAG = re.compile(r"^(TC|API)_\d+$")
+
+TEST_BUCKETS = (1, 2, 5, 10, 20, 30, 60, 120, 300)
+KEYWORD_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+API_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+
+def escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_labels(labels):
+    return "{" + ",".join(f'{key}="{escape(value)}"' for key, value in labels) + "}" if labels else ""
+
+
+class MetricFamily:
+    """Counter, gauge or histogram with labelled series (thread-safe)."""
+
+    def __init__(self, name, kind, help_text, buckets=None):
+        self.name = name
+        self.kind = kind
+        self.help = help_text
+        self.buckets = buckets
+        # {((label, value), ...): value, or [bucket counts..., sum, count] for histograms}
+        self.series = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels, amount=1):
+        key = tuple(labels.items())
+        with self._lock:
+            self.series[key] = self.series.get(key, 0) + amount
+
+    def set(self, labels, value):
+        with self._lock:
+            self.series[tuple(labels.items())] = value
+
+    def observe(self, labels, value):
+        key = tuple(labels.items())
+        with self._lock:
+            entry = self.series.setdefault(key, [0] * (len(self.buckets) + 2))
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    entry[index] += 1
+            entry[-2] += value
+            entry[-1] += 1
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            series = sorted((key, list(value) if isinstance(value, list) else value)
+                            for key, value in self.series.items())
+        for labels, value in series:
+            if self.kind != "histogram":
+                lines.append(f"{self.name}{format_labels(labels)} {value}")
+                continue
+            for bound, count in zip(self.buckets, value):
+                lines.append(f'{self.name}_bucket{format_labels(labels + (("le", f"{bound:g}"),))} {count}')
+            lines.append(f'{self.name}_bucket{format_labels(labels + (("le", "+Inf"),))} {value[-1]}')
+            lines.append(f"{self.name}_sum{format_labels(labels)} {value[-2]:.6f}")
+            lines.append(f"{self.name}_count{format_labels(labels)} {value[-1]}")
+        return "\n".join(lines)
+
+
+def write_atomic(path, text):
+    """Replace ``path`` in one rename; the temp name does not end in .prom,
+    so the textfile collector never reads it."""
+    folder = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=folder, prefix=".boodmo_", suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as handle:
+        handle.write(text)
+    os.chmod(tmp_path, 0o644)
+    os.replace(tmp_path, path)
+
+
+class Metrics:
+    ROBOT_LISTENER_API_VERSION = 3
+
+    def __init__(self, target=None, interval=15):
+        self.target = target or None
+        self.interval = float(interval)
+        self.path = None
+        self.labels = {}
+        self.tests = MetricFamily("boodmo_tests_total", "counter", "Finished tests by suite and status.")
+        self.tag_tests = MetricFamily("boodmo_tag_tests_total", "counter", "Finished tests by tag and status.")
+        self.test_duration = MetricFamily("boodmo_test_duration_seconds", "histogram",
+                                          "Test duration.", TEST_BUCKETS)
+        self.keyword_duration = MetricFamily("boodmo_keyword_duration_seconds", "histogram",
+                                             "Keyword duration.", KEYWORD_BUCKETS)
+        self.api_duration = MetricFamily("boodmo_api_request_duration_seconds", "histogram",
+                                         "API request latency (response.elapsed, retries included).",
+                                         API_BUCKETS)
+        self.retries = MetricFamily("boodmo_api_retries_total", "counter",
+                                    "API retries and requests failed fast by an open circuit.")
+        self.in_progress = MetricFamily("boodmo_run_in_progress", "gauge", "1 while the run is going.")
+        self.last_end = MetricFamily("boodmo_run_last_end_timestamp_seconds", "gauge",
+                                     "Unix time the last run ended.")
+        self.families = (self.tests, self.tag_tests, self.test_duration, self.keyword_duration,
+                         self.api_duration, self.retries, self.in_progress, self.last_end)
+        self._stopping = threading.Event()
+        self._writer = None
+        self._depth = 0
+
+    # ============================================================
+    # LISTENER METHODS
+    # ============================================================
+
+    def start_suite(self, data, result):
+        self._depth += 1
+        if self._writer is not None:
+            return
+        builtin = BuiltIn()
+        self.labels = {"environment": builtin.get_variable_value("${ENVIRONMENT}") or "",
+                       "worker": result.name}
+        output_dir = builtin.get_variable_value("${OUTPUT DIR}") or "."
+        target = self.target or os.path.join(output_dir, DEFAULT_FILE)
+        if os.path.isdir(target):
+            worker = re.sub(r"\W+", "_", result.name).strip("_").lower()
+            target = os.path.join(target, f"boodmo_{worker}.prom")
+        self.path = target
+        self.in_progress.set(self.labels, 1)
+        HttpTransport.add_response_observer(self._response)
+        RetryPolicy.add_retry_observer(self._retry)
+        self._writer = threading.Thread(target=self._write_loop, name="metrics", daemon=True)
+        self._writer.start()
+
+    def end_suite(self, data, result):
+        self._depth -= 1
+        if self._depth:
+            return
+        self.in_progress.set(self.labels, 0)
+        self.last_end.set(self.labels, round(time.time(), 3))
+
+    def end_test(self, data, result):
+        status = {"status": result.status}
+        self.tests.inc({**self.labels, "suite": result.parent.name, **status})
+        for tag in result.tags:
+            if not ID_TAG.match(tag):
+                self.tag_tests.inc({**self.labels, "tag": tag, **status})
+        self.test_duration.observe({**self.labels, "suite": result.parent.name},
+                                   result.elapsed_time.total_seconds())
+
+    def end_keyword(self, data, result):
+        self.keyword_duration.observe({**self.labels, "keyword": result.name},
+                                      result.elapsed_time.total_seconds())
+
+    def close(self):
+        if self._writer is None:
+            return
+        self._stopping.set()
+        self._writer.join(timeout=10)
+        self._write()
+
+    # ============================================================
+    # TRANSPORT OBSERVERS (any thread)
+    # ============================================================
+
+    def _response(self, response):
+        endpoint = RetryPolicy.RetryPolicy.endpoint_key(response.request)
+        method, path = endpoint.split(" ", 1)
+        self.api_duration.observe({**self.labels, "method": method, "endpoint": path,
+                                   "code": response.status_code},
+                                  response.elapsed.total_seconds())
+
+    def _retry(self, endpoint, reason):
+        self.retries.inc({**self.labels, "endpoint": endpoint, "reason": reason})
+
+    # ============================================================
+    # OUTPUT
+    # ============================================================
+
+    def _write_loop(self):
+        while not self._stopping.wait(self.interval):
+            self._write()
+
+    def _write(self):
+        text = "\n".join(family.render() for family in self.families) + "\n"
+        try:
+            write_atomic(self.path, text)
+        except OSError as error:
+            logger.console(f"Metrics: cannot write {self.path}: {error}")
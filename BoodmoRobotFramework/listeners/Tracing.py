@@ -0,0 +1,280 @@
+"""
+Tracing.py — OpenTelemetry-compatible spans for suites, tests, keywords and HTTP
+================================================================================
+Robot Framework listener (API v3) that records a run as a trace: one span
+per suite, test and keyword, plus one client span per HTTP request sent
+through the shared API transport (libraries/HttpTransport.py, so every
+attempt of a retried request shows up). Spans are exported in the OTLP
+JSON encoding, so any OpenTelemetry collector or trace viewer reads them.
+
+Attributes:
+    resource    service.name, deployment.environment, browser.name, process.pid
+    test        robot.test.tags, boodmo.tc_ids (TC_xxx / API_xxx tags)
+    keyword     robot.keyword.library, robot.keyword.args
+    http        http.request.method, url.full, http.response.status_code
+    all         robot.type, robot.status (FAIL sets the span status to ERROR)
+
+Export is batched and asynchronous: spans are queued and a background
+thread writes them every ``interval`` seconds or ``batch`` spans, so a
+keyword pays one queue put. ``close`` flushes what is left.
+
+Targets:
+    traces.jsonl (default, in the output dir)
+        OTLP file format, one ExportTraceServiceRequest per line
+        (collector ``otlpjsonfile`` receiver). Appends are atomic per
+        batch, so parallel robot processes can share one file.
+    http://localhost:4318/v1/traces
+        OTLP/HTTP JSON to a local collector
+
+Parallel workers: with ``TRACEPARENT`` (W3C format) in the environment,
+the top-level suite becomes a child of that span and every process adds
+to the same trace. tools/orchestrate.py sets it for all its suites.
+
+Arguments (separate with ``;`` so Windows paths keep their ``:``):
+    target      File or http(s) URL (default: traces.jsonl in the output dir)
+    batch       Spans per export (default: 512)
+    interval    Seconds between exports (default: 1)
+
+Usage:
+    robot --listener listeners/Tracing.py tests/
+    robot --listener "listeners/Tracing.py;http://localhost:4318/v1/traces" tests/
+"""
+
+import json
+import os
+import queue
+import re
+import socket
+import sys
+import threading
+import time
+import urllib.request
+from urllib.parse import urlsplit
+
+from robot.api import logger
+from robot.libraries.BuiltIn import BuiltIn
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "libraries"))
+import HttpTransport  # noqa: E402
+
+
+DEFAULT_FILE = "traces.jsonl"
+SERVICE_NAME = "boodmo-robot"
+SCOPE = {"name": "boodmo.robot.tracing", "version": "1.0"}
+TC_TAG = re.compile(r"^(TC|API)_\d+$")
+MAX_ARGS_CHARS = 200
+
+# OTLP enums
+KIND_INTERNAL, KIND_CLIENT = 1, 3
+STATUS_UNSET, STATUS_OK, STATUS_ERROR = 0, 1, 2
+
+
+def new_id(size):
+    return os.urandom(size).hex()
+
+
+def parse_traceparent(value):
+    """(trace_id, span_id) of a W3C traceparent header, or (None, None)."""
+    match = re.match(r"^[0-9a-f]{2}-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$", (value or "").strip())
+    return match.groups() if match else (None, None)
+
+
+def attribute(key, value):
+    """OTLP JSON key/value: str, bool, int or a list of str."""
+    if isinstance(value, bool):
+        encoded = {"boolValue": value}
+    elif isinstance(value, int):
+        encoded = {"intValue": str(value)}
+    elif isinstance(value, (list, tuple)):
+        encoded = {"arrayValue": {"values": [{"stringValue": str(item)} for item in value]}}
+    else:
+        encoded = {"stringValue": str(value)}
+    return {"key": key, "value": encoded}
+
+
+def make_span(trace_id, span_id, parent_id, name, start_ns, end_ns, attributes,
+              kind=KIND_INTERNAL, status=STATUS_UNSET, message=""):
+    span = {
+        "traceId": trace_id, "spanId": span_id, "name": name, "kind": kind,
+        "startTimeUnixNano": str(start_ns), "endTimeUnixNano": str(end_ns),
+        "attributes": [attribute(key, value) for key, value in attributes.items()
+                       if value not in (None, "", [])],
+        "status": {"code": status, "message": message} if message else {"code": status},
+    }
+    if parent_id:
+        span["parentSpanId"] = parent_id
+    return span
+
+
+def export_request(spans, resource):
+    """One OTLP ExportTraceServiceRequest (JSON) for ``spans``."""
+    return {"resourceSpans": [{
+        "resource": {"attributes": [attribute(key, value) for key, value in resource.items()
+                                    if value not in (None, "")]},
+        "scopeSpans": [{"scope": SCOPE, "spans": spans}],
+    }]}
+
+
+def write_request(target, request):
+    """Send one request to a file (one line, one atomic append) or an OTLP/HTTP endpoint."""
+    body = json.dumps(request, separators=(",", ":"))
+    if target.startswith(("http://", "https://")):
+        post = urllib.request.Request(target, data=body.encode("utf-8"), method="POST",
+                                      headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(post, timeout=5):
+            return
+    fd = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    try:
+        os.write(fd, (body + "\n").encode("utf-8"))
+    finally:
+        os.close(fd)
+
+
+class BatchExporter(threading.Thread):
+    """Background thread that exports queued spans in batches."""
+
+    def __init__(self, target, resource, batch, interval):
+        super().__init__(name="trace-export", daemon=True)
+        self.target = target
+        self.resource = resource
+        self.batch = batch
+        self.interval = interval
+        self.exported = 0
+        self.dropped = 0
+        self.error = None
+        self._queue = queue.Queue()
+
+    def put(self, span):
+        self._queue.put(span)
+
+    def run(self):
+        pending, deadline, stopping = [], time.monotonic() + self.interval, False
+        while not stopping:
+            try:
+                span = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                if span is None:
+                    stopping = True
+                else:
+                    pending.append(span)
+            except queue.Empty:
+                pass
+            if pending and (stopping or len(pending) >= self.batch or time.monotonic() >= deadline):
+                self._export(pending)
+                pending = []
+            if time.monotonic() >= deadline:
+                deadline = time.monotonic() + self.interval
+
+    def _export(self, spans):
+        try:
+            write_request(self.target, export_request(spans, self.resource))
+            self.exported += len(spans)
+        except (OSError, ValueError) as error:
+            # Tracing never fails a run: count the loss, report it on close
+            self.dropped += len(spans)
+            self.error = error
+
+    def stop(self):
+        self._queue.put(None)
+        self.join(timeout=30)
+
+
+class Tracing:
+    ROBOT_LISTENER_API_VERSION = 3
+
+    def __init__(self, target=None, batch=512, interval=1):
+        self.target = target or None
+        self.batch = int(batch)
+        self.interval = float(interval)
+        self.trace_id, self.root_parent = parse_traceparent(os.environ.get("TRACEPARENT"))
+        self.trace_id = self.trace_id or new_id(16)
+        self.resource = {"service.name": SERVICE_NAME, "process.pid": os.getpid(),
+                         "host.name": socket.gethostname()}
+        self._exporter = None
+        # Open spans, innermost last: [span_id, start_ns, attributes]
+        self._stack = []
+        self._lock = threading.Lock()
+
+    # ============================================================
+    # LISTENER METHODS
+    # ============================================================
+
+    def start_suite(self, data, result):
+        if self._exporter is None:
+            self._start_exporter()
+        self._start({"robot.type": "suite", "robot.suite.source": str(data.source or "")})
+
+    def end_suite(self, data, result):
+        self._end(result.full_name, result)
+
+    def start_test(self, data, result):
+        tags = list(result.tags)
+        self._start({"robot.type": "test", "robot.test.id": result.id, "robot.test.tags": tags,
+                     "boodmo.tc_ids": [tag for tag in tags if TC_TAG.match(tag)]})
+
+    def end_test(self, data, result):
+        self._end(result.name, result)
+
+    def start_keyword(self, data, result):
+        args = ", ".join(str(arg) for arg in data.args)
+        self._start({"robot.type": "keyword", "robot.keyword.library": result.owner,
+                     "robot.keyword.args": args[:MAX_ARGS_CHARS]})
+
+    def end_keyword(self, data, result):
+        self._end(result.name, result)
+
+    def close(self):
+        if self._exporter is None:
+            return
+        self._exporter.stop()
+        if self._exporter.dropped:
+            logger.console(f"Tracing: {self._exporter.dropped} span(s) not exported to "
+                           f"{self.target}: {self._exporter.error}")
+
+    # ============================================================
+    # SPANS
+    # ============================================================
+
+    def _start_exporter(self):
+        builtin = BuiltIn()
+        if not self.target:
+            self.target = os.path.join(builtin.get_variable_value("${OUTPUT DIR}") or ".", DEFAULT_FILE)
+        self.resource["deployment.environment"] = builtin.get_variable_value("${ENVIRONMENT}")
+        self.resource["browser.name"] = builtin.get_variable_value("${BROWSER}")
+        self._exporter = BatchExporter(self.target, self.resource, self.batch, self.interval)
+        self._exporter.start()
+        HttpTransport.add_request_observer(self._http_span)
+
+    def _start(self, attributes):
+        with self._lock:
+            self._stack.append([new_id(8), time.time_ns(), attributes])
+
+    def _end(self, name, result):
+        with self._lock:
+            span_id, started, attributes = self._stack.pop()
+            parent = self._stack[-1][0] if self._stack else self.root_parent
+        attributes["robot.status"] = result.status
+        status = {"PASS": STATUS_OK, "FAIL": STATUS_ERROR}.get(result.status, STATUS_UNSET)
+        self._exporter.put(make_span(
+            self.trace_id, span_id, parent, name, started, time.time_ns(), attributes,
+            status=status, message=result.message if status == STATUS_ERROR else "",
+        ))
+
+    def _http_span(self, request, response, error, started, ended):
+        # Called from the sending thread (also SearchMatrix workers): the
+        # parent is the keyword running at that moment
+        with self._lock:
+            parent = self._stack[-1][0] if self._stack else self.root_parent
+        url = urlsplit(request.url)
+        attributes = {
+            "http.request.method": request.method, "url.full": request.url,
+            "server.address": url.hostname,
+            "http.response.status_code": response.status_code if response is not None else None,
+            "error.type": type(error).__name__ if error else None,
+        }
+        failed = error is not None or (response is not None and response.status_code >= 500)
+        self._exporter.put(make_span(
+            self.trace_id, new_id(8), parent, f"{request.method} {url.path}", started, ended, attributes,
+            kind=KIND_CLIENT, status=STATUS_ERROR if failed else STATUS_UNSET,
+            message=str(error) if error else "",
+        ))
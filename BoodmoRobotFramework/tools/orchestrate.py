@@ -0,0 +1,422 @@
+"""
+orchestrate.py — Run UI shards and API suites concurrently, merge the results
+==============================================================================
+Jenkins used to run ``tests/ui`` and ``tests/api`` one after the other, so
+the build took UI time + API time although the API suites need no browser.
+This command starts every suite file as its own ``robot`` process and runs
+them side by side, within two resource caps:
+
+    browser slots   UI suites running at once (each one drives a browser)
+    http slots      API suites running at once (HTTP only, cheap)
+
+Process-wide state is per suite file here: each API suite has its own
+HTTP connection pool (libraries/HttpTransport.py) and retry budget
+(libraries/RetryPolicy.py).
+
+The two pools are independent, so API suites finish while the UI shards
+are still running and the build takes roughly max(UI, API). Each finished
+test is printed live with its suite prefix and appended to
+results/live.jsonl (listeners/LiveProgress.py). Log messages over
+``--log-threshold`` are moved to results/payloads
+(listeners/LogPolicy.py). Suites, tests, keywords and API calls of all
+processes are exported as one trace to results/traces.jsonl
+(listeners/Tracing.py), and run metrics to Prometheus textfiles in
+results/metrics (listeners/Metrics.py). Every browser and HTTP slot is a
+test data worker with its own share of test accounts and cart products
+(libraries/TestDataFactory.py). When a smoke P0 test fails, every suite
+skips its remaining non-smoke tests. Suites and tests run in
+priority order (listeners/PriorityOrder.py), so a broken deploy shows up
+in the first minute. When all suites are done, the outputs are combined
+with ``rebot`` into ONE output.xml / log.html / report.html.
+
+Usage:
+    python tools/orchestrate.py --environment qa --browser chrome
+    python tools/orchestrate.py --environment production --include smoke --browser-slots 3
+
+Exit code: number of failed tests (like ``robot``), 250 at most.
+"""
+
+import argparse
+import os
+import queue
+import re
+import subprocess
+import sys
+import threading
+import time
+
+from results_store import DEFAULT_DB
+
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_BROWSER_SLOTS = 2
+DEFAULT_HTTP_SLOTS = 4
+
+LIVE_FILE = "live.jsonl"
+ABORT_FILE = ".abort"
+LOCATOR_REPORT = "locator_health.json"
+PAYLOAD_DIR = "payloads"
+TRACE_FILE = "traces.jsonl"
+METRICS_DIR = "metrics"
+
+# "Test Name                                   | PASS |" in --console verbose
+_TEST_LINE = re.compile(r"^(?P<name>.+?)\s+\|\s+(?P<status>PASS|FAIL|SKIP)\s+\|\s*$")
+# Every test status (and its message lines) is closed by a line of dashes;
+# suite status lines are closed by "N tests, N passed, ..." instead
+_TEST_END = re.compile(r"^-{20,}\s*$")
+
+
+class Job:
+    """One suite file run in its own robot process."""
+
+    def __init__(self, kind, path, outputdir):
+        self.kind = kind
+        self.path = path
+        self.suite = os.path.splitext(os.path.basename(path))[0]
+        self.outputdir = os.path.join(outputdir, kind, self.suite)
+        self.output = os.path.join(self.outputdir, "output.xml")
+        self.label = f"{kind}:{self.suite}"
+        self.worker = 0
+        self.process = 0
+        self.returncode = None
+        self.duration = 0.0
+        self.counts = {"PASS": 0, "FAIL": 0, "SKIP": 0}
+
+
+class Progress:
+    """Thread-safe live progress printer."""
+
+    def __init__(self, total_jobs):
+        self.total_jobs = total_jobs
+        self.done_jobs = 0
+        self.counts = {"PASS": 0, "FAIL": 0, "SKIP": 0}
+        self.started = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _elapsed(self):
+        return time.strftime("%M:%S", time.gmtime(time.monotonic() - self.started))
+
+    def test(self, job, name, status):
+        with self._lock:
+            self.counts[status] += 1
+            job.counts[status] += 1
+            print(f"[{self._elapsed()}] {status:4} {job.label:24} {name}", flush=True)
+
+    def event(self, job, message):
+        with self._lock:
+            if message == "done":
+                self.done_jobs += 1
+                message = (f"done in {job.duration:.0f}s (rc={job.returncode}) — "
+                           f"{self.done_jobs}/{self.total_jobs} suites, "
+                           f"{self.counts['PASS']} passed, {self.counts['FAIL']} failed")
+            print(f"[{self._elapsed()}] ---- {job.label:24} {message}", flush=True)
+
+
+# ============================================================
+# JOBS
+# ============================================================
+
+def discover(tests_dir, outputdir):
+    """One job per suite file under tests/ui and tests/api."""
+    jobs = []
+    for kind in ("ui", "api"):
+        folder = os.path.join(tests_dir, kind)
+        if not os.path.isdir(folder):
+            continue
+        for name in sorted(os.listdir(folder)):
+            if name.endswith(".robot"):
+                jobs.append(Job(kind, os.path.join(folder, name), outputdir))
+    return jobs
+
+
+def prioritize(jobs, args):
+    """Sort jobs so suites holding the most important tests start first."""
+    sys.path.insert(0, os.path.join(PROJECT_DIR, "listeners"))
+    from PriorityOrder import PriorityOrder
+    from robot.api import TestSuite
+
+    order = PriorityOrder(args.results_db)
+    keys = {}
+    for job in jobs:
+        suite = TestSuite.from_file_system(job.path)
+        suite.visit(order)
+        keys[job.path] = order.suite_key(suite)
+    return sorted(jobs, key=lambda job: keys[job.path])
+
+
+def robot_command(job, args):
+    command = [
+        sys.executable, "-m", "robot",
+        "--variablefile", os.path.join("variables", f"env_{args.environment}.py"),
+        "--outputdir", job.outputdir,
+        "--output", "output.xml",
+        "--log", "NONE",
+        "--report", "NONE",
+        "--loglevel", args.loglevel,
+        "--console", "verbose",
+        "--consolecolors", "off",
+        "--consolemarkers", "off",
+        "--consolewidth", "120",
+        # Suites without matching tests still produce an output to merge
+        "--runemptysuite",
+    ]
+    if job.kind == "ui":
+        command += ["--variable", f"BROWSER:{args.browser}"]
+        # One locator pre-flight report shared by all UI suites of the run
+        command += ["--variable", f"LOCATOR_HEALTH_REPORT:{os.path.join(args.outputdir, LOCATOR_REPORT)}"]
+    if args.dryrun:
+        command.append("--dryrun")
+    # Live JSON lines for all suites + early abort shared through one marker file
+    command += ["--prerunmodifier", ";".join([
+        os.path.join(PROJECT_DIR, "listeners", "PriorityOrder.py"), args.results_db,
+    ])]
+    command += ["--listener", ";".join([
+        os.path.join(PROJECT_DIR, "listeners", "LiveProgress.py"),
+        os.path.join(args.outputdir, LIVE_FILE),
+        args.abort_on, args.keep,
+        os.path.join(args.outputdir, ABORT_FILE),
+    ])]
+    # Large payloads go to one shared side file store, linked from the merged log
+    command += ["--listener", ";".join([
+        os.path.join(PROJECT_DIR, "listeners", "LogPolicy.py"),
+        args.log_threshold, args.log_cap,
+        os.path.join(args.outputdir, PAYLOAD_DIR),
+        os.path.join(args.outputdir, "merged"),
+    ])]
+    # One Prometheus textfile per suite process (boodmo_<suite>.prom)
+    if args.metrics.upper() != "NONE":
+        command += ["--listener", ";".join([
+            os.path.join(PROJECT_DIR, "listeners", "Metrics.py"), args.metrics,
+        ])]
+    # Spans of all suites join the run's trace through TRACEPARENT
+    if args.trace.upper() != "NONE":
+        command += ["--listener", ";".join([
+            os.path.join(PROJECT_DIR, "listeners", "Tracing.py"), args.trace,
+        ])]
+    # The suite process owns its slot's share of test accounts and cart products
+    command += ["--variable", f"TEST_DATA_WORKER:{job.worker}",
+                "--variable", f"TEST_DATA_WORKERS:{args.workers}",
+                "--variable", f"TEST_DATA_PROCESS:{job.process}",
+                "--variable", f"TEST_DATA_PROCESSES:{args.processes}"]
+    for tag in args.include:
+        command += ["--include", tag]
+    for tag in args.exclude:
+        command += ["--exclude", tag]
+    for variable in args.variable:
+        command += ["--variable", variable]
+    return command + [job.path]
+
+
+def run_job(job, args, progress):
+    os.makedirs(job.outputdir, exist_ok=True)
+    progress.event(job, "started")
+    started = time.monotonic()
+    with open(os.path.join(job.outputdir, "console.log"), "w", encoding="utf-8") as console:
+        process = subprocess.Popen(robot_command(job, args), cwd=PROJECT_DIR,
+                                   stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                   text=True, encoding="utf-8", errors="replace")
+        pending = None
+        for line in process.stdout:
+            console.write(line)
+            # A suite status line looks like a test line, and both may be
+            # followed by message lines: report a match once the dashes that
+            # only end a test show up
+            match = _TEST_LINE.match(line.rstrip())
+            if match:
+                pending = match
+            elif pending and _TEST_END.match(line):
+                progress.test(job, pending.group("name"), pending.group("status"))
+                pending = None
+        job.returncode = process.wait()
+    job.duration = time.monotonic() - started
+    progress.event(job, "done")
+
+
+def worker(jobs, slot, args, progress):
+    while True:
+        try:
+            job = jobs.get_nowait()
+        except queue.Empty:
+            return
+        job.worker = slot
+        run_job(job, args, progress)
+
+
+def run_all(jobs, args):
+    """Run UI jobs on browser slots and API jobs on HTTP slots, concurrently."""
+    progress = Progress(len(jobs))
+    threads = []
+    for kind, slots in (("ui", args.browser_slots), ("api", args.http_slots)):
+        pending = queue.Queue()
+        for job in jobs:
+            if job.kind == kind:
+                pending.put(job)
+        for _ in range(min(slots, pending.qsize())):
+            # Slots are the test data workers: UI slots first, then HTTP slots
+            thread = threading.Thread(target=worker, args=(pending, len(threads), args, progress),
+                                      daemon=True)
+            thread.start()
+            threads.append(thread)
+    for thread in threads:
+        thread.join()
+    return progress
+
+
+def check_test_data(args):
+    """Warn once when there are fewer test accounts or cart products than
+    concurrent workers, so that workers have to share one."""
+    import runpy
+    from robot.running.builder import ResourceFileBuilder
+
+    common = ResourceFileBuilder().build(os.path.join(PROJECT_DIR, "variables", "env_common.robot"))
+    values = {variable.name[2:-1]: variable.value for variable in common.variables}
+    environment = runpy.run_path(os.path.join(PROJECT_DIR, "variables", f"env_{args.environment}.py"))
+    values.update({name: environment[name] for name in ("TEST_ACCOUNTS", "CART_TEST_PRODUCT_IDS")
+                   if name in environment})
+    for name in ("TEST_ACCOUNTS", "CART_TEST_PRODUCT_IDS"):
+        count = len(values.get(name) or ())
+        if 0 < count < args.workers:
+            print(f"WARNING: {count} item(s) in {name} for {args.workers} concurrent workers; "
+                  f"workers share them. Add more to give every worker its own.", file=sys.stderr)
+
+
+def start_trace(args):
+    """Make every suite process a child of one run span (via TRACEPARENT).
+    Returns (trace_id, run span id, parent span id, start time in ns)."""
+    sys.path.insert(0, os.path.join(PROJECT_DIR, "listeners"))
+    from Tracing import new_id, parse_traceparent
+
+    trace_id, parent = parse_traceparent(os.environ.get("TRACEPARENT"))
+    trace_id, span_id = trace_id or new_id(16), new_id(8)
+    os.environ["TRACEPARENT"] = f"00-{trace_id}-{span_id}-01"
+    return trace_id, span_id, parent, time.time_ns()
+
+
+def end_trace(trace, args, progress):
+    """Export the run span that the suite spans hang off."""
+    from Tracing import SERVICE_NAME, export_request, make_span, write_request
+
+    trace_id, span_id, parent, started = trace
+    span = make_span(trace_id, span_id, parent, args.name, started, time.time_ns(), {
+        "robot.type": "run", "robot.passed": progress.counts["PASS"],
+        "robot.failed": progress.counts["FAIL"], "robot.skipped": progress.counts["SKIP"],
+    })
+    resource = {"service.name": SERVICE_NAME, "process.pid": os.getpid(),
+                "deployment.environment": args.environment, "browser.name": args.browser}
+    try:
+        write_request(args.trace, export_request([span], resource))
+    except (OSError, ValueError) as error:
+        print(f"Trace export to {args.trace} failed: {error}", file=sys.stderr)
+
+
+def merge(jobs, args):
+    """Combine every suite output into one output.xml / log.html / report.html."""
+    outputs = [job.output for job in jobs if os.path.isfile(job.output)]
+    missing = [job.label for job in jobs if not os.path.isfile(job.output)]
+    if missing:
+        print(f"WARNING: no output.xml for {', '.join(missing)}", file=sys.stderr)
+    if not outputs:
+        return 252
+    command = [
+        sys.executable, "-m", "robot.rebot",
+        "--name", args.name,
+        "--outputdir", os.path.join(args.outputdir, "merged"),
+        "--output", "output.xml",
+    ] + outputs
+    return subprocess.call(command, cwd=PROJECT_DIR)
+
+
+# ============================================================
+# COMMAND LINE
+# ============================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run UI and API suites concurrently.")
+    parser.add_argument("--environment", default=os.environ.get("ENVIRONMENT", "qa"),
+                        choices=["qa", "staging", "production"])
+    parser.add_argument("--browser", default=os.environ.get("BROWSER", "chrome"))
+    parser.add_argument("--include", action="append", default=[], help="Tag to include (repeatable)")
+    parser.add_argument("--exclude", action="append", default=[], help="Tag to exclude (repeatable)")
+    parser.add_argument("--variable", action="append", default=[], help="NAME:value (repeatable)")
+    parser.add_argument("--browser-slots", type=int, default=DEFAULT_BROWSER_SLOTS,
+                        help=f"UI suites running at once (default: {DEFAULT_BROWSER_SLOTS})")
+    parser.add_argument("--http-slots", type=int, default=DEFAULT_HTTP_SLOTS,
+                        help=f"API suites running at once (default: {DEFAULT_HTTP_SLOTS})")
+    parser.add_argument("--tests-dir", default=os.path.join(PROJECT_DIR, "tests"))
+    parser.add_argument("--outputdir", default=os.path.join(PROJECT_DIR, "results"))
+    parser.add_argument("--loglevel", default="DEBUG")
+    parser.add_argument("--log-threshold", default="4KB",
+                        help="Log messages larger than this go to side files (default: 4KB)")
+    parser.add_argument("--log-cap", default="256KB",
+                        help="Inline log budget per test (default: 256KB)")
+    parser.add_argument("--metrics", default=None,
+                        help="Prometheus textfile directory, e.g. the node exporter's, NONE to "
+                             "disable (default: metrics in the output dir)")
+    parser.add_argument("--trace", default=None,
+                        help="Span export target: OTLP file or http(s) collector URL, NONE to "
+                             "disable (default: traces.jsonl in the output dir)")
+    parser.add_argument("--dryrun", action="store_true", help="Pass --dryrun to every suite")
+    parser.add_argument("--abort-on", default="smokeANDP0",
+                        help="Tag pattern whose failure skips remaining non-'--keep' tests "
+                             "in all suites, NONE to disable (default: smokeANDP0)")
+    parser.add_argument("--results-db", default=DEFAULT_DB,
+                        help="Results trend store used to order tests by failure history")
+    parser.add_argument("--keep", default="smoke",
+                        help="Tag pattern still run after an early abort (default: smoke)")
+    parser.add_argument("--name", default="Boodmo_Full_Suite", help="Top-level suite name")
+    args = parser.parse_args(argv)
+
+    args.outputdir = os.path.abspath(args.outputdir)
+    args.trace = args.trace or os.path.join(args.outputdir, TRACE_FILE)
+    args.metrics = args.metrics or os.path.join(args.outputdir, METRICS_DIR)
+    jobs = discover(args.tests_dir, args.outputdir)
+    if not jobs:
+        print(f"No suites found under {args.tests_dir}", file=sys.stderr)
+        return 252
+    jobs = prioritize(jobs, args)
+    for index, job in enumerate(jobs):
+        job.process = index
+    args.processes = len(jobs)
+    args.workers = sum(min(slots, sum(job.kind == kind for job in jobs))
+                       for kind, slots in (("ui", args.browser_slots), ("api", args.http_slots)))
+    # One run id for the unique test data of all suites (libraries/TestDataFactory.py)
+    sys.path.insert(0, os.path.join(PROJECT_DIR, "libraries"))
+    from TestDataFactory import new_run_id
+    os.environ.setdefault("BOODMO_RUN_ID", new_run_id())
+    check_test_data(args)
+
+    print(f"Running {len(jobs)} suites on {args.environment}: "
+          f"{args.browser_slots} browser slot(s), {args.http_slots} HTTP slot(s)", flush=True)
+    os.makedirs(args.outputdir, exist_ok=True)
+    if args.metrics.upper() != "NONE":
+        os.makedirs(args.metrics, exist_ok=True)
+    for stale in (LIVE_FILE, ABORT_FILE, TRACE_FILE, LOCATOR_REPORT):
+        if os.path.exists(os.path.join(args.outputdir, stale)):
+            os.remove(os.path.join(args.outputdir, stale))
+    trace = start_trace(args) if args.trace.upper() != "NONE" else None
+    started = time.monotonic()
+    progress = run_all(jobs, args)
+    wall = time.monotonic() - started
+    if trace:
+        end_trace(trace, args, progress)
+
+    rc = merge(jobs, args)
+    serial = sum(job.duration for job in jobs)
+    print(f"\n{progress.counts['PASS']} passed, {progress.counts['FAIL']} failed, "
+          f"{progress.counts['SKIP']} skipped in {wall:.0f}s "
+          f"(sequential would take ~{serial:.0f}s)")
+    abort_file = os.path.join(args.outputdir, ABORT_FILE)
+    if os.path.isfile(abort_file):
+        with open(abort_file, encoding="utf-8") as handle:
+            print(f"EARLY ABORT: '{handle.read().strip()}' failed; "
+                  f"tests not tagged '{args.keep}' were skipped")
+    print(f"Merged results: {os.path.join(args.outputdir, 'merged')}")
+    print(f"Live results:   {os.path.join(args.outputdir, LIVE_FILE)}")
+    if trace:
+        print(f"Trace:          {args.trace}")
+    return rc
+
+
+if __name__ == "__main__":
+    sys.exit(main())
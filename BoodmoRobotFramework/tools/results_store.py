@@ -0,0 +1,339 @@
+"""
+results_store.py — Historical results trend store with slow-test analytics
+===========================================================================
+Ingests Robot Framework output.xml files into a local SQLite database,
+keyed by build, environment, browser and test, including per-keyword
+timings. Archived results/** artifacts only cover the last 20 builds; the
+store keeps every run and answers trend queries in milliseconds.
+
+Usage:
+    # Ingest a run (build/environment/browser default to Jenkins env vars)
+    python tools/results_store.py ingest results/merged/output.xml --build 142
+
+    # Slowest 20 tests over the last 30 days
+    python tools/results_store.py slowest --limit 20 --days 30
+
+    # Tests whose latest duration regressed > 20% vs. the 30-day baseline
+    python tools/results_store.py regressions --threshold 0.2 --days 30
+
+    # Pass rate per TC_ID (also API_xxx ids)
+    python tools/results_store.py pass-rate
+
+    # Slowest keywords of one test
+    python tools/results_store.py keywords "Verify Keyword Search Returns Relevant Products"
+
+Database: ~/.boodmo/results.db by default (override with --db).
+"""
+
+import argparse
+import os
+import re
+import sqlite3
+import sys
+import time
+from datetime import datetime, timedelta
+
+from robot.api import ExecutionResult, ResultVisitor
+
+
+DEFAULT_DB = os.environ.get(
+    "BOODMO_RESULTS_DB",
+    os.path.join(os.path.expanduser("~"), ".boodmo", "results.db"),
+)
+
+TC_TAG = re.compile(r"^(TC|API)_\d+$")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id          INTEGER PRIMARY KEY,
+    build       TEXT NOT NULL,
+    environment TEXT NOT NULL,
+    browser     TEXT NOT NULL,
+    source      TEXT NOT NULL,
+    started     TEXT NOT NULL,
+    ingested    TEXT NOT NULL,
+    UNIQUE (build, environment, browser, source)
+);
+CREATE TABLE IF NOT EXISTS test_names (
+    id          INTEGER PRIMARY KEY,
+    name        TEXT NOT NULL,
+    full_name   TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS tests (
+    id          INTEGER PRIMARY KEY,
+    run_id      INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    name_id     INTEGER NOT NULL REFERENCES test_names(id),
+    status      TEXT NOT NULL,
+    duration    REAL NOT NULL,
+    tags        TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS test_tcs (
+    test_id     INTEGER NOT NULL REFERENCES tests(id) ON DELETE CASCADE,
+    tc_id       TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS keywords (
+    test_id     INTEGER NOT NULL REFERENCES tests(id) ON DELETE CASCADE,
+    name        TEXT NOT NULL,
+    calls       INTEGER NOT NULL,
+    duration    REAL NOT NULL
+);
+-- Covering indexes: trend queries are answered from the indexes alone
+CREATE INDEX IF NOT EXISTS idx_runs_started ON runs(started, id, environment, browser);
+CREATE INDEX IF NOT EXISTS idx_tests_run ON tests(run_id, name_id, status, duration);
+CREATE INDEX IF NOT EXISTS idx_tests_name ON tests(name_id, run_id, status, duration);
+CREATE INDEX IF NOT EXISTS idx_test_tcs_test ON test_tcs(test_id, tc_id);
+CREATE INDEX IF NOT EXISTS idx_keywords_test ON keywords(test_id);
+"""
+
+
+def connect(db_path):
+    """Open (and if needed create) the results database."""
+    os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+# ============================================================
+# INGESTION
+# ============================================================
+
+class _TestCollector(ResultVisitor):
+    """Collects test results and per-test keyword timings from a result model."""
+
+    def __init__(self):
+        self.tests = []
+        self._current = None
+
+    def start_test(self, test):
+        self._current = {
+            "name": test.name,
+            "full_name": test.full_name,
+            "status": test.status,
+            "duration": test.elapsed_time.total_seconds(),
+            "tags": list(test.tags),
+            "keywords": {},
+        }
+
+    def end_test(self, test):
+        self.tests.append(self._current)
+        self._current = None
+
+    def start_keyword(self, keyword):
+        if self._current is not None:
+            name = keyword.full_name
+            calls, total = self._current["keywords"].get(name, (0, 0.0))
+            self._current["keywords"][name] = (calls + 1, total + keyword.elapsed_time.total_seconds())
+
+
+def ingest(conn, output_xml, build, environment, browser):
+    """Store one output.xml; re-ingesting the same build/source replaces it."""
+    result = ExecutionResult(output_xml)
+    collector = _TestCollector()
+    result.visit(collector)
+
+    source = os.path.abspath(output_xml)
+    started = result.suite.start_time or datetime.fromtimestamp(os.path.getmtime(output_xml))
+    with conn:
+        conn.execute("DELETE FROM runs WHERE build=? AND environment=? AND browser=? AND source=?",
+                     (build, environment, browser, source))
+        run_id = conn.execute(
+            "INSERT INTO runs (build, environment, browser, source, started, ingested) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (build, environment, browser, source, started.isoformat(sep=" "),
+             datetime.now().isoformat(sep=" ", timespec="seconds")),
+        ).lastrowid
+        for test in collector.tests:
+            conn.execute("INSERT OR IGNORE INTO test_names (name, full_name) VALUES (?, ?)",
+                         (test["name"], test["full_name"]))
+            name_id = conn.execute("SELECT id FROM test_names WHERE full_name = ?",
+                                   (test["full_name"],)).fetchone()[0]
+            test_id = conn.execute(
+                "INSERT INTO tests (run_id, name_id, status, duration, tags) VALUES (?, ?, ?, ?, ?)",
+                (run_id, name_id, test["status"], test["duration"], ", ".join(test["tags"])),
+            ).lastrowid
+            conn.executemany("INSERT INTO test_tcs (test_id, tc_id) VALUES (?, ?)",
+                             [(test_id, tag) for tag in test["tags"] if TC_TAG.match(tag)])
+            conn.executemany("INSERT INTO keywords (test_id, name, calls, duration) VALUES (?, ?, ?, ?)",
+                             [(test_id, name, calls, total)
+                              for name, (calls, total) in test["keywords"].items()])
+    return run_id, len(collector.tests)
+
+
+# ============================================================
+# QUERIES
+# ============================================================
+
+def _since(days):
+    return (datetime.now() - timedelta(days=days)).isoformat(sep=" ")
+
+
+def _run_filter(args):
+    """SQL fragment + params restricting runs by date/environment/browser."""
+    clauses, params = ["r.started >= ?"], [_since(args.days)]
+    if args.environment:
+        clauses.append("r.environment = ?")
+        params.append(args.environment)
+    if args.browser:
+        clauses.append("r.browser = ?")
+        params.append(args.browser)
+    return " AND ".join(clauses), params
+
+
+def query_slowest(conn, args):
+    where, params = _run_filter(args)
+    return conn.execute(f"""
+        SELECT n.full_name, s.runs, s.avg_s, s.max_s
+        FROM (
+            SELECT t.name_id, COUNT(*) AS runs, ROUND(AVG(t.duration), 2) AS avg_s,
+                   ROUND(MAX(t.duration), 2) AS max_s
+            FROM runs r JOIN tests t ON t.run_id = r.id
+            WHERE {where}
+            GROUP BY t.name_id
+            ORDER BY avg_s DESC
+            LIMIT ?
+        ) s JOIN test_names n ON n.id = s.name_id
+        ORDER BY s.avg_s DESC""", params + [args.limit]).fetchall()
+
+
+def query_regressions(conn, args):
+    """Durations in the latest run vs. each test's average over the earlier runs in the window."""
+    where, params = _run_filter(args)
+    return conn.execute(f"""
+        WITH scoped AS (SELECT r.id, r.started FROM runs r WHERE {where}),
+        latest_run AS (SELECT id FROM scoped ORDER BY started DESC LIMIT 1),
+        latest AS (
+            SELECT t.name_id, t.duration FROM tests t
+            WHERE t.run_id = (SELECT id FROM latest_run) AND t.status = 'PASS'
+        ),
+        baseline AS (
+            SELECT t.name_id, AVG(t.duration) AS avg_s, COUNT(*) AS runs
+            FROM latest l JOIN tests t ON t.name_id = l.name_id
+            WHERE t.status = 'PASS'
+              AND t.run_id IN (SELECT id FROM scoped)
+              AND t.run_id != (SELECT id FROM latest_run)
+            GROUP BY t.name_id
+        )
+        SELECT n.full_name, b.runs, ROUND(b.avg_s, 2), ROUND(l.duration, 2),
+               ROUND((l.duration - b.avg_s) / b.avg_s * 100, 1) AS pct
+        FROM latest l
+        JOIN baseline b ON b.name_id = l.name_id
+        JOIN test_names n ON n.id = l.name_id
+        WHERE b.avg_s > 0 AND l.duration > b.avg_s * (1 + ?)
+        ORDER BY pct DESC""", params + [args.threshold]).fetchall()
+
+
+def query_pass_rate(conn, args):
+    where, params = _run_filter(args)
+    return conn.execute(f"""
+        SELECT c.tc_id, COUNT(*) AS runs,
+               SUM(t.status = 'PASS') AS passed,
+               ROUND(100.0 * SUM(t.status = 'PASS') / COUNT(*), 1) AS pass_pct
+        FROM runs r JOIN tests t ON t.run_id = r.id JOIN test_tcs c ON c.test_id = t.id
+        WHERE {where}
+        GROUP BY c.tc_id
+        ORDER BY pass_pct ASC, c.tc_id""", params).fetchall()
+
+
+def query_keywords(conn, args):
+    where, params = _run_filter(args)
+    return conn.execute(f"""
+        SELECT k.name, SUM(k.calls) AS calls, ROUND(AVG(k.duration), 3) AS avg_s_per_run
+        FROM test_names n
+        JOIN tests t ON t.name_id = n.id
+        JOIN runs r ON r.id = t.run_id
+        JOIN keywords k ON k.test_id = t.id
+        WHERE {where} AND (n.name = ? OR n.full_name = ?)
+        GROUP BY k.name
+        ORDER BY avg_s_per_run DESC
+        LIMIT ?""", params + [args.test, args.test, args.limit]).fetchall()
+
+
+def test_history(conn, days=30):
+    """Per-test history keyed by "<suite name>.<test name>", so results
+    match however the suites were started (robot tests/, one file, merged):
+    {key: (runs, failures, average duration in seconds)}."""
+    rows = conn.execute("""
+        SELECT n.name, n.full_name, COUNT(*), SUM(t.status = 'FAIL'), AVG(t.duration)
+        FROM runs r JOIN tests t ON t.run_id = r.id JOIN test_names n ON n.id = t.name_id
+        WHERE r.started >= ? AND t.status != 'SKIP'
+        GROUP BY t.name_id""", [_since(days)]).fetchall()
+    history = {}
+    for name, full_name, runs, failures, duration in rows:
+        suite = full_name[:-len(name) - 1].rsplit(".", 1)[-1]
+        key = f"{suite}.{name}"
+        if key in history:
+            # Same test stored under several top-level names: combine
+            old_runs, old_failures, old_duration = history[key]
+            duration = (old_duration * old_runs + duration * runs) / (old_runs + runs)
+            runs, failures = old_runs + runs, old_failures + failures
+        history[key] = (runs, failures, duration)
+    return history
+
+
+QUERIES = {
+    "slowest": (query_slowest, ["Test", "Runs", "Avg (s)", "Max (s)"]),
+    "regressions": (query_regressions, ["Test", "Baseline runs", "Baseline (s)", "Latest (s)", "+%"]),
+    "pass-rate": (query_pass_rate, ["TC_ID", "Runs", "Passed", "Pass %"]),
+    "keywords": (query_keywords, ["Keyword", "Calls", "Avg (s) per run"]),
+}
+
+
+def print_table(headers, rows):
+    widths = [max(len(str(v)) for v in column) for column in zip(headers, *rows)] if rows \
+        else [len(h) for h in headers]
+    print("  ".join(str(h).ljust(w) for h, w in zip(headers, widths)))
+    print("  ".join("-" * w for w in widths))
+    for row in rows:
+        print("  ".join(str(v).ljust(w) for v, w in zip(row, widths)))
+
+
+# ============================================================
+# COMMAND LINE
+# ============================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Robot Framework results trend store.")
+    parser.add_argument("--db", default=DEFAULT_DB, help=f"SQLite database (default: {DEFAULT_DB})")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    ingest_cmd = commands.add_parser("ingest", help="Store one or more output.xml files")
+    ingest_cmd.add_argument("outputs", nargs="+", help="Robot output.xml file(s)")
+    ingest_cmd.add_argument("--build", default=os.environ.get("BUILD_NUMBER", "local"))
+    ingest_cmd.add_argument("--environment", default=os.environ.get("ENVIRONMENT", "unknown"))
+    ingest_cmd.add_argument("--browser", default=os.environ.get("BROWSER", "unknown"))
+
+    for name in QUERIES:
+        query = commands.add_parser(name)
+        if name == "keywords":
+            query.add_argument("test", help="Test name or full name")
+        query.add_argument("--days", type=int, default=30, help="Look-back window (default: 30)")
+        query.add_argument("--environment", help="Only runs of this environment")
+        query.add_argument("--browser", help="Only runs with this browser")
+        if name in ("slowest", "keywords"):
+            query.add_argument("--limit", type=int, default=20)
+        if name == "regressions":
+            query.add_argument("--threshold", type=float, default=0.2,
+                               help="Relative slowdown to report (default: 0.2 = 20%%)")
+
+    args = parser.parse_args(argv)
+    conn = connect(args.db)
+
+    if args.command == "ingest":
+        for output in args.outputs:
+            run_id, count = ingest(conn, output, args.build, args.environment, args.browser)
+            print(f"Ingested {output}: run {run_id}, {count} test(s)")
+        return 0
+
+    func, headers = QUERIES[args.command]
+    start = time.perf_counter()
+    rows = func(conn, args)
+    print_table(headers, rows)
+    print(f"\n{len(rows)} row(s) in {(time.perf_counter() - start) * 1000:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
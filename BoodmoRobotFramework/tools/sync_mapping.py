@@ -0,0 +1,341 @@
+"""
+sync_mapping.py — Sync mapping/testcase_mapping.csv from Assignment 1.xlsx
+==========================================================================
+``Assignment 1.xlsx`` (sheet "Testcases") is the source of truth for
+TC_001–TC_180. This tool reads it with openpyxl in read-only streaming mode,
+row by row, and diffs it against the mapping CSV by TC_ID:
+
+    - Scenario_ID and Test_Case_Title are taken from the sheet. Only rows
+      that changed are rewritten; every other line of the CSV is kept
+      byte-for-byte, and the file is not touched when nothing changed.
+    - Robot_File, Robot_Test_Name, Module, Type and Tags belong to the
+      automation side and are never overwritten.
+    - Tests whose ``[Tags]`` in the .robot files disagree with the sheet
+      (missing TC_ID, Scenario_ID or Priority tag) are flagged.
+
+The sheet may repeat its header row and contains "MODULE: ..." section
+rows; columns are located by header name, not by position.
+
+Incremental: after a clean sync the sha256 of the workbook and the CSV are
+cached (~/.boodmo/sync_mapping.json, with the sheet data of the mapped
+cases). While neither file changes, later runs skip the workbook entirely
+and only re-check the .robot tags.
+
+Usage:
+    python tools/sync_mapping.py                      # sync and report
+    python tools/sync_mapping.py --dry-run            # report only
+    python tools/sync_mapping.py --check              # CI: exit 1 on any diff or tag mismatch
+    python tools/sync_mapping.py --benchmark 100000   # synthetic 100k-row workbook
+"""
+
+import argparse
+import csv
+import hashlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+
+from openpyxl import Workbook, load_workbook
+from robot.api import TestSuite
+
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_WORKBOOK = os.path.join(os.path.dirname(PROJECT_DIR), "Assignment 1.xlsx")
+DEFAULT_MAPPING = os.path.join(PROJECT_DIR, "mapping", "testcase_mapping.csv")
+DEFAULT_SHEET = "Testcases"
+DEFAULT_STATE = os.path.join(os.path.expanduser("~"), ".boodmo", "sync_mapping.json")
+
+# CSV column -> workbook header
+SYNCED_FIELDS = {"Scenario_ID": "Scenario ID", "Test_Case_Title": "Test Case Title"}
+SHEET_HEADERS = ("TC ID", "Scenario ID", "Test Case Title", "Priority")
+
+
+# ============================================================
+# READING
+# ============================================================
+
+def read_workbook(path, sheet=DEFAULT_SHEET):
+    """{TC_ID: {header: value}} from the sheet, streamed in read-only mode."""
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        cases = {}
+        columns = None
+        for row in workbook[sheet].iter_rows(values_only=True):
+            first = str(row[0]).strip() if row and row[0] is not None else ""
+            if first == "TC ID":
+                columns = {str(h).strip(): i for i, h in enumerate(row) if h is not None}
+                missing = [h for h in SHEET_HEADERS if h not in columns]
+                if missing:
+                    raise ValueError(f"Sheet '{sheet}' header is missing column(s): {', '.join(missing)}")
+            elif columns and first.startswith("TC_"):
+                cases[first] = {h: _cell(row, columns[h]) for h in SHEET_HEADERS[1:]}
+        return cases
+    finally:
+        workbook.close()
+
+
+def _cell(row, index):
+    value = row[index] if index < len(row) else None
+    return " ".join(str(value).split()) if value is not None else ""
+
+
+def read_mapping(path):
+    """(header, [(raw line, row dict)]) keeping each original line for rewriting."""
+    with open(path, newline="", encoding="utf-8") as handle:
+        lines = handle.read().splitlines(keepends=True)
+    header = next(csv.reader([lines[0]]))
+    rows = [(line, dict(zip(header, next(csv.reader([line])))))
+            for line in lines[1:] if line.strip()]
+    return header, rows
+
+
+def read_robot_tags(robot_files):
+    """{(robot file, test name): set of tags} for the given .robot files."""
+    tags = {}
+    for robot_file in sorted(robot_files):
+        path = os.path.join(PROJECT_DIR, robot_file)
+        if not os.path.isfile(path):
+            continue
+        for test in TestSuite.from_file_system(path).all_tests:
+            tags[(robot_file, test.name)] = {str(tag) for tag in test.tags}
+    return tags
+
+
+# ============================================================
+# SYNC
+# ============================================================
+
+def diff(cases, rows):
+    """[(row index, {field: (old, new)})] for mapping rows that differ from the sheet."""
+    changes = []
+    for index, (_, row) in enumerate(rows):
+        case = cases.get(row["TC_ID"])
+        if case is None:
+            continue
+        changed = {field: (row[field], case[header]) for field, header in SYNCED_FIELDS.items()
+                   if case[header] and row[field] != case[header]}
+        if changed:
+            changes.append((index, changed))
+    return changes
+
+
+def tag_mismatches(cases, rows, robot_tags):
+    """[(TC_ID, robot test, missing tags, tags of a different priority)]."""
+    mismatches = []
+    for _, row in rows:
+        case = cases.get(row["TC_ID"])
+        tags = robot_tags.get((row["Robot_File"], row["Robot_Test_Name"]))
+        if case is None or tags is None:
+            continue
+        expected = {row["TC_ID"], case["Scenario ID"], case["Priority"]} - {""}
+        missing = sorted(expected - tags)
+        other_priority = sorted(t for t in tags if t in ("P0", "P1", "P2") and t != case["Priority"])
+        if missing or other_priority:
+            mismatches.append((row["TC_ID"], row["Robot_Test_Name"], missing, other_priority))
+    return mismatches
+
+
+def write_mapping(path, header, rows, changes):
+    """Rewrite only the changed rows; all other lines are written back as read."""
+    changed = {index: fields for index, fields in changes}
+    newline = "\r\n" if rows and rows[0][0].endswith("\r\n") else "\n"
+    with open(path, encoding="utf-8", newline="") as handle:
+        first_line = handle.readline()
+    out = [first_line]
+    for index, (line, row) in enumerate(rows):
+        if index in changed:
+            updated = dict(row, **{field: new for field, (_, new) in changed[index].items()})
+            buffer = io.StringIO()
+            csv.writer(buffer, lineterminator=newline).writerow([updated[h] for h in header])
+            line = buffer.getvalue()
+        out.append(line)
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8", newline="") as handle:
+        handle.writelines(out)
+    os.replace(tmp, path)
+
+
+def _sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _load_state(state_file, workbook, mapping, sheet):
+    """Cached sheet data of the last clean sync, if workbook and CSV are unchanged."""
+    try:
+        with open(state_file, encoding="utf-8") as handle:
+            state = json.load(handle).get(os.path.abspath(mapping))
+    except (OSError, ValueError):
+        return None
+    if state and state["sheet"] == sheet and state["workbook_sha256"] == _sha256(workbook) \
+            and state["mapping_sha256"] == _sha256(mapping):
+        return state
+    return None
+
+
+def _save_state(state_file, workbook, mapping, sheet, cases, rows):
+    try:
+        with open(state_file, encoding="utf-8") as handle:
+            states = json.load(handle)
+    except (OSError, ValueError):
+        states = {}
+    mapped = {row["TC_ID"] for _, row in rows}
+    states[os.path.abspath(mapping)] = {
+        "sheet": sheet,
+        "workbook_sha256": _sha256(workbook),
+        "mapping_sha256": _sha256(mapping),
+        "total_cases": len(cases),
+        # Only what the tag check needs on the next run
+        "cases": {tc: case for tc, case in cases.items() if tc in mapped},
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(state_file)), exist_ok=True)
+    with open(state_file, "w", encoding="utf-8") as handle:
+        json.dump(states, handle)
+
+
+def sync(workbook, mapping, sheet=DEFAULT_SHEET, dry_run=False, check_tags=True, state_file=None):
+    """Returns (number of cases in the sheet, cases, rows, changes, mismatches, timings).
+
+    With ``state_file``, a run whose workbook and CSV are byte-identical to
+    the last clean sync skips reading the workbook altogether.
+    """
+    timings = {}
+    start = time.perf_counter()
+    state = _load_state(state_file, workbook, mapping, sheet) if state_file else None
+    if state:
+        cases, total = state["cases"], state["total_cases"]
+        timings["cached sheet"] = time.perf_counter() - start
+    else:
+        cases = read_workbook(workbook, sheet)
+        total = len(cases)
+        timings["read workbook"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    header, rows = read_mapping(mapping)
+    changes = diff(cases, rows)
+    timings["diff"] = time.perf_counter() - start
+
+    mismatches = []
+    if check_tags:
+        start = time.perf_counter()
+        robot_tags = read_robot_tags({row["Robot_File"] for _, row in rows})
+        mismatches = tag_mismatches(cases, rows, robot_tags)
+        timings["tag check"] = time.perf_counter() - start
+
+    if changes and not dry_run:
+        start = time.perf_counter()
+        write_mapping(mapping, header, rows, changes)
+        timings["write"] = time.perf_counter() - start
+    if state_file and not state and (not changes or not dry_run):
+        _save_state(state_file, workbook, mapping, sheet, cases, rows)
+    return total, cases, rows, changes, mismatches, timings
+
+
+# ============================================================
+# BENCHMARK
+# ============================================================
+
+def make_synthetic_workbook(path, count):
+    """Workbook shaped like Assignment 1.xlsx with ``count`` test case rows."""
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(DEFAULT_SHEET)
+    header = ["TC ID", "Scenario ID", "Test Case Title", "Steps to Execute",
+              "Expected Result", "Actual Result", "Status", "Priority", "Test Case Type"]
+    for i in range(1, count + 1):
+        if i % 1000 == 1:
+            sheet.append([f"MODULE: SYNTHETIC {i // 1000}"])
+            sheet.append(header)
+        sheet.append([f"TC_{i:06d}", f"TS_{i // 10:05d}", f"Synthetic test case {i}",
+                      "1. Open page. 2. Do something", "It works", None, None,
+                      f"P{i % 3}", "Functional"])
+    workbook.save(path)
+
+
+def make_synthetic_mapping(path, count, stale_every=10):
+    """Mapping CSV for every 2nd case; every ``stale_every``-th mapped row has an old title."""
+    with open(path, "w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle, lineterminator="\n")
+        writer.writerow(["TC_ID", "Scenario_ID", "Test_Case_Title", "Module", "Robot_File",
+                         "Robot_Test_Name", "Type", "Tags"])
+        for n, i in enumerate(range(1, count + 1, 2)):
+            title = f"Old title {i}" if n % stale_every == 0 else f"Synthetic test case {i}"
+            writer.writerow([f"TC_{i:06d}", f"TS_{i // 10:05d}", title, "Synthetic",
+                             "tests/ui/synthetic.robot", f"Synthetic {i}", "UI",
+                             f"TC_{i:06d}, TS_{i // 10:05d}, P{i % 3}"])
+
+
+def benchmark(count):
+    with tempfile.TemporaryDirectory() as tmp:
+        workbook, mapping = os.path.join(tmp, "synthetic.xlsx"), os.path.join(tmp, "mapping.csv")
+        start = time.perf_counter()
+        make_synthetic_workbook(workbook, count)
+        make_synthetic_mapping(mapping, count)
+        print(f"Generated {count} workbook rows + {count // 2} mapping rows "
+              f"in {time.perf_counter() - start:.1f}s ({os.path.getsize(workbook) / 1e6:.1f} MB xlsx)")
+
+        state = os.path.join(tmp, "state.json")
+        for label in ("First run", "Unchanged re-run"):
+            total, _, rows, changes, _, timings = sync(workbook, mapping, check_tags=False,
+                                                       state_file=state)
+            seconds = sum(timings.values())
+            print(f"{label}: {total} cases / {len(rows)} mapping rows, {len(changes)} changed, "
+                  f"in {seconds:.2f}s ({total / seconds:,.0f} rows/s)")
+            for step, took in timings.items():
+                print(f"  {step:14} {took * 1000:9.0f} ms")
+
+
+# ============================================================
+# COMMAND LINE
+# ============================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sync the mapping CSV from Assignment 1.xlsx.")
+    parser.add_argument("--workbook", default=DEFAULT_WORKBOOK)
+    parser.add_argument("--sheet", default=DEFAULT_SHEET)
+    parser.add_argument("--mapping", default=DEFAULT_MAPPING)
+    parser.add_argument("--dry-run", action="store_true", help="Report differences, write nothing")
+    parser.add_argument("--check", action="store_true",
+                        help="Like --dry-run, exit 1 on differences or tag mismatches")
+    parser.add_argument("--state", default=DEFAULT_STATE,
+                        help=f"Cache of the last clean sync (default: {DEFAULT_STATE})")
+    parser.add_argument("--force", action="store_true", help="Ignore the cache, re-read the workbook")
+    parser.add_argument("--benchmark", type=int, metavar="ROWS",
+                        help="Run against a synthetic workbook with ROWS test cases")
+    args = parser.parse_args(argv)
+
+    if args.benchmark:
+        benchmark(args.benchmark)
+        return 0
+
+    dry_run = args.dry_run or args.check
+    total, cases, rows, changes, mismatches, timings = sync(
+        args.workbook, args.mapping, args.sheet, dry_run,
+        state_file=None if args.force else args.state)
+
+    for index, fields in changes:
+        row = rows[index][1]
+        for field, (old, new) in fields.items():
+            print(f"{row['TC_ID']} ({row['Robot_Test_Name']}): {field}: {old!r} -> {new!r}")
+    for tc_id, test, missing, other_priority in mismatches:
+        problems = []
+        if missing:
+            problems.append(f"missing {', '.join(missing)}")
+        if other_priority:
+            problems.append(f"unexpected {', '.join(other_priority)}")
+        print(f"TAGS {tc_id} ({test}): {'; '.join(problems)}")
+
+    mapped = {row["TC_ID"] for _, row in rows}
+    print(f"\n{total} test cases in sheet, {len(cases.keys() & mapped)} mapped, "
+          f"{len(changes)} row(s) {'to update' if dry_run else 'updated'}, "
+          f"{len(mismatches)} tag mismatch(es) in {sum(timings.values()):.2f}s")
+    return 1 if args.check and (changes or mismatches) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
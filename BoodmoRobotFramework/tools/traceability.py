@@ -0,0 +1,187 @@
+"""
+traceability.py — Test case coverage index: mapping CSV joined with results
+============================================================================
+Joins mapping/testcase_mapping.csv with an output.xml and reports, per
+Assignment 1 TC_ID and per TS_ID (scenario):
+
+    status     PASS / FAIL / SKIP / PARTIAL (some mapped tests not run) / NOT RUN
+    duration   summed over the mapped tests
+    gaps       mapped but not executed, executed but not mapped
+
+The mapping is indexed by (robot file, test name) in memory, and output.xml
+is read in one streaming pass (iterparse). Each test element is cleared as
+soon as its status is read, so even large merged outputs stay cheap. This
+makes it fast enough to run after every build.
+
+Usage:
+    python tools/traceability.py results/merged/output.xml
+    python tools/traceability.py results/merged/output.xml --json results/merged/traceability.json
+    python tools/traceability.py output.xml --fail-on-gaps
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from datetime import datetime
+
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_MAPPING = os.path.join(PROJECT_DIR, "mapping", "testcase_mapping.csv")
+
+NOT_RUN = "NOT RUN"
+
+
+def test_key(robot_file, test_name):
+    """Join key: suite file name + test name (file names are unique in tests/)."""
+    return os.path.basename(robot_file.replace("\\", "/")).lower(), " ".join(test_name.split()).lower()
+
+
+# ============================================================
+# INDEX
+# ============================================================
+
+def load_mapping(path):
+    """Mapping rows, indexed by join key."""
+    with open(path, newline="", encoding="utf-8") as handle:
+        rows = list(csv.DictReader(handle))
+    return rows, {test_key(row["Robot_File"], row["Robot_Test_Name"]): row for row in rows}
+
+
+def _elapsed(status):
+    if status.get("elapsed") is not None:
+        return float(status.get("elapsed"))
+    # output.xml written by Robot Framework < 7
+    start, end = status.get("starttime"), status.get("endtime")
+    if start and end and "N/A" not in (start, end):
+        fmt = "%Y%m%d %H:%M:%S.%f"
+        return (datetime.strptime(end, fmt) - datetime.strptime(start, fmt)).total_seconds()
+    return 0.0
+
+
+def iter_results(output_xml):
+    """Yield (source, test name, status, seconds) for every test, streaming."""
+    sources = []
+    for event, elem in ET.iterparse(output_xml, events=("start", "end")):
+        if elem.tag == "suite":
+            if event == "start":
+                sources.append(elem.get("source", ""))
+            else:
+                sources.pop()
+                elem.clear()
+        elif elem.tag == "test" and event == "end":
+            status = elem.find("status")
+            yield sources[-1], elem.get("name"), status.get("status"), _elapsed(status)
+            elem.clear()
+
+
+def build_index(mapping_path, output_xml):
+    rows, by_key = load_mapping(mapping_path)
+    executed = {}
+    unmapped = []
+    for source, name, status, seconds in iter_results(output_xml):
+        key = test_key(source, name)
+        if key in by_key:
+            # A test repeated in the output (e.g. merged re-run) keeps its last result
+            executed[key] = (status, seconds)
+        else:
+            unmapped.append({"robot_file": os.path.relpath(source, PROJECT_DIR) if source else "",
+                             "test": name, "status": status})
+
+    by_tc, by_ts, not_executed = OrderedDict(), OrderedDict(), []
+    for row in rows:
+        key = test_key(row["Robot_File"], row["Robot_Test_Name"])
+        status, seconds = executed.get(key, (NOT_RUN, 0.0))
+        if status == NOT_RUN:
+            not_executed.append({"tc_id": row["TC_ID"], "robot_file": row["Robot_File"],
+                                 "test": row["Robot_Test_Name"]})
+        for group, ident in ((by_tc, row["TC_ID"]), (by_ts, row["Scenario_ID"])):
+            entry = group.setdefault(ident, {"id": ident, "tests": 0, "statuses": [], "duration": 0.0})
+            entry["tests"] += 1
+            entry["statuses"].append(status)
+            entry["duration"] += seconds
+
+    for group in (by_tc, by_ts):
+        for entry in group.values():
+            entry["status"] = combined_status(entry.pop("statuses"))
+            entry["duration"] = round(entry["duration"], 3)
+    return {
+        "tc": list(by_tc.values()),
+        "ts": list(by_ts.values()),
+        "mapped_not_executed": not_executed,
+        "executed_unmapped": unmapped,
+    }
+
+
+def combined_status(statuses):
+    if "FAIL" in statuses:
+        return "FAIL"
+    if NOT_RUN in statuses:
+        return NOT_RUN if all(s == NOT_RUN for s in statuses) else "PARTIAL"
+    if "SKIP" in statuses:
+        return "SKIP"
+    return "PASS"
+
+
+# ============================================================
+# REPORT
+# ============================================================
+
+def print_table(title, headers, rows):
+    print(f"\n{title}")
+    if not rows:
+        print("  (none)")
+        return
+    widths = [max(len(str(v)) for v in column) for column in zip(headers, *rows)]
+    print("  " + "  ".join(str(h).ljust(w) for h, w in zip(headers, widths)))
+    for row in rows:
+        print("  " + "  ".join(str(v).ljust(w) for v, w in zip(row, widths)))
+
+
+def summary(entries):
+    counts = {}
+    for entry in entries:
+        counts[entry["status"]] = counts.get(entry["status"], 0) + 1
+    return ", ".join(f"{count} {status}" for status, count in sorted(counts.items()))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Join the test case mapping with execution results.")
+    parser.add_argument("output", help="Robot output.xml (e.g. results/merged/output.xml)")
+    parser.add_argument("--mapping", default=DEFAULT_MAPPING, help="Mapping CSV")
+    parser.add_argument("--json", help="Also write the full index to this JSON file")
+    parser.add_argument("--fail-on-gaps", action="store_true",
+                        help="Exit with 1 when any mapped test was not executed or a test is unmapped")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    index = build_index(args.mapping, args.output)
+    took = (time.perf_counter() - start) * 1000
+
+    print_table("By TC_ID", ["TC_ID", "Tests", "Status", "Duration (s)"],
+                [(e["id"], e["tests"], e["status"], e["duration"]) for e in index["tc"]])
+    print_table("By TS_ID", ["TS_ID", "Tests", "Status", "Duration (s)"],
+                [(e["id"], e["tests"], e["status"], e["duration"]) for e in index["ts"]])
+    print_table("Mapped but not executed", ["TC_ID", "Robot file", "Test"],
+                [(g["tc_id"], g["robot_file"], g["test"]) for g in index["mapped_not_executed"]])
+    print_table("Executed but not mapped", ["Robot file", "Test", "Status"],
+                [(g["robot_file"], g["test"], g["status"]) for g in index["executed_unmapped"]])
+    print(f"\nTC_IDs: {summary(index['tc'])}")
+    print(f"TS_IDs: {summary(index['ts'])}")
+    print(f"Indexed in {took:.1f} ms")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as handle:
+            json.dump(index, handle, indent=2)
+        print(f"Index written to {args.json}")
+
+    gaps = index["mapped_not_executed"] or index["executed_unmapped"]
+    return 1 if args.fail_on_gaps and gaps else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -20,6 +20,9 @@ VALID_USERNAME = "prod_testuser@boodmo.com"
 VALID_PASSWORD = "ProdPass@123"
 INVALID_PASSWORD = "WrongPass@000"
 UNREGISTERED_EMAIL = "nonexistent_user_xyz@boodmo.com"
+# Accounts leased by parallel workers (libraries/TestDataFactory.py),
+# "email:password"; add more so each worker gets its own
+TEST_ACCOUNTS = [f"{VALID_USERNAME}:{VALID_PASSWORD}"]
 
 # ---------- Production API Config ----------
 API_AUTH_TOKEN = "prod-bearer-token-placeholder"
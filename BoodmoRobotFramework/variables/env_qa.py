@@ -19,6 +19,9 @@ VALID_USERNAME = "qa_testuser@boodmo.com"
 VALID_PASSWORD = "QAPass@123"
 INVALID_PASSWORD = "WrongPass@000"
 UNREGISTERED_EMAIL = "nonexistent_user_xyz@boodmo.com"
+# Accounts leased by parallel workers (libraries/TestDataFactory.py),
+# "email:password"; add more so each worker gets its own
+TEST_ACCOUNTS = [f"{VALID_USERNAME}:{VALID_PASSWORD}"]
 
 # ---------- QA API Config ----------
 API_AUTH_TOKEN = "qa-bearer-token-placeholder"
@@ -19,6 +19,9 @@ VALID_USERNAME = "staging_testuser@boodmo.com"
 VALID_PASSWORD = "StagingPass@123"
 INVALID_PASSWORD = "WrongPass@000"
 UNREGISTERED_EMAIL = "nonexistent_user_xyz@boodmo.com"
+# Accounts leased by parallel workers (libraries/TestDataFactory.py),
+# "email:password"; add more so each worker gets its own
+TEST_ACCOUNTS = [f"{VALID_USERNAME}:{VALID_PASSWORD}"]
 
 # ---------- Staging API Config ----------
 API_AUTH_TOKEN = "staging-bearer-token-placeholder"